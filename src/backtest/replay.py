@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable
 from decimal import Decimal
 
 import structlog
 
 from src.backtest.sim_client import SimulatedClient
-from src.backtest.types import BacktestConfig, BacktestResult, Scenario
+from src.backtest.types import (
+    BacktestConfig,
+    BacktestResult,
+    HistoricalEvent,
+    Scenario,
+)
 from src.core.types import ExecutionResult, FeedEvent
 from src.monitor.metrics import MetricsCollector
 from src.polymarket.scanner import MarketScanner
@@ -84,9 +90,15 @@ class BacktestEngine:
         """Current risk monitor state."""
         return self._risk_monitor.snapshot()
 
-    async def run(self) -> BacktestResult:
+    async def run(
+        self, events: Iterable[HistoricalEvent] | None = None,
+    ) -> BacktestResult:
         """Replay all events in the scenario and return aggregated results.
 
+        ``events`` replaces ``scenario.events`` when given. It is consumed
+        once, in order, so a generator can stream events that are never
+        held in memory together.
+
         Steps for each event:
         1. Update the simulated client with the event's orderbook snapshot.
         2. Inject scenario opportunities into the scanner.
@@ -99,8 +111,10 @@ class BacktestEngine:
         self._scanner._opportunities = dict(self._scenario.opportunities)
 
         all_results: list[ExecutionResult] = []
+        total_events = 0
 
-        for hist_event in self._scenario.events:
+        for hist_event in self._scenario.events if events is None else events:
+            total_events += 1
             # Update the simulated clock and orderbooks
             ts = hist_event.feed_event.released_at or hist_event.feed_event.received_at
             self._sim_client.set_time(ts)
@@ -130,7 +144,7 @@ class BacktestEngine:
         summary = self._collector.summary()
         return BacktestResult(
             scenario_name=self._scenario.name,
-            total_events=len(self._scenario.events),
+            total_events=total_events,
             total_trades=summary["total_trades"],  # type: ignore[arg-type]
             successful_trades=summary["successful_trades"],  # type: ignore[arg-type]
             failed_trades=summary["failed_trades"],  # type: ignore[arg-type]
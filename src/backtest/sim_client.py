@@ -6,6 +6,7 @@ Supports configurable fill probability and slippage.
 
 from __future__ import annotations
 
+import hashlib
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal
@@ -24,7 +25,7 @@ from src.core.types import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FillRecord:
     """Record of a simulated fill for post-hoc analysis."""
 
@@ -194,89 +195,50 @@ class SimulatedClient:
         order_id = f"sim_{self._order_counter}"
         now = self._time or time.time()
 
-        # Check fill probability (simulate random failures)
+        # Check fill probability (simulate random failures); a zero
+        # probability fails without hashing or walking the book
+        if self._fill_probability <= 0.0:
+            return self._reject(order_id, token_id, side, price, size, now)
         if self._fill_probability < 1.0:
-            import hashlib
             # Deterministic "randomness" from order details for reproducibility
             seed = hashlib.md5(
                 f"{token_id}{side}{price}{size}{self._order_counter}".encode(),
             ).hexdigest()
             if int(seed[:8], 16) / 0xFFFFFFFF > self._fill_probability:
-                self._fills.append(FillRecord(
-                    token_id=token_id,
-                    side=side.value,
-                    requested_price=price,
-                    requested_size=size,
-                    fill_price=Decimal(0),
-                    fill_size=Decimal(0),
-                    success=False,
-                    timestamp=now,
-                ))
-                return OrderResponse(order_id=order_id, success=False, raw={})
+                return self._reject(order_id, token_id, side, price, size, now)
 
         book = self._books.get(token_id)
         if book is None:
-            self._fills.append(FillRecord(
-                token_id=token_id,
-                side=side.value,
-                requested_price=price,
-                requested_size=size,
-                fill_price=Decimal(0),
-                fill_size=Decimal(0),
-                success=False,
-                timestamp=now,
-            ))
-            return OrderResponse(order_id=order_id, success=False, raw={})
-
-        # Walk the book
-        if side == Side.BUY:
-            levels = list(book.asks)  # ascending price
-        else:
-            levels = list(book.bids)  # descending price
+            return self._reject(order_id, token_id, side, price, size, now)
+
+        # Walk the book in place: asks ascending for a BUY, bids
+        # descending for a SELL
+        is_buy = side == Side.BUY
+        levels = book.asks if is_buy else book.bids
 
         filled_size = Decimal(0)
         total_cost = Decimal(0)
+        remaining = size
 
         for level in levels:
-            if side == Side.BUY and level.price > price:
-                break  # can't fill above limit
-            if side == Side.SELL and level.price < price:
-                break  # can't fill below limit
+            level_price = level.price
+            if level_price > price if is_buy else level_price < price:
+                break  # can't fill beyond the limit
 
-            available = level.size
-            take = min(available, size - filled_size)
+            take = remaining if remaining < level.size else level.size
             filled_size += take
-            total_cost += take * level.price
+            total_cost += take * level_price
+            remaining -= take
 
-            if filled_size >= size:
+            if remaining <= 0:
                 break
 
         # FOK: must fill completely
         if order_type == OrderType.FOK and filled_size < size:
-            self._fills.append(FillRecord(
-                token_id=token_id,
-                side=side.value,
-                requested_price=price,
-                requested_size=size,
-                fill_price=Decimal(0),
-                fill_size=Decimal(0),
-                success=False,
-                timestamp=now,
-            ))
-            return OrderResponse(order_id=order_id, success=False, raw={})
+            return self._reject(order_id, token_id, side, price, size, now)
 
         if filled_size <= 0:
-            self._fills.append(FillRecord(
-                token_id=token_id,
-                side=side.value,
-                requested_price=price,
-                requested_size=size,
-                fill_price=Decimal(0),
-                fill_size=Decimal(0),
-                success=False,
-                timestamp=now,
-            ))
-            return OrderResponse(order_id=order_id, success=False, raw={})
+            return self._reject(order_id, token_id, side, price, size, now)
 
         # Calculate average fill price
         avg_fill_price = total_cost / filled_size
@@ -305,3 +267,25 @@ class SimulatedClient:
             success=True,
             raw={"fill_price": str(avg_fill_price), "fill_size": str(filled_size)},
         )
+
+    def _reject(
+        self,
+        order_id: str,
+        token_id: str,
+        side: Side,
+        price: Decimal,
+        size: Decimal,
+        now: float,
+    ) -> OrderResponse:
+        """Record a failed fill and return the unsuccessful response."""
+        self._fills.append(FillRecord(
+            token_id=token_id,
+            side=side.value,
+            requested_price=price,
+            requested_size=size,
+            fill_price=Decimal(0),
+            fill_size=Decimal(0),
+            success=False,
+            timestamp=now,
+        ))
+        return OrderResponse(order_id=order_id, success=False, raw={})
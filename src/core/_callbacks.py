@@ -0,0 +1,15 @@
+"""Helpers for dispatching callbacks that may be sync or async."""
+
+from __future__ import annotations
+
+import asyncio
+from types import CoroutineType
+
+
+async def maybe_await(result: object) -> None:
+    """Await ``result`` if a callback returned a coroutine, else do nothing."""
+    # Exact type probe first; iscoroutine only for exotic awaitables
+    if type(result) is CoroutineType or (
+        result is not None and asyncio.iscoroutine(result)
+    ):
+        await result
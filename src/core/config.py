@@ -64,6 +64,10 @@ class OracleConfig(BaseModel):
         "https://api.thegraph.com/subgraphs/name/umaprotocol/optimistic-oracle-v3-polygon"
     )
     hedge_risk_threshold: float = 0.02
+    # Seconds before HIGH_ORACLE_RISK repeats for the same market and price cent
+    alert_cooldown_secs: float = 300.0
+    # Opt in to sending query hashes instead of text (automatic persisted queries)
+    subgraph_persisted_queries: bool = False
 
 
 class RiskConfig(BaseModel):
@@ -113,6 +117,8 @@ class LoggingConfig(BaseModel):
 
     level: str = "INFO"
     format: str = "json"
+    # Opt in to formatting and writing records on a background thread
+    queued: bool = False
 
 
 class ScannerConfig(BaseModel):
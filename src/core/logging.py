@@ -2,24 +2,67 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from collections.abc import Mapping
 
 import structlog
 
 from src.core.config import get_settings
 
+_listener: logging.handlers.QueueListener | None = None
 
-def setup_logging(level: str | None = None, fmt: str | None = None) -> None:
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The default ``prepare`` formats the record on the calling thread, which
+    would both defeat the queue and flatten structlog's event dict. Instead
+    the event dict and args are snapshotted, so a caller mutating them after
+    the log call cannot change what the listener renders.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if isinstance(record.msg, dict):
+            record.msg = dict(record.msg)
+        args = record.args
+        if isinstance(args, Mapping):
+            record.args = dict(args)
+        elif args:
+            record.args = tuple(args)
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging(
+    level: str | None = None,
+    fmt: str | None = None,
+    queued: bool | None = None,
+) -> None:
     """Configure structlog with JSON or console renderer.
 
     Args:
         level: Log level override (e.g. "DEBUG"). Uses config if None.
         fmt: Renderer format override ("json" or "console"). Uses config if None.
+        queued: Hand records to a background thread for rendering and
+            writing, so the event loop never blocks on the sink. Uses
+            config if None.
     """
+    global _listener
     settings = get_settings()
     log_level = getattr(logging, (level or settings.logging.level).upper(), logging.INFO)
     log_format = fmt or settings.logging.format
+    use_queue = settings.logging.queued if queued is None else queued
 
     shared_processors: list[structlog.types.Processor] = [
         structlog.contextvars.merge_contextvars,
@@ -54,7 +97,17 @@ def setup_logging(level: str | None = None, fmt: str | None = None) -> None:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(formatter)
 
+    _stop_listener()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    if use_queue:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(_PassthroughQueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, handler)
+        _listener.start()
+    else:
+        root_logger.addHandler(handler)
     root_logger.setLevel(log_level)
+
+
+atexit.register(_stop_listener)
@@ -529,7 +529,11 @@ class OracleAlert(BaseModel):
 
 
 class OracleRiskAssessment(BaseModel):
-    """Oracle risk assessment for a held position."""
+    """Oracle risk assessment for a held position.
+
+    Frozen: assessments are point-in-time values, and freezing makes them
+    hashable.
+    """
 
     token_id: str
     condition_id: str = ""
@@ -541,6 +545,8 @@ class OracleRiskAssessment(BaseModel):
     has_active_dispute: bool = False
     recommendation: str = ""
 
+    model_config = {"frozen": True}
+
 
 class Position(BaseModel):
     """An open position tracked by the risk system."""
@@ -555,12 +561,18 @@ class Position(BaseModel):
 
 
 class RiskVerdict(BaseModel):
-    """Result of a risk gate check."""
+    """Result of a risk gate check.
+
+    Frozen so the shared approved verdict can be returned from every
+    passing gate without risk of a caller mutating it.
+    """
 
     approved: bool = True
     reason: RiskRejectionReason | None = None
     detail: str = ""
 
+    model_config = {"frozen": True}
+
 
 class RiskEvent(BaseModel):
     """Event emitted by the risk monitor."""
@@ -10,6 +10,7 @@ from types import TracebackType
 
 import structlog
 
+from src.core._callbacks import maybe_await
 from src.core.types import FeedEvent, FeedEventType, FeedType
 
 logger = structlog.stdlib.get_logger()
@@ -65,9 +66,7 @@ class BaseFeed(abc.ABC):
         """Dispatch a feed event to all registered callbacks."""
         for cb in self._callbacks:
             try:
-                result = cb(event)
-                if asyncio.iscoroutine(result):
-                    await result
+                await maybe_await(cb(event))
             except Exception:
                 logger.exception(
                     "feed_event_callback_error",
@@ -10,6 +10,7 @@ from decimal import Decimal
 
 import structlog
 
+from src.core._callbacks import maybe_await
 from src.core.config import ScannerConfig, get_settings
 from src.core.types import (
     LiquidityScreen,
@@ -263,9 +264,7 @@ class MarketScanner:
         """Dispatch a scan event to all registered callbacks."""
         for cb in self._callbacks:
             try:
-                result = cb(event)
-                if asyncio.iscoroutine(result):
-                    await result
+                await maybe_await(cb(event))
             except Exception:
                 logger.exception("scan_event_callback_error", event_type=event.event_type)
 
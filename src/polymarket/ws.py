@@ -13,6 +13,7 @@ import structlog
 import websockets
 from websockets.asyncio.client import ClientConnection
 
+from src.core._callbacks import maybe_await
 from src.core.types import OrderBook, PriceLevel
 from src.polymarket.exceptions import ClobWebSocketError
 
@@ -176,6 +177,4 @@ class OrderBookSubscription:
             event_type = event.get("event_type", "")
             if event_type == "book":
                 book = _parse_book_message(self.token_id, event)
-                result = self.callback(book)
-                if asyncio.iscoroutine(result):
-                    await result
+                await maybe_await(self.callback(book))
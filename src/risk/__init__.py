@@ -22,7 +22,11 @@ from src.risk.gates import (
 from src.risk.kill_switch import KillSwitchManager
 from src.risk.market_quality import MarketQualityFilter
 from src.risk.monitor import RiskEventCallback, RiskMonitor
-from src.risk.oracle_monitor import OracleAlertCallback, OracleMonitor
+from src.risk.oracle_monitor import (
+    OracleAlertBatchCallback,
+    OracleAlertCallback,
+    OracleMonitor,
+)
 from src.risk.pnl import PnLTracker
 from src.risk.positions import PositionTracker
 
@@ -30,6 +34,7 @@ __all__ = [
     "KillSwitchActiveError",
     "KillSwitchManager",
     "MarketQualityFilter",
+    "OracleAlertBatchCallback",
     "OracleAlertCallback",
     "OracleMonitor",
     "OracleRiskError",
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from decimal import Decimal
+from functools import lru_cache
 
 from src.core.config import KillSwitchConfig, RiskConfig
 from src.core.types import (
@@ -16,6 +18,25 @@ from src.core.types import (
 )
 from src.risk.pnl import PnLTracker
 
+# Shared verdict returned by every passing gate (RiskVerdict is frozen)
+APPROVED = RiskVerdict(approved=True)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _config_decimal(value: float) -> Decimal:
+    """Convert a float config threshold to Decimal.
+
+    Limits are fixed for a given RiskConfig, so the str → Decimal
+    round-trip is memoized instead of repeated on every gate call.
+    """
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _bankroll_fraction(bankroll_usd: float, pct: float) -> Decimal:
+    """Bankroll × percentage limit as a Decimal (memoized)."""
+    return _config_decimal(bankroll_usd) * _config_decimal(pct)
+
 
 def check_kill_switch(killed: bool) -> RiskVerdict:
     """Reject if the kill switch is active."""
@@ -25,7 +46,7 @@ def check_kill_switch(killed: bool) -> RiskVerdict:
             reason=RiskRejectionReason.KILL_SWITCH_ACTIVE,
             detail="Kill switch is active — all trading halted",
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_oracle_risk(
@@ -41,13 +62,13 @@ def check_oracle_risk(
                 reason=RiskRejectionReason.ORACLE_RISK,
                 detail=f"Market question matches blacklist pattern: '{pattern}'",
             )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_daily_loss(pnl: PnLTracker, config: RiskConfig) -> RiskVerdict:
     """Reject if daily realized loss exceeds limit."""
     pnl._maybe_reset_day()
-    limit = Decimal(str(config.max_daily_loss_usd))
+    limit = _config_decimal(config.max_daily_loss_usd)
     if pnl.realized_today < -limit:
         return RiskVerdict(
             approved=False,
@@ -57,12 +78,12 @@ def check_daily_loss(pnl: PnLTracker, config: RiskConfig) -> RiskVerdict:
                 f" -${limit} limit"
             ),
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_position_concentration(
     action: TradeAction,
-    positions: dict[str, Position],
+    positions: Mapping[str, Position],
     config: RiskConfig,
 ) -> RiskVerdict:
     """Reject if event exposure would exceed bankroll concentration limit."""
@@ -71,7 +92,7 @@ def check_position_concentration(
         condition_id = action.signal.match.opportunity.condition_id
 
     if not condition_id:
-        return RiskVerdict(approved=True)
+        return APPROVED
 
     existing_exposure = sum(
         (
@@ -83,8 +104,8 @@ def check_position_concentration(
     )
     new_exposure = action.price * action.size
     total = existing_exposure + new_exposure
-    limit = Decimal(str(config.bankroll_usd)) * Decimal(
-        str(config.max_bankroll_pct_per_event)
+    limit = _bankroll_fraction(
+        config.bankroll_usd, config.max_bankroll_pct_per_event,
     )
 
     if total > limit:
@@ -97,11 +118,11 @@ def check_position_concentration(
                 f" of ${config.bankroll_usd})"
             ),
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_max_concurrent_positions(
-    positions: dict[str, Position],
+    positions: Mapping[str, Position],
     config: RiskConfig,
 ) -> RiskVerdict:
     """Reject if at or above the concurrent position limit."""
@@ -114,7 +135,7 @@ def check_max_concurrent_positions(
                 f" >= {config.max_concurrent_positions} limit"
             ),
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_orderbook_depth(
@@ -128,7 +149,7 @@ def check_orderbook_depth(
     when directional data is zero (backward compat).
     """
     opp = action.signal.match.opportunity
-    min_depth = Decimal(str(config.min_orderbook_depth_usd))
+    min_depth = _config_decimal(config.min_orderbook_depth_usd)
 
     # Pick directional depth based on trade side
     if action.side == Side.BUY and opp.ask_depth_usd > 0:
@@ -144,7 +165,7 @@ def check_orderbook_depth(
             reason=RiskRejectionReason.ORDERBOOK_DEPTH,
             detail=f"Depth ${depth} < ${min_depth} minimum",
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_spread(
@@ -154,22 +175,22 @@ def check_spread(
     """Reject if spread is too wide. None spread passes."""
     spread = action.signal.match.opportunity.spread
     if spread is None:
-        return RiskVerdict(approved=True)
+        return APPROVED
 
-    max_spread = Decimal(str(config.max_spread))
+    max_spread = _config_decimal(config.max_spread)
     if spread > max_spread:
         return RiskVerdict(
             approved=False,
             reason=RiskRejectionReason.SPREAD_TOO_WIDE,
             detail=f"Spread {spread} > {max_spread} maximum",
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_uma_exposure(
     action: TradeAction,
-    positions: dict[str, Position],
-    oracle_proposals: dict[str, OracleProposal],
+    positions: Mapping[str, Position],
+    oracle_proposals: Mapping[str, OracleProposal],
     config: RiskConfig,
 ) -> RiskVerdict:
     """Reject trades into disputed markets or exceeding UMA exposure limits."""
@@ -178,7 +199,7 @@ def check_uma_exposure(
         condition_id = action.signal.match.opportunity.condition_id
 
     if not condition_id:
-        return RiskVerdict(approved=True)
+        return APPROVED
 
     oracle_cfg = config.oracle
     proposal = oracle_proposals.get(condition_id)
@@ -207,9 +228,9 @@ def check_uma_exposure(
     new_exposure = action.price * action.size
     total = existing_exposure + new_exposure
 
-    usd_limit = Decimal(str(oracle_cfg.max_uma_exposure_usd))
-    pct_limit = Decimal(str(config.bankroll_usd)) * Decimal(
-        str(oracle_cfg.max_uma_exposure_pct)
+    usd_limit = _config_decimal(oracle_cfg.max_uma_exposure_usd)
+    pct_limit = _bankroll_fraction(
+        config.bankroll_usd, oracle_cfg.max_uma_exposure_pct,
     )
     effective_limit = min(usd_limit, pct_limit)
 
@@ -224,7 +245,7 @@ def check_uma_exposure(
             ),
         )
 
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_position_size(
@@ -233,7 +254,7 @@ def check_position_size(
 ) -> RiskVerdict:
     """Reject if the individual trade value exceeds max_position_usd."""
     trade_value = action.price * action.size
-    limit = Decimal(str(config.max_position_usd))
+    limit = _config_decimal(config.max_position_usd)
     if trade_value > limit:
         return RiskVerdict(
             approved=False,
@@ -243,7 +264,7 @@ def check_position_size(
                 f" ${limit} max position limit"
             ),
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_market_status(
@@ -257,7 +278,7 @@ def check_market_status(
     """
     market_info = action.signal.match.opportunity.market_info
     if market_info is None:
-        return RiskVerdict(approved=True)
+        return APPROVED
 
     if not market_info.active:
         return RiskVerdict(
@@ -283,7 +304,7 @@ def check_market_status(
             reason=RiskRejectionReason.MARKET_NOT_ACTIVE,
             detail="Market is not accepting orders",
         )
-    return RiskVerdict(approved=True)
+    return APPROVED
 
 
 def check_fee_rate(
@@ -297,12 +318,12 @@ def check_fee_rate(
     """
     fee_bps = action.signal.match.opportunity.fee_rate_bps
     if fee_bps <= config.max_fee_rate_bps:
-        return RiskVerdict(approved=True)
+        return APPROVED
 
     # Check override: high-profit trades can bypass fee limit
-    override_threshold = Decimal(str(config.fee_override_min_profit_usd))
+    override_threshold = _config_decimal(config.fee_override_min_profit_usd)
     if action.estimated_profit_usd >= override_threshold:
-        return RiskVerdict(approved=True)
+        return APPROVED
 
     return RiskVerdict(
         approved=False,
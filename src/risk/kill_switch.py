@@ -125,6 +125,30 @@ class KillSwitchManager:
 
         return None
 
+    def apply_fill(
+        self,
+        success: bool,
+        daily_loss_reason: str | None = None,
+    ) -> KillSwitchTrigger | None:
+        """Apply a fill outcome in one step.
+
+        If ``daily_loss_reason`` is given the daily-loss trigger fires and
+        the trade counters are left untouched (matching a trigger followed
+        by ``record_trade_result`` on an active switch).  Otherwise the
+        result feeds the consecutive-loss / error-rate counters.
+
+        Returns the trigger type if newly activated, else None.
+        """
+        if self._state.active:
+            return None
+
+        if daily_loss_reason is not None:
+            trigger = KillSwitchTrigger.DAILY_LOSS
+            self.trigger(daily_loss_reason, trigger)
+            return trigger
+
+        return self.record_trade_result(success)
+
     def record_api_error(self) -> KillSwitchTrigger | None:
         """Record an API error and auto-check connectivity trigger.
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from decimal import Decimal
+from types import MappingProxyType
 
 import structlog
 
+from src.core._callbacks import maybe_await
 from src.core.config import RiskConfig
 from src.core.types import (
     ExecutionResult,
@@ -22,6 +23,7 @@ from src.core.types import (
     TradeAction,
 )
 from src.risk.gates import (
+    APPROVED,
     check_daily_loss,
     check_fee_rate,
     check_kill_switch,
@@ -43,6 +45,12 @@ logger = structlog.stdlib.get_logger()
 
 RiskEventCallback = Callable[[RiskEvent], Awaitable[None] | None]
 
+# Oracle alert types that are forwarded as risk events (read-only)
+_ORACLE_EVENT_MAP: Mapping[OracleEventType, RiskEventType] = MappingProxyType({
+    OracleEventType.DISPUTE_DETECTED: RiskEventType.DISPUTE_DETECTED,
+    OracleEventType.WHALE_ACTIVITY_DETECTED: RiskEventType.WHALE_ACTIVITY_DETECTED,
+})
+
 
 class RiskMonitor:
     """Orchestrates risk gate checks, position tracking, and P&L.
@@ -72,7 +80,18 @@ class RiskMonitor:
         self._pnl = PnLTracker()
         self._kill_switch = KillSwitchManager(self._config.kill_switch)
         self._oracle_monitor = oracle_monitor
-        self._callbacks: list[RiskEventCallback] = []
+        self._callbacks: tuple[RiskEventCallback, ...] = ()
+        self._log = logger.bind(component="risk_monitor")
+        self._max_daily_loss = Decimal(str(self._config.max_daily_loss_usd))
+        self._neg_max_daily_loss = -self._max_daily_loss
+        # Float bound strictly inside the limit: anything above it is
+        # certainly not a breach, so the exact Decimal check can be skipped.
+        self._neg_max_daily_loss_f = -float(self._config.max_daily_loss_usd) * 0.9999
+
+        # Cached exposure_at_risk() for snapshot(), keyed on the oracle
+        # monitor's (positions, disputes) versions
+        self._exposure_at_risk_key: tuple[int, int] | None = None
+        self._last_exposure_at_risk_usd = 0.0
 
         # Wire oracle alerts → risk events
         if self._oracle_monitor is not None:
@@ -104,18 +123,20 @@ class RiskMonitor:
         return self._oracle_monitor
 
     def on_event(self, callback: RiskEventCallback) -> None:
-        """Register a callback for risk events."""
-        self._callbacks.append(callback)
+        """Register a callback for risk events.
+
+        The callback tuple is rebound rather than mutated so an in-flight
+        ``_emit`` keeps iterating a stable snapshot across ``await`` points.
+        """
+        self._callbacks = (*self._callbacks, callback)
 
     async def _emit(self, event: RiskEvent) -> None:
         """Dispatch a risk event to all registered callbacks."""
         for cb in self._callbacks:
             try:
-                result = cb(event)
-                if asyncio.iscoroutine(result):
-                    await result
+                await maybe_await(cb(event))
             except Exception:
-                logger.exception(
+                self._log.exception(
                     "risk_event_callback_error",
                     event_type=event.event_type,
                 )
@@ -130,68 +151,66 @@ class RiskMonitor:
         if not verdict.approved:
             return verdict
 
+        cfg = self._config
+
         # 2. Oracle risk filter
         question = action.signal.match.opportunity.question
-        verdict = check_oracle_risk(question, self._config.kill_switch)
+        verdict = check_oracle_risk(question, cfg.kill_switch)
         if not verdict.approved:
             return verdict
 
+        # Read-only view of positions shared by the gates below
+        positions = self._positions.positions
+
         # 2.5. UMA exposure / dispute check
         if self._oracle_monitor is not None:
             verdict = check_uma_exposure(
-                action,
-                self._positions.positions,
-                self._oracle_monitor.proposals,
-                self._config,
+                action, positions, self._oracle_monitor.proposals, cfg,
             )
             if not verdict.approved:
                 return verdict
 
         # 3. Daily loss limit
-        verdict = check_daily_loss(self._pnl, self._config)
+        verdict = check_daily_loss(self._pnl, cfg)
         if not verdict.approved:
             return verdict
 
         # 4. Position concentration
-        verdict = check_position_concentration(
-            action, self._positions.positions, self._config,
-        )
+        verdict = check_position_concentration(action, positions, cfg)
         if not verdict.approved:
             return verdict
 
         # 5. Max concurrent positions
-        verdict = check_max_concurrent_positions(
-            self._positions.positions, self._config,
-        )
+        verdict = check_max_concurrent_positions(positions, cfg)
         if not verdict.approved:
             return verdict
 
         # 6. Position size
-        verdict = check_position_size(action, self._config)
+        verdict = check_position_size(action, cfg)
         if not verdict.approved:
             return verdict
 
         # 7. Market status
-        verdict = check_market_status(action, self._config)
+        verdict = check_market_status(action, cfg)
         if not verdict.approved:
             return verdict
 
         # 8. Fee rate
-        verdict = check_fee_rate(action, self._config)
+        verdict = check_fee_rate(action, cfg)
         if not verdict.approved:
             return verdict
 
         # 9. Orderbook depth (directional when available)
-        verdict = check_orderbook_depth(action, self._config)
+        verdict = check_orderbook_depth(action, cfg)
         if not verdict.approved:
             return verdict
 
         # 10. Spread
-        verdict = check_spread(action, self._config)
+        verdict = check_spread(action, cfg)
         if not verdict.approved:
             return verdict
 
-        return RiskVerdict(approved=True)
+        return APPROVED
 
     async def record_fill(self, result: ExecutionResult) -> None:
         """Record a successful fill — update positions and P&L.
@@ -216,36 +235,45 @@ class RiskMonitor:
                 timestamp=time.time(),
             ))
 
-        # Auto-trigger kill switch if daily loss limit breached
-        if pnl_amount < 0:
-            limit = Decimal(str(self._config.max_daily_loss_usd))
-            if self._pnl.realized_today < -limit and not self._kill_switch.active:
-                self._kill_switch.trigger(
-                    f"Daily loss ${self._pnl.realized_today}"
-                    f" breached -${limit} limit",
-                    KillSwitchTrigger.DAILY_LOSS,
-                )
-                logger.warning(
-                    "kill_switch_triggered",
-                    trigger="DAILY_LOSS",
-                    daily_pnl=str(self._pnl.realized_today),
-                    limit=str(limit),
-                )
-                await self._emit(RiskEvent(
-                    event_type=RiskEventType.KILL_SWITCH_TRIGGERED,
-                    daily_pnl=self._pnl.realized_today,
-                    reason=(
-                        f"Daily loss ${self._pnl.realized_today}"
-                        f" breached -${limit} limit"
-                    ),
-                    timestamp=time.time(),
-                ))
+        # Check the daily loss limit.  Profitable fills skip the Decimal
+        # comparison entirely.
+        pnl_is_loss = pnl_amount < 0
+        realized_today = self._pnl.realized_today
+        daily_loss_reason: str | None = None
+        if (
+            pnl_is_loss
+            and not self._kill_switch.active
+            and float(realized_today) <= self._neg_max_daily_loss_f
+            and realized_today < self._neg_max_daily_loss
+        ):
+            daily_loss_reason = (
+                f"Daily loss ${realized_today}"
+                f" breached -${self._max_daily_loss} limit"
+            )
 
-        # Record trade result for consecutive-loss / error-rate triggers
-        trade_success = pnl_amount >= 0
-        trigger = self._kill_switch.record_trade_result(trade_success)
-        if trigger is not None:
-            logger.warning(
+        # One kill-switch update covers daily-loss, consecutive-loss and
+        # error-rate triggers
+        trigger = self._kill_switch.apply_fill(
+            not pnl_is_loss, daily_loss_reason,
+        )
+        if trigger is None:
+            return
+
+        if trigger == KillSwitchTrigger.DAILY_LOSS:
+            self._log.warning(
+                "kill_switch_triggered",
+                trigger="DAILY_LOSS",
+                daily_pnl=str(realized_today),
+                limit=str(self._max_daily_loss),
+            )
+            await self._emit(RiskEvent(
+                event_type=RiskEventType.KILL_SWITCH_TRIGGERED,
+                daily_pnl=realized_today,
+                reason=daily_loss_reason or "",
+                timestamp=time.time(),
+            ))
+        else:
+            self._log.warning(
                 "kill_switch_triggered",
                 trigger=trigger.value,
             )
@@ -264,7 +292,7 @@ class RiskMonitor:
         else:
             trigger = self._kill_switch.record_api_error()
             if trigger is not None:
-                logger.warning(
+                self._log.warning(
                     "kill_switch_triggered",
                     trigger=trigger.value,
                 )
@@ -278,7 +306,7 @@ class RiskMonitor:
         if latency_ms > 0:
             trigger = self._kill_switch.record_api_latency(latency_ms)
             if trigger is not None:
-                logger.warning(
+                self._log.warning(
                     "kill_switch_triggered",
                     trigger=trigger.value,
                     latency_ms=latency_ms,
@@ -292,7 +320,7 @@ class RiskMonitor:
     async def reset_kill_switch(self) -> None:
         """Manually reset the kill switch."""
         self._kill_switch.reset()
-        logger.info("kill_switch_reset")
+        self._log.info("kill_switch_reset")
         await self._emit(RiskEvent(
             event_type=RiskEventType.KILL_SWITCH_RESET,
             reason="Kill switch manually reset",
@@ -300,7 +328,11 @@ class RiskMonitor:
         ))
 
     def snapshot(self) -> dict[str, object]:
-        """Return a snapshot of current risk state."""
+        """Return a snapshot of current risk state.
+
+        Exposure at risk is cached and only re-summed when the position or
+        disputed-condition state it depends on has changed.
+        """
         self._pnl._maybe_reset_day()
         ks = self._kill_switch.state
         snap: dict[str, object] = {
@@ -314,23 +346,19 @@ class RiskMonitor:
             "trade_count_today": self._pnl.trade_count_today,
         }
         if self._oracle_monitor is not None:
-            snap["disputed_markets"] = len(
-                self._oracle_monitor.disputed_conditions,
-            )
-            snap["exposure_at_risk_usd"] = float(
-                self._oracle_monitor.exposure_at_risk(),
-            )
+            snap["disputed_markets"] = self._oracle_monitor.disputed_count
+            key = self._oracle_monitor.exposure_version
+            if key != self._exposure_at_risk_key:
+                self._last_exposure_at_risk_usd = float(
+                    self._oracle_monitor.exposure_at_risk(),
+                )
+                self._exposure_at_risk_key = key
+            snap["exposure_at_risk_usd"] = self._last_exposure_at_risk_usd
         return snap
 
     async def _forward_oracle_alert(self, alert: OracleAlert) -> None:
         """Forward oracle alerts as RiskEvents."""
-        event_type_map = {
-            OracleEventType.DISPUTE_DETECTED: RiskEventType.DISPUTE_DETECTED,
-            OracleEventType.WHALE_ACTIVITY_DETECTED: (
-                RiskEventType.WHALE_ACTIVITY_DETECTED
-            ),
-        }
-        risk_event_type = event_type_map.get(alert.event_type)
+        risk_event_type = _ORACLE_EVENT_MAP.get(alert.event_type)
         if risk_event_type is not None:
             await self._emit(RiskEvent(
                 event_type=risk_event_type,
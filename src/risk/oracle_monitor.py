@@ -7,9 +7,16 @@ the UMA Optimistic Oracle subgraph for proposals/disputes on tracked markets.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import re
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
 
 import structlog
 
@@ -26,18 +33,16 @@ from src.core.types import (
 from src.risk.positions import PositionTracker
 
 logger = structlog.stdlib.get_logger()
+# The stdlib logger structlog wraps for this module; used to skip building
+# per-proposal log events when their level is disabled
+_std_logger = logging.getLogger(__name__)
 
 OracleAlertCallback = Callable[[OracleAlert], Awaitable[None] | None]
+OracleAlertBatchCallback = Callable[
+    [Sequence[OracleAlert]], Awaitable[None] | None
+]
 
-# GraphQL query for UMA Optimistic Oracle proposals by condition IDs
-_PROPOSALS_QUERY = """
-query OracleProposals($conditionIds: [String!]!) {
-  optimisticPriceRequests(
-    where: { ancillaryData_contains_nocase_in: $conditionIds }
-    orderBy: requestTimestamp
-    orderDirection: desc
-    first: 100
-  ) {
+_PROPOSAL_FIELDS = """
     id
     proposer
     proposedPrice
@@ -49,10 +54,66 @@ query OracleProposals($conditionIds: [String!]!) {
     settled
     ancillaryData
     bond
-  }
-}
 """
 
+# Maximum rows returned per subgraph query
+_PAGE_SIZE = 100
+
+# Tracked conditions per proposals query, and cap on in-flight queries
+_CONDITION_BATCH_SIZE = 25
+_MAX_CONCURRENT_QUERIES = 4
+
+# GraphQL query for UMA Optimistic Oracle proposals by condition IDs,
+# limited to requests newer than the ``since`` watermark
+_PROPOSALS_QUERY = f"""
+query OracleProposals($conditionIds: [String!]!, $since: BigInt!) {{
+  optimisticPriceRequests(
+    where: {{
+      ancillaryData_contains_nocase_in: $conditionIds
+      requestTimestamp_gt: $since
+    }}
+    orderBy: requestTimestamp
+    orderDirection: desc
+    first: {_PAGE_SIZE}
+  ) {{{_PROPOSAL_FIELDS}  }}
+}}
+"""
+
+# GraphQL query re-checking known, unsettled requests for state changes
+_PROPOSAL_UPDATES_QUERY = f"""
+query OracleProposalUpdates($ids: [ID!]!) {{
+  optimisticPriceRequests(where: {{ id_in: $ids }}, first: {_PAGE_SIZE}) {{{_PROPOSAL_FIELDS}  }}
+}}
+"""
+
+# SHA-256 of each query text, sent instead of the text once the subgraph
+# has registered it (automatic persisted queries)
+_QUERY_HASHES: dict[str, str] = {
+    query: hashlib.sha256(query.encode()).hexdigest()
+    for query in (_PROPOSALS_QUERY, _PROPOSAL_UPDATES_QUERY)
+}
+
+
+def _persisted_query_missed(response: dict[str, object]) -> bool:
+    """Whether a hash-only request failed because the hash is unknown."""
+    errors = response.get("errors") or []
+    for error in errors:  # type: ignore[attr-defined]
+        extensions = error.get("extensions") or {}
+        if (
+            extensions.get("code") == "PERSISTED_QUERY_NOT_FOUND"
+            or error.get("message") == "PersistedQueryNotFound"
+        ):
+            return True
+    return False
+
+
+# Consecutive HTTP failures of hash-only requests before persisted
+# queries are turned off for good
+_MAX_PERSISTED_QUERY_FAILURES = 3
+
+# Binary-outcome payout; the oracle risk premium is measured against it
+_ONE = Decimal("1.00")
+
 
 class OracleMonitor:
     """Monitors UMA oracle proposals and disputes for active markets.
@@ -95,45 +156,100 @@ class OracleMonitor:
     ) -> None:
         self._config = config or OracleConfig()
         self._positions = positions
+        # Thresholds are fixed for the config, so convert to Decimal once
+        self._price_threshold = Decimal(
+            str(self._config.oracle_risk_price_threshold),
+        )
+        self._hedge_threshold = Decimal(str(self._config.hedge_risk_threshold))
         self._proposals: dict[str, OracleProposal] = {}
-        self._callbacks: list[OracleAlertCallback] = []
-        self._whale_addresses: set[str] = {
+        self._proposals_view = MappingProxyType(self._proposals)
+        # Condition IDs whose proposal is DISPUTED, kept in step with
+        # every state transition in the ingest_* methods
+        self._disputed_cids: set[str] = set()
+        # Bumped on every change to _disputed_cids; keys exposure caches
+        self._disputes_version = 0
+        # Callbacks are classified once at registration so _emit does not
+        # probe every result for a coroutine, and indexed by event type so
+        # alerts nobody subscribed to are never built
+        self._sync_callbacks: dict[OracleEventType, list[OracleAlertCallback]] = {}
+        self._async_callbacks: dict[
+            OracleEventType, list[Callable[[OracleAlert], Awaitable[None]]]
+        ] = {}
+        self._subscribed: set[OracleEventType] = set()
+        # Batch callbacks get one call per poll cycle with every alert it
+        # raised; _outbox collects them while a poll is in progress
+        self._batch_callbacks: list[OracleAlertBatchCallback] = []
+        self._outbox: list[OracleAlert] | None = None
+        self._whale_addresses: frozenset[str] = frozenset(
             addr.lower() for addr in self._config.whale_addresses
-        }
+        )
 
         # Active polling state
         self._tracked_conditions: set[str] = set()
+        # Frozen copy handed out by tracked_conditions, rebuilt on change
+        self._tracked_view: frozenset[str] | None = None
+        # Lowercased condition ID → original, for ancillary-data matching
+        self._tracked_lower: dict[str, str] = {}
+        # Single-pass alternation over _tracked_lower, rebuilt lazily
+        self._match_pattern: re.Pattern[str] | None = None
+        self._last_positions_version = -1
         self._task: asyncio.Task[None] | None = None
         self._running = False
         self._http_session = http_session
+        self._owns_session = False
+        # Persisted queries: disabled for good if the subgraph rejects them
+        self._persisted_queries = self._config.subgraph_persisted_queries
+        self._registered_queries: set[str] = set()
+        self._persisted_query_failures = 0
         self._poll_count = 0
         self._last_poll_at: float = 0.0
+        # Incremental polling: highest requestTimestamp fully fetched, and
+        # subgraph request IDs seen but not yet settled
+        self._high_water_ts = 0
+        self._open_request_ids: set[str] = set()
+        # Risk assessment inputs: proposal state (dirty bit) and positions
+        # (tracker version at the last assessment)
+        self._risk_dirty = True
+        self._risk_positions_version = -1
+        # HIGH_ORACLE_RISK cooldowns {(condition_id, price_cents): expiry_ts}
+        self._risk_alert_expiry: dict[tuple[str, int], float] = {}
 
     # ── Properties ───────────────────────────────────────────────
 
     @property
-    def proposals(self) -> dict[str, OracleProposal]:
-        """Read-only copy of tracked proposals."""
-        return dict(self._proposals)
+    def proposals(self) -> Mapping[str, OracleProposal]:
+        """Read-only view of tracked proposals."""
+        return self._proposals_view
 
     @property
-    def disputed_conditions(self) -> set[str]:
+    def disputed_conditions(self) -> frozenset[str]:
         """Condition IDs with active disputes."""
-        return {
-            cid
-            for cid, p in self._proposals.items()
-            if p.state == OracleProposalState.DISPUTED
-        }
+        return frozenset(self._disputed_cids)
 
     @property
-    def whale_addresses(self) -> set[str]:
+    def disputed_count(self) -> int:
+        """Number of conditions with active disputes."""
+        return len(self._disputed_cids)
+
+    @property
+    def exposure_version(self) -> tuple[int, int]:
+        """State key for ``exposure_at_risk()``: (positions, disputes) versions."""
+        positions_version = (
+            self._positions.version if self._positions is not None else -1
+        )
+        return (positions_version, self._disputes_version)
+
+    @property
+    def whale_addresses(self) -> frozenset[str]:
         """Configured whale addresses (lowercased)."""
-        return set(self._whale_addresses)
+        return self._whale_addresses
 
     @property
-    def tracked_conditions(self) -> set[str]:
+    def tracked_conditions(self) -> frozenset[str]:
         """Currently tracked condition IDs."""
-        return set(self._tracked_conditions)
+        if self._tracked_view is None:
+            self._tracked_view = frozenset(self._tracked_conditions)
+        return self._tracked_view
 
     @property
     def running(self) -> bool:
@@ -149,31 +265,67 @@ class OracleMonitor:
 
     def track_condition(self, condition_id: str) -> None:
         """Register a condition ID for active monitoring."""
+        if condition_id not in self._tracked_conditions:
+            # New condition: its history predates the watermark
+            self._high_water_ts = 0
         self._tracked_conditions.add(condition_id)
-        logger.debug("oracle_condition_tracked", condition_id=condition_id)
+        self._tracked_view = None
+        self._tracked_lower[condition_id.lower()] = condition_id
+        self._match_pattern = None
+        self._risk_dirty = True
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("oracle_condition_tracked", condition_id=condition_id)
 
     def untrack_condition(self, condition_id: str) -> None:
         """Remove a condition ID from active monitoring."""
         self._tracked_conditions.discard(condition_id)
-        logger.debug("oracle_condition_untracked", condition_id=condition_id)
+        self._tracked_view = None
+        lower = condition_id.lower()
+        if self._tracked_lower.get(lower) == condition_id:
+            del self._tracked_lower[lower]
+            self._match_pattern = None
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("oracle_condition_untracked", condition_id=condition_id)
 
     def sync_tracked_from_positions(self) -> None:
         """Sync tracked conditions from the position tracker.
 
         Adds all condition IDs with open positions to the tracking set.
+        Skips the scan when the tracker has not changed since the last sync.
         """
         if self._positions is None:
             return
+        version = self._positions.version
+        if version == self._last_positions_version:
+            return
+        self._last_positions_version = version
         for pos in self._positions.positions.values():
-            if pos.condition_id:
-                self._tracked_conditions.add(pos.condition_id)
+            cid = pos.condition_id
+            if cid and cid not in self._tracked_conditions:
+                self._tracked_conditions.add(cid)
+                self._tracked_view = None
+                self._high_water_ts = 0
+                self._tracked_lower[cid.lower()] = cid
+                self._match_pattern = None
 
     # ── Lifecycle ────────────────────────────────────────────────
 
     async def start(self) -> None:
-        """Start the background polling loop."""
+        """Start the background polling loop.
+
+        If no HTTP session was injected, creates one that is kept open
+        for the lifetime of the loop so every poll reuses the same pooled
+        keep-alive connection to the subgraph.
+        """
         if self._running:
             return
+        if self._http_session is None:
+            import aiohttp
+
+            self._http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10.0),
+            )
+            self._owns_session = True
         self._running = True
         self._task = asyncio.create_task(self._poll_loop())
         logger.info(
@@ -192,6 +344,10 @@ class OracleMonitor:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        if self._owns_session and self._http_session is not None:
+            await self._http_session.close()  # type: ignore[attr-defined]
+            self._http_session = None
+            self._owns_session = False
         logger.info(
             "oracle_monitor_stopped",
             poll_count=self._poll_count,
@@ -215,11 +371,23 @@ class OracleMonitor:
     async def poll_once(self) -> list[OracleProposal]:
         """Run a single poll cycle against the UMA subgraph.
 
-        Fetches proposals for all tracked conditions, detects new proposals
-        and state changes (disputes, settlements), and emits alerts.
+        Fetches proposals for tracked conditions requested after the last
+        fully-fetched watermark, re-checks known unsettled requests for
+        disputes/settlements, and emits alerts.  Batch callbacks receive
+        the cycle's alerts together once it finishes.
 
         Returns the list of proposals found.
         """
+        self._outbox = []
+        try:
+            return await self._poll_cycle()
+        finally:
+            batch, self._outbox = self._outbox, None
+            if batch:
+                await self._emit_batch(batch)
+
+    async def _poll_cycle(self) -> list[OracleProposal]:
+        """Body of ``poll_once``."""
         self.sync_tracked_from_positions()
 
         if not self._tracked_conditions:
@@ -227,74 +395,207 @@ class OracleMonitor:
             self._last_poll_at = time.time()
             return []
 
-        raw_proposals = await self._fetch_subgraph_proposals(
-            list(self._tracked_conditions),
+        since = self._high_water_ts
+        pages = await self._fetch_batched(
+            lambda batch: self._fetch_subgraph_proposals(batch, since=since),
+            sorted(self._tracked_conditions),
+            _CONDITION_BATCH_SIZE,
         )
+        raw_proposals = [raw for page in pages for raw in page]
+        # Advance the watermark only when no page was truncated, otherwise
+        # older unseen requests would be skipped next poll
+        truncated = any(len(page) >= _PAGE_SIZE for page in pages)
+        if raw_proposals and not truncated:
+            newest = max(
+                int(str(raw.get("requestTimestamp", 0))) for raw in raw_proposals
+            )
+            self._high_water_ts = max(self._high_water_ts, newest)
+
+        stale_ids = self._open_request_ids.difference(
+            str(raw.get("id", "")) for raw in raw_proposals
+        )
+        if stale_ids:
+            update_pages = await self._fetch_batched(
+                self._fetch_subgraph_updates, sorted(stale_ids), _PAGE_SIZE,
+            )
+            raw_proposals.extend(raw for page in update_pages for raw in page)
 
         for raw in raw_proposals:
             await self._process_subgraph_proposal(raw)
 
-        # Check oracle risk on held positions after each poll
-        assessments = self.assess_oracle_risk()
+        # Re-assess oracle risk on held positions only when proposals or
+        # positions changed since the last assessment
+        positions_version = (
+            self._positions.version if self._positions is not None else -1
+        )
+        if self._risk_dirty or positions_version != self._risk_positions_version:
+            assessments = self.assess_oracle_risk()
+            self._risk_dirty = False
+            self._risk_positions_version = positions_version
+        else:
+            assessments = []
+        if assessments:
+            now = time.time()
+            expired = [
+                key for key, expiry in self._risk_alert_expiry.items()
+                if expiry <= now
+            ]
+            for key in expired:
+                del self._risk_alert_expiry[key]
         for assessment in assessments:
-            if assessment.oracle_risk_premium <= Decimal(
-                str(self._config.hedge_risk_threshold)
-            ):
-                await self._emit(OracleAlert(
-                    event_type=OracleEventType.HIGH_ORACLE_RISK,
-                    condition_id=assessment.condition_id,
-                    held_position_exposure=assessment.exposure_usd,
-                    reason=(
-                        f"High oracle risk on {assessment.condition_id}: "
-                        f"price ${assessment.current_price}, "
-                        f"risk premium {assessment.oracle_risk_premium:.4f} "
-                        f"<= {self._config.hedge_risk_threshold:.4f} threshold. "
-                        f"{assessment.recommendation}"
-                    ),
-                    timestamp=time.time(),
-                ))
+            if assessment.oracle_risk_premium <= self._hedge_threshold:
+                # Suppress repeats for the same market at the same price
+                key = (
+                    assessment.condition_id,
+                    int(assessment.current_price * 100),
+                )
+                if key in self._risk_alert_expiry:
+                    continue
+                self._risk_alert_expiry[key] = (
+                    now + self._config.alert_cooldown_secs
+                )
+                if OracleEventType.HIGH_ORACLE_RISK in self._subscribed:
+                    await self._emit(OracleAlert(
+                        event_type=OracleEventType.HIGH_ORACLE_RISK,
+                        condition_id=assessment.condition_id,
+                        held_position_exposure=assessment.exposure_usd,
+                        reason=(
+                            f"High oracle risk on {assessment.condition_id}: "
+                            f"price ${assessment.current_price}, "
+                            f"risk premium {assessment.oracle_risk_premium:.4f} "
+                            f"<= {self._config.hedge_risk_threshold:.4f} threshold. "
+                            f"{assessment.recommendation}"
+                        ),
+                        timestamp=time.time(),
+                    ))
 
         self._poll_count += 1
         self._last_poll_at = time.time()
         return list(self._proposals.values())
 
+    async def _fetch_batched(
+        self,
+        fetch: Callable[[list[str]], Awaitable[list[dict[str, object]]]],
+        items: list[str],
+        batch_size: int,
+    ) -> list[list[dict[str, object]]]:
+        """Run ``fetch`` over fixed-size batches of ``items`` concurrently.
+
+        Keeps each query within the subgraph page size and bounds the
+        number of in-flight requests with a semaphore.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_QUERIES)
+
+        async def run(batch: list[str]) -> list[dict[str, object]]:
+            async with semaphore:
+                return await fetch(batch)
+
+        return await asyncio.gather(*(
+            run(items[i:i + batch_size])
+            for i in range(0, len(items), batch_size)
+        ))
+
     async def _fetch_subgraph_proposals(
-        self, condition_ids: list[str],
+        self, condition_ids: list[str], since: int = 0,
     ) -> list[dict[str, object]]:
         """Query the UMA Optimistic Oracle subgraph for proposals.
 
-        Returns raw proposal dicts from the subgraph response.
+        Only requests with ``requestTimestamp`` greater than ``since`` are
+        returned.  Returns raw proposal dicts from the subgraph response.
+        """
+        return await self._post_subgraph(
+            _PROPOSALS_QUERY,
+            {"conditionIds": condition_ids, "since": str(since)},
+        )
+
+    async def _fetch_subgraph_updates(
+        self, request_ids: list[str],
+    ) -> list[dict[str, object]]:
+        """Re-fetch known subgraph requests by ID to pick up state changes."""
+        return await self._post_subgraph(
+            _PROPOSAL_UPDATES_QUERY, {"ids": request_ids},
+        )
+
+    async def _post_subgraph(
+        self, query: str, variables: dict[str, object],
+    ) -> list[dict[str, object]]:
+        """POST a GraphQL query and return its ``optimisticPriceRequests``.
+
+        Once a query has been accepted with its persisted-query hash, later
+        calls send only the hash.  Any failure of a hash-only request drops
+        the hash and resends the full text in the same call.  A GraphQL
+        error other than a hash miss, or repeated HTTP errors, turn
+        persisted queries off.
         Falls back gracefully if the HTTP session is unavailable.
         """
         if self._http_session is None:
             return []
 
         try:
-            import aiohttp
-
-            session: aiohttp.ClientSession = self._http_session  # type: ignore[assignment]
-            payload = {
-                "query": _PROPOSALS_QUERY,
-                "variables": {"conditionIds": condition_ids},
-            }
-            async with session.post(
-                self._config.subgraph_url, json=payload,
-            ) as resp:
-                if resp.status != 200:
-                    logger.warning(
-                        "oracle_subgraph_http_error",
-                        status=resp.status,
-                    )
+            query_hash = _QUERY_HASHES.get(query, "")
+            persisted = {"version": 1, "sha256Hash": query_hash}
+            data: dict[str, object] | None = None
+
+            if self._persisted_queries and query_hash in self._registered_queries:
+                data = await self._post_graphql({
+                    "variables": variables,
+                    "extensions": {"persistedQuery": persisted},
+                })
+                if data is None:
+                    # HTTP error (e.g. a 400 from a server without APQ support)
+                    self._registered_queries.discard(query_hash)
+                    self._persisted_query_failures += 1
+                    if self._persisted_query_failures >= _MAX_PERSISTED_QUERY_FAILURES:
+                        self._persisted_queries = False
+                        logger.warning(
+                            "oracle_persisted_queries_unsupported",
+                            failures=self._persisted_query_failures,
+                        )
+                elif data.get("data") is None:
+                    self._registered_queries.discard(query_hash)
+                    if not _persisted_query_missed(data):
+                        self._persisted_queries = False
+                        logger.warning("oracle_persisted_queries_unsupported")
+                    data = None
+                else:
+                    self._persisted_query_failures = 0
+
+            if data is None:
+                payload: dict[str, object] = {"query": query, "variables": variables}
+                if self._persisted_queries and query_hash:
+                    payload["extensions"] = {"persistedQuery": persisted}
+                data = await self._post_graphql(payload)
+                if data is None:
                     return []
-                data = await resp.json()
-                requests = (
-                    data.get("data", {}).get("optimisticPriceRequests", [])
-                )
-                return requests  # type: ignore[no-any-return]
+                if self._persisted_queries and query_hash and data.get("data"):
+                    self._registered_queries.add(query_hash)
+
+            requests = (
+                data.get("data", {}).get("optimisticPriceRequests", [])  # type: ignore[attr-defined]
+            )
+            return requests  # type: ignore[no-any-return]
         except Exception:
             logger.exception("oracle_subgraph_fetch_error")
             return []
 
+    async def _post_graphql(
+        self, payload: dict[str, object],
+    ) -> dict[str, object] | None:
+        """POST a GraphQL payload; returns the decoded body, or None on HTTP error."""
+        import aiohttp
+
+        session: aiohttp.ClientSession = self._http_session  # type: ignore[assignment]
+        async with session.post(self._config.subgraph_url, json=payload) as resp:
+            if resp.status != 200:
+                logger.warning(
+                    "oracle_subgraph_http_error",
+                    status=resp.status,
+                )
+                return None
+            # Decode the raw body directly; skips aiohttp's content-type
+            # check and intermediate str decode
+            return json.loads(await resp.read())  # type: ignore[no-any-return]
+
     async def _process_subgraph_proposal(
         self, raw: dict[str, object],
     ) -> None:
@@ -303,66 +604,81 @@ class OracleMonitor:
         Detects state transitions (new proposal, dispute, settlement) and
         triggers the appropriate ingest methods.
         """
-        proposal_id = str(raw.get("id", ""))
-        ancillary = str(raw.get("ancillaryData", ""))
-        proposer = str(raw.get("proposer", ""))
-        disputer = str(raw.get("disputer", ""))
-        proposed_price = str(raw.get("proposedPrice", ""))
-        request_ts = float(raw.get("requestTimestamp", 0))
-        dispute_ts = float(raw.get("disputeTimestamp", 0))
-        settle_ts = float(raw.get("settleTimestamp", 0))
-        settled = bool(raw.get("settled", False))
-        bond_str = str(raw.get("bond", "0"))
-
-        # Match ancillary data to a tracked condition
-        condition_id = self._match_condition(ancillary)
+        # Match ancillary data to a tracked condition before parsing
+        # anything else; unmatched rows are dropped
+        condition_id = self._match_condition(str(raw.get("ancillaryData", "")))
         if not condition_id:
             return
 
+        proposal_id = str(raw.get("id", ""))
+        settled = bool(raw.get("settled", False))
+        if proposal_id:
+            if settled:
+                self._open_request_ids.discard(proposal_id)
+            else:
+                self._open_request_ids.add(proposal_id)
+
         existing = self._proposals.get(condition_id)
 
-        # Determine state
-        if settled and settle_ts > 0:
+        # Determine state, converting only the fields each branch needs
+        settle_ts = float(raw.get("settleTimestamp", 0)) if settled else 0.0
+        if settle_ts > 0:
             if existing is None or existing.state != OracleProposalState.SETTLED:
                 settlement_price = str(raw.get("settlementPrice", ""))
                 outcome = "YES" if settlement_price == "1" else "NO"
                 await self.ingest_settlement(condition_id, outcome, settle_ts)
-        elif disputer and dispute_ts > 0:
+            return
+
+        disputer = str(raw.get("disputer", ""))
+        dispute_ts = float(raw.get("disputeTimestamp", 0)) if disputer else 0.0
+        if dispute_ts > 0:
             if existing is None or existing.state != OracleProposalState.DISPUTED:
                 await self.ingest_dispute(condition_id, disputer, dispute_ts)
                 # Check if disputer is a whale
-                if disputer.lower() in self._whale_addresses:
+                if self._is_whale(disputer):
                     await self.ingest_whale_activity(WhaleActivity(
                         address=disputer,
                         condition_id=condition_id,
                         action="DISPUTE",
                         timestamp=dispute_ts,
                     ))
-        else:
-            if existing is None:
-                try:
-                    bond = Decimal(bond_str)
-                except Exception:
-                    bond = Decimal("0")
-                proposal = OracleProposal(
-                    condition_id=condition_id,
-                    proposal_hash=proposal_id,
-                    proposer=proposer,
-                    proposed_outcome=proposed_price,
-                    state=OracleProposalState.PROPOSED,
-                    proposed_at=request_ts,
-                    bond_amount=bond,
-                    metadata={"raw": raw},
-                )
-                await self.ingest_proposal(proposal)
+            return
+
+        if existing is None:
+            try:
+                bond = Decimal(str(raw.get("bond", "0")))
+            except Exception:
+                bond = Decimal("0")
+            # The raw row (incl. the ancillary blob) is not retained
+            proposal = OracleProposal(
+                condition_id=condition_id,
+                proposal_hash=proposal_id,
+                proposer=str(raw.get("proposer", "")),
+                proposed_outcome=str(raw.get("proposedPrice", "")),
+                state=OracleProposalState.PROPOSED,
+                proposed_at=float(raw.get("requestTimestamp", 0)),
+                bond_amount=bond,
+            )
+            await self.ingest_proposal(proposal)
 
     def _match_condition(self, ancillary_data: str) -> str:
-        """Match subgraph ancillary data to a tracked condition ID."""
-        ancillary_lower = ancillary_data.lower()
-        for cid in self._tracked_conditions:
-            if cid.lower() in ancillary_lower:
-                return cid
-        return ""
+        """Match subgraph ancillary data to a tracked condition ID.
+
+        Scans the ancillary data once with a compiled alternation of all
+        tracked IDs (longest first) instead of one substring test per ID.
+        """
+        if not self._tracked_lower:
+            return ""
+        pattern = self._match_pattern
+        if pattern is None:
+            pattern = self._match_pattern = re.compile("|".join(
+                re.escape(lower)
+                for lower in sorted(self._tracked_lower, key=len, reverse=True)
+            ))
+        match = pattern.search(ancillary_data.lower())
+        if match is None:
+            return ""
+        return self._tracked_lower[match.group()]
 
     # ── Oracle Risk Assessment ───────────────────────────────────
 
@@ -381,15 +697,19 @@ class OracleMonitor:
         if self._positions is None:
             return []
 
-        threshold = Decimal(str(self._config.oracle_risk_price_threshold))
+        threshold = self._price_threshold
+        hedge_threshold = self._hedge_threshold
         assessments: list[OracleRiskAssessment] = []
 
-        for pos in self._positions.positions.values():
-            current_price = pos.entry_price
-            if current_price < threshold:
-                continue
+        # Filter in one pass first; only near-$1 positions need assessing
+        candidates = [
+            pos for pos in self._positions.positions.values()
+            if pos.entry_price >= threshold
+        ]
 
-            oracle_risk_premium = Decimal("1.00") - current_price
+        for pos in candidates:
+            current_price = pos.entry_price
+            oracle_risk_premium = _ONE - current_price
             exposure = current_price * pos.size
             has_dispute = self.is_disputed(pos.condition_id)
 
@@ -398,9 +718,7 @@ class OracleMonitor:
                     f"HEDGE: Position has active dispute. "
                     f"Consider selling {pos.size} shares to reduce exposure."
                 )
-            elif oracle_risk_premium <= Decimal(
-                str(self._config.hedge_risk_threshold)
-            ):
+            elif oracle_risk_premium <= hedge_threshold:
                 recommendation = (
                     f"MONITOR: Oracle risk premium "
                     f"({oracle_risk_premium:.4f}) is below "
@@ -437,14 +755,24 @@ class OracleMonitor:
         """Get the proposal for a condition, if tracked."""
         return self._proposals.get(condition_id)
 
+    def snapshot_proposals(self) -> dict[str, OracleProposal]:
+        """Independent copy of tracked proposals, keyed by condition_id."""
+        return dict(self._proposals)
+
     def exposure_at_risk(self) -> Decimal:
         """Total exposure in disputed markets (cross-references positions)."""
         if self._positions is None:
             return Decimal("0")
-        total = Decimal("0")
-        for cid in self.disputed_conditions:
-            total += self._positions.exposure_for_condition(cid)
-        return total
+        disputed = self._disputed_cids
+        if not disputed:
+            return Decimal("0")
+        return sum(
+            (
+                p.entry_price * p.size
+                for p in self._positions.positions_for_conditions(disputed)
+            ),
+            Decimal("0"),
+        )
 
     def disputed_positions(
         self,
@@ -452,32 +780,95 @@ class OracleMonitor:
         """Return (condition_id, position, proposal) for disputed positions."""
         if self._positions is None:
             return []
-        result: list[tuple[str, Position, OracleProposal]] = []
-        for cid in self.disputed_conditions:
-            proposal = self._proposals[cid]
-            for pos in self._positions.positions.values():
-                if pos.condition_id == cid:
-                    result.append((cid, pos, proposal))
-        return result
+        disputed = self._disputed_cids
+        if not disputed:
+            return []
+        proposals = self._proposals
+        return [
+            (pos.condition_id, pos, proposals[pos.condition_id])
+            for pos in self._positions.positions_for_conditions(disputed)
+        ]
 
     # ── Callbacks ────────────────────────────────────────────────
 
-    def on_alert(self, callback: OracleAlertCallback) -> None:
-        """Register a callback for oracle alerts."""
-        self._callbacks.append(callback)
+    def on_alert(
+        self,
+        callback: OracleAlertCallback,
+        event_types: Iterable[OracleEventType] | None = None,
+    ) -> None:
+        """Register a callback for oracle alerts.
+
+        With ``event_types`` the callback only receives those types;
+        by default it receives every alert.
+        """
+        registry: dict[OracleEventType, list[Any]] = (
+            self._async_callbacks
+            if inspect.iscoroutinefunction(callback)
+            else self._sync_callbacks
+        )
+        for event_type in OracleEventType if event_types is None else event_types:
+            registry.setdefault(event_type, []).append(callback)
+            self._subscribed.add(event_type)
+
+    def on_alert_batch(self, callback: OracleAlertBatchCallback) -> None:
+        """Register a callback for batches of oracle alerts.
+
+        Alerts raised during a poll cycle are delivered in one call at
+        the end of the cycle; alerts from direct ``ingest_*`` calls are
+        delivered immediately as a batch of one.
+        """
+        self._batch_callbacks.append(callback)
+        self._subscribed.update(OracleEventType)
 
     async def _emit(self, alert: OracleAlert) -> None:
-        """Dispatch an oracle alert to all registered callbacks."""
-        for cb in self._callbacks:
+        """Dispatch an oracle alert to the callbacks subscribed to its type.
+
+        Sync callbacks run first, then async callbacks are awaited
+        concurrently so one slow sink does not delay the others.
+        """
+        if self._batch_callbacks:
+            if self._outbox is not None:
+                self._outbox.append(alert)
+            else:
+                await self._emit_batch([alert])
+        for cb in self._sync_callbacks.get(alert.event_type, ()):
             try:
                 result = cb(alert)
-                if asyncio.iscoroutine(result):
+                # Plain callables may still hand back an awaitable
+                if result is not None and asyncio.iscoroutine(result):
                     await result
             except Exception:
                 logger.exception(
                     "oracle_alert_callback_error",
                     event_type=alert.event_type,
                 )
+        async_callbacks = self._async_callbacks.get(alert.event_type)
+        if not async_callbacks:
+            return
+        results = await asyncio.gather(
+            *(cb(alert) for cb in async_callbacks),
+            return_exceptions=True,
+        )
+        for outcome in results:
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "oracle_alert_callback_error",
+                    event_type=alert.event_type,
+                    exc_info=outcome,
+                )
+
+    async def _emit_batch(self, alerts: list[OracleAlert]) -> None:
+        """Dispatch a batch of oracle alerts to the batch callbacks."""
+        for cb in self._batch_callbacks:
+            try:
+                result = cb(alerts)
+                if result is not None and asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception(
+                    "oracle_alert_batch_callback_error",
+                    batch_size=len(alerts),
+                )
 
     # ── Ingest Methods ───────────────────────────────────────────
 
@@ -485,12 +876,22 @@ class OracleMonitor:
         """Track a new or updated proposal."""
         cid = proposal.condition_id
         self._proposals[cid] = proposal
-        logger.info(
-            "oracle_proposal_ingested",
-            condition_id=cid,
-            state=proposal.state.value,
-        )
+        if proposal.state == OracleProposalState.DISPUTED:
+            self._disputed_cids.add(cid)
+        else:
+            self._disputed_cids.discard(cid)
+        self._disputes_version += 1
+        self._risk_dirty = True
+        if _std_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "oracle_proposal_ingested",
+                condition_id=cid,
+                state=proposal.state.value,
+            )
 
+        # No subscriber → skip the exposure lookup along with the alert
+        if OracleEventType.PROPOSAL_DETECTED not in self._subscribed:
+            return
         exposure = self._get_held_exposure(cid)
         if exposure > 0:
             await self._emit(OracleAlert(
@@ -519,10 +920,16 @@ class OracleMonitor:
                 disputer=disputer,
             )
             self._proposals[condition_id] = proposal
+            self._disputed_cids.add(condition_id)
+            self._disputes_version += 1
         else:
+            if proposal.state != OracleProposalState.DISPUTED:
+                self._disputed_cids.add(condition_id)
+                self._disputes_version += 1
             proposal.state = OracleProposalState.DISPUTED
             proposal.disputed_at = ts
             proposal.disputer = disputer
+        self._risk_dirty = True
 
         logger.warning(
             "oracle_dispute_detected",
@@ -530,6 +937,8 @@ class OracleMonitor:
             disputer=disputer,
         )
 
+        if OracleEventType.DISPUTE_DETECTED not in self._subscribed:
+            return
         exposure = self._get_held_exposure(condition_id)
         await self._emit(OracleAlert(
             event_type=OracleEventType.DISPUTE_DETECTED,
@@ -561,17 +970,25 @@ class OracleMonitor:
             )
             self._proposals[condition_id] = proposal
         else:
+            # Only a tracked, disputed proposal can be in the disputed index
+            if proposal.state == OracleProposalState.DISPUTED:
+                self._disputed_cids.discard(condition_id)
+                self._disputes_version += 1
             proposal.state = OracleProposalState.SETTLED
             proposal.settled_at = ts
             if outcome:
                 proposal.proposed_outcome = outcome
+        self._risk_dirty = True
 
-        logger.info(
-            "oracle_settlement_detected",
-            condition_id=condition_id,
-            outcome=outcome,
-        )
+        if _std_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "oracle_settlement_detected",
+                condition_id=condition_id,
+                outcome=outcome,
+            )
 
+        if OracleEventType.SETTLEMENT_DETECTED not in self._subscribed:
+            return
         await self._emit(OracleAlert(
             event_type=OracleEventType.SETTLEMENT_DETECTED,
             condition_id=condition_id,
@@ -584,7 +1001,7 @@ class OracleMonitor:
         self, activity: WhaleActivity,
     ) -> None:
         """Process whale activity — alerts only if from a known whale."""
-        if activity.address.lower() not in self._whale_addresses:
+        if not self._is_whale(activity.address):
             return
 
         logger.warning(
@@ -594,6 +1011,8 @@ class OracleMonitor:
             condition_id=activity.condition_id,
         )
 
+        if OracleEventType.WHALE_ACTIVITY_DETECTED not in self._subscribed:
+            return
         exposure = self._get_held_exposure(activity.condition_id)
         await self._emit(OracleAlert(
             event_type=OracleEventType.WHALE_ACTIVITY_DETECTED,
@@ -612,13 +1031,17 @@ class OracleMonitor:
     def clear(self) -> None:
         """Reset all tracked state."""
         self._proposals.clear()
+        self._disputed_cids.clear()
+        self._disputes_version += 1
+        self._risk_dirty = True
+        self._risk_alert_expiry.clear()
 
     def snapshot(self) -> dict[str, object]:
         """Return a snapshot of oracle monitor state."""
         return {
             "tracked_proposals": len(self._proposals),
             "tracked_conditions": len(self._tracked_conditions),
-            "disputed_markets": len(self.disputed_conditions),
+            "disputed_markets": len(self._disputed_cids),
             "exposure_at_risk_usd": float(self.exposure_at_risk()),
             "whale_addresses_count": len(self._whale_addresses),
             "running": self._running,
@@ -626,8 +1049,18 @@ class OracleMonitor:
             "last_poll_at": self._last_poll_at,
         }
 
+    def _is_whale(self, address: str) -> bool:
+        """Whether ``address`` is a configured whale (case-insensitive).
+
+        On-chain addresses usually arrive lowercased already; those skip
+        the ``lower()`` copy.
+        """
+        if not address.islower():
+            address = address.lower()
+        return address in self._whale_addresses
+
     def _get_held_exposure(self, condition_id: str) -> Decimal:
         """Get exposure for a condition from position tracker."""
-        if self._positions is None or not condition_id:
+        if self._positions is None or not condition_id or self._positions.is_empty:
             return Decimal("0")
         return self._positions.exposure_for_condition(condition_id)
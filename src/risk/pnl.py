@@ -7,6 +7,12 @@ from decimal import Decimal
 
 from src.core.types import ExecutionResult, Position, Side
 
+# Enum member attribute lookup (Side.BUY) costs more than the Decimal
+# arithmetic it guards on CPython 3.11, so resolve it once
+_BUY = Side.BUY
+
+_SECS_PER_DAY = 86400.0
+
 
 class PnLTracker:
     """Tracks realized and unrealized P&L with daily reset."""
@@ -15,21 +21,22 @@ class PnLTracker:
         self.realized_total: Decimal = Decimal(0)
         self.realized_today: Decimal = Decimal(0)
         self.trade_count_today: int = 0
-        self._day_start: float = self._current_day_start()
+        self._day_start: float = 0.0
+        self._next_rollover: float = 0.0
+        self._start_day(time.time())
 
-    @staticmethod
-    def _current_day_start() -> float:
-        """Return the UTC epoch of the start of the current day."""
-        now = time.time()
-        return now - (now % 86400)
+    def _start_day(self, now: float) -> None:
+        """Set the UTC day containing ``now`` and its rollover boundary."""
+        self._day_start = now - (now % _SECS_PER_DAY)
+        self._next_rollover = self._day_start + _SECS_PER_DAY
 
     def _maybe_reset_day(self) -> None:
         """Reset daily counters if the UTC day has rolled over."""
         now = time.time()
-        if now >= self._day_start + 86400:
+        if now >= self._next_rollover:
             self.realized_today = Decimal(0)
             self.trade_count_today = 0
-            self._day_start = self._current_day_start()
+            self._start_day(now)
 
     def record_fill(
         self,
@@ -61,7 +68,7 @@ class PnLTracker:
         # Closing fill: compute realized P&L
         close_size = min(fill_size, existing_position.size)
 
-        if existing_position.side == Side.BUY:
+        if existing_position.side == _BUY:
             # Bought at entry, selling at fill → profit = (fill - entry) * size
             realized = (fill_price - existing_position.entry_price) * close_size
         else:
@@ -86,20 +93,33 @@ class PnLTracker:
         Returns:
             Total unrealized P&L.
         """
-        total = Decimal(0)
-        for token_id, pos in positions.items():
-            current = current_prices.get(token_id)
-            if current is None:
-                continue
-            if pos.side == Side.BUY:
-                total += (current - pos.entry_price) * pos.size
-            else:
-                total += (pos.entry_price - current) * pos.size
-        return total
+        # Only tokens present in both mappings contribute, so walk the
+        # smaller one and probe the other
+        if len(current_prices) < len(positions):
+            marks = (
+                (positions[token_id], current)
+                for token_id, current in current_prices.items()
+                if token_id in positions
+            )
+        else:
+            marks = (
+                (pos, current_prices[token_id])
+                for token_id, pos in positions.items()
+                if token_id in current_prices
+            )
+        return sum(
+            (
+                (current - pos.entry_price) * pos.size
+                if pos.side == _BUY
+                else (pos.entry_price - current) * pos.size
+                for pos, current in marks
+            ),
+            Decimal(0),
+        )
 
     def reset(self) -> None:
         """Reset all state (for testing)."""
         self.realized_total = Decimal(0)
         self.realized_today = Decimal(0)
         self.trade_count_today = 0
-        self._day_start = self._current_day_start()
+        self._start_day(time.time())
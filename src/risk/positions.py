@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable, Mapping
 from decimal import Decimal
+from types import MappingProxyType
 
 from src.core.types import ExecutionResult, Position
 
@@ -13,39 +15,84 @@ class PositionTracker:
 
     def __init__(self) -> None:
         self._positions: dict[str, Position] = {}
+        self._positions_view = MappingProxyType(self._positions)
+        # condition_id → token_ids of its open positions
+        self._by_condition: dict[str, set[str]] = {}
+        # Running sum of entry_price * size, maintained by record_fill
+        self._total_exposure: Decimal = Decimal(0)
+        self._version: int = 0
 
     @property
-    def positions(self) -> dict[str, Position]:
-        """Read-only copy of open positions."""
-        return dict(self._positions)
+    def positions(self) -> Mapping[str, Position]:
+        """Read-only live view of open positions."""
+        return self._positions_view
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation, for cheap change detection."""
+        return self._version
 
     @property
     def count(self) -> int:
         """Number of open positions."""
         return len(self._positions)
 
+    @property
+    def is_empty(self) -> bool:
+        """Whether no positions are open."""
+        return not self._positions
+
     def get(self, token_id: str) -> Position | None:
         """Look up a position by token_id."""
         return self._positions.get(token_id)
 
+    def snapshot(self) -> dict[str, Position]:
+        """Independent copy of open positions, keyed by token_id."""
+        return dict(self._positions)
+
     def total_exposure_usd(self) -> Decimal:
         """Total exposure across all open positions (sum of price * size)."""
-        return sum(
-            (p.entry_price * p.size for p in self._positions.values()),
-            Decimal(0),
-        )
+        return self._total_exposure
 
     def exposure_for_condition(self, condition_id: str) -> Decimal:
-        """Total exposure for a specific condition (event)."""
+        """Total exposure for a specific condition (event).
+
+        Reads only that condition's positions via the condition index.
+        """
+        token_ids = self._by_condition.get(condition_id)
+        if not token_ids:
+            return Decimal(0)
+        positions = self._positions
         return sum(
             (
-                p.entry_price * p.size
-                for p in self._positions.values()
-                if p.condition_id == condition_id
+                positions[token_id].entry_price * positions[token_id].size
+                for token_id in token_ids
             ),
             Decimal(0),
         )
 
+    def positions_for_condition(self, condition_id: str) -> list[Position]:
+        """Open positions on a condition (event), via the condition index."""
+        return [
+            self._positions[token_id]
+            for token_id in self._by_condition.get(condition_id, ())
+        ]
+
+    def positions_for_conditions(
+        self, condition_ids: Iterable[str],
+    ) -> list[Position]:
+        """Open positions whose condition ID is in ``condition_ids``.
+
+        Looks each condition up in the index, so the cost is the number
+        of conditions plus matching positions, not the size of the book.
+        """
+        by_condition = self._by_condition
+        return [
+            self._positions[token_id]
+            for condition_id in condition_ids
+            for token_id in by_condition.get(condition_id, ())
+        ]
+
     def record_fill(self, result: ExecutionResult) -> Position | None:
         """Update positions based on an execution result.
 
@@ -57,6 +104,7 @@ class PositionTracker:
         fill_size = result.fill_size or action.size
         fill_side = action.side
         now = time.time()
+        self._version += 1
 
         existing = self._positions.get(token_id)
 
@@ -75,8 +123,12 @@ class PositionTracker:
                 last_updated=now,
             )
             self._positions[token_id] = pos
+            self._by_condition.setdefault(condition_id, set()).add(token_id)
+            self._total_exposure += fill_price * fill_size
             return pos
 
+        before = existing.entry_price * existing.size
+
         if existing.side == fill_side:
             # Same direction → average in
             total_size = existing.size + fill_size
@@ -87,19 +139,54 @@ class PositionTracker:
             existing.entry_price = weighted_price
             existing.size = total_size
             existing.last_updated = now
+            self._total_exposure += weighted_price * total_size - before
             return existing
 
         # Opposite direction → reduce or close
         if fill_size >= existing.size:
             # Close position
             del self._positions[token_id]
+            tokens = self._by_condition.get(existing.condition_id)
+            if tokens is not None:
+                tokens.discard(token_id)
+                if not tokens:
+                    del self._by_condition[existing.condition_id]
+            if self._positions:
+                self._total_exposure -= before
+            else:
+                # Start exactly at zero again once the book is flat
+                self._total_exposure = Decimal(0)
             return None
 
         # Partial reduce
         existing.size = existing.size - fill_size
         existing.last_updated = now
+        self._total_exposure -= existing.entry_price * fill_size
         return existing
 
+    def add(self, position: Position) -> None:
+        """Insert a position directly, replacing any on the same token.
+
+        For seeding state (restores, tests) without replaying fills; keeps
+        the condition index and running exposure total in step.
+        """
+        self._version += 1
+        token_id = position.token_id
+        existing = self._positions.get(token_id)
+        if existing is not None:
+            tokens = self._by_condition.get(existing.condition_id)
+            if tokens is not None:
+                tokens.discard(token_id)
+                if not tokens:
+                    del self._by_condition[existing.condition_id]
+            self._total_exposure -= existing.entry_price * existing.size
+        self._positions[token_id] = position
+        self._by_condition.setdefault(position.condition_id, set()).add(token_id)
+        self._total_exposure += position.entry_price * position.size
+
     def clear(self) -> None:
         """Reset all positions."""
         self._positions.clear()
+        self._by_condition.clear()
+        self._total_exposure = Decimal(0)
+        self._version += 1
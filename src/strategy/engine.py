@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
 
 import structlog
 
@@ -35,6 +37,9 @@ logger = structlog.stdlib.get_logger()
 
 ArbEventCallback = Callable[[ArbEvent], Awaitable[None] | None]
 
+# Most feed events the worker drains from the queue into one batch
+_MAX_BATCH = 16
+
 
 class ArbEngine:
     """Core arbitrage engine — consumes feed events and produces trades.
@@ -81,8 +86,16 @@ class ArbEngine:
         )
         self._quality_filter = quality_filter
 
-        self._callbacks: list[ArbEventCallback] = []
-        self._lock = asyncio.Lock()
+        # Callbacks are classified once at registration so _emit does not
+        # probe every result for a coroutine, and indexed by event type so
+        # events nobody subscribed to are never built
+        self._sync_callbacks: dict[ArbEventType, list[ArbEventCallback]] = {}
+        self._async_callbacks: dict[
+            ArbEventType, list[Callable[[ArbEvent], Awaitable[None]]]
+        ] = {}
+        self._subscribed: set[ArbEventType] = set()
+        self._queue: asyncio.Queue[FeedEvent] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
         self._running = False
 
         # Stats
@@ -113,47 +126,96 @@ class ArbEngine:
             return None
         return self._risk_monitor.snapshot()
 
-    def on_event(self, callback: ArbEventCallback) -> None:
-        """Register a callback for arb engine events."""
-        self._callbacks.append(callback)
+    def on_event(
+        self,
+        callback: ArbEventCallback,
+        event_types: Iterable[ArbEventType] | None = None,
+    ) -> None:
+        """Register a callback for arb engine events.
+
+        With ``event_types`` the callback only receives those types;
+        by default it receives every event.
+        """
+        registry: dict[ArbEventType, list[Any]] = (
+            self._async_callbacks
+            if inspect.iscoroutinefunction(callback)
+            else self._sync_callbacks
+        )
+        for event_type in ArbEventType if event_types is None else event_types:
+            registry.setdefault(event_type, []).append(callback)
+            self._subscribed.add(event_type)
 
     async def _emit(self, event: ArbEvent) -> None:
-        """Dispatch an arb event to all registered callbacks."""
-        for cb in self._callbacks:
+        """Dispatch an arb event to the callbacks subscribed to its type.
+
+        Sync callbacks run first, then async callbacks are awaited
+        concurrently so one slow sink does not delay the others.
+        """
+        for cb in self._sync_callbacks.get(event.event_type, ()):
             try:
                 result = cb(event)
-                if asyncio.iscoroutine(result):
+                # Plain callables may still hand back an awaitable
+                if result is not None and asyncio.iscoroutine(result):
                     await result
             except Exception:
                 logger.exception("arb_event_callback_error", event_type=event.event_type)
+        async_callbacks = self._async_callbacks.get(event.event_type)
+        if not async_callbacks:
+            return
+        results = await asyncio.gather(
+            *(cb(event) for cb in async_callbacks),
+            return_exceptions=True,
+        )
+        for outcome in results:
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "arb_event_callback_error",
+                    event_type=event.event_type,
+                    exc_info=outcome,
+                )
 
     async def start(self) -> None:
         """Start the engine."""
         if self._running:
             return
         self._running = True
+        self._worker = asyncio.create_task(self._consume())
         logger.info("arb_engine_started")
-        await self._emit(ArbEvent(
-            event_type=ArbEventType.ENGINE_STARTED,
-            reason="Engine started",
-            timestamp=time.time(),
-        ))
+        if ArbEventType.ENGINE_STARTED in self._subscribed:
+            await self._emit(ArbEvent(
+                event_type=ArbEventType.ENGINE_STARTED,
+                reason="Engine started",
+                timestamp=time.time(),
+            ))
 
     async def stop(self) -> None:
-        """Stop the engine."""
+        """Stop the engine.
+
+        Feed events already queued are processed before the worker exits.
+        """
         self._running = False
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
         logger.info("arb_engine_stopped", stats=self.stats)
-        await self._emit(ArbEvent(
-            event_type=ArbEventType.ENGINE_STOPPED,
-            reason="Engine stopped",
-            timestamp=time.time(),
-        ))
+        if ArbEventType.ENGINE_STOPPED in self._subscribed:
+            await self._emit(ArbEvent(
+                event_type=ArbEventType.ENGINE_STOPPED,
+                reason="Engine stopped",
+                timestamp=time.time(),
+            ))
 
     async def on_feed_event(self, event: FeedEvent) -> None:
         """Primary entry point — designed to be passed to ``feed.on_event()``.
 
-        Ignores non-DATA_RELEASED events. Uses asyncio.Lock to serialize
-        processing so overlapping events don't cause race conditions.
+        Ignores non-DATA_RELEASED events. Accepted events are queued for
+        the single worker task, so processing stays serialized without
+        holding up the calling feed.
         """
         if not self._running:
             return
@@ -161,8 +223,25 @@ class ArbEngine:
         if event.event_type != FeedEventType.DATA_RELEASED:
             return
 
-        async with self._lock:
-            await self._process_event_internal(event)
+        self._queue.put_nowait(event)
+
+    async def join(self) -> None:
+        """Wait until every queued feed event has been processed."""
+        await self._queue.join()
+
+    async def _consume(self) -> None:
+        """Worker loop — drains queued feed events in small batches."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < _MAX_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._process_batch(batch)
+            except Exception:
+                logger.exception("arb_batch_error", batch_size=len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
 
     async def process_event(self, event: FeedEvent) -> list[ExecutionResult]:
         """Process a feed event and return execution results.
@@ -185,7 +264,7 @@ class ArbEngine:
             return results
 
         for pm in ranked:
-            result = await self._process_match(pm.match)
+            result = await self._process_match(pm.match, time.time())
             if result is not None:
                 if result.success:
                     self._prioritizer.record_trade(
@@ -195,11 +274,28 @@ class ArbEngine:
 
         return results
 
-    async def _process_event_internal(self, event: FeedEvent) -> None:
-        """Internal event processing with callback emission."""
+    async def _process_batch(self, batch: list[FeedEvent]) -> None:
+        """Match a batch of feed events against one opportunities snapshot.
+
+        A condition matched by several events in the batch is only
+        processed for the newest of them.
+        """
         opportunities = self._scanner.opportunities
-        matches = self._matcher.match(event, opportunities)
+        per_event = [self._matcher.match(event, opportunities) for event in batch]
+
+        owner: dict[str, int] = {}
+        for idx, matches in enumerate(per_event):
+            for m in matches:
+                owner[m.opportunity.condition_id] = idx
+
+        for idx, (event, matches) in enumerate(zip(batch, per_event, strict=True)):
+            matches = [m for m in matches if owner[m.opportunity.condition_id] == idx]
+            await self._process_matches(event, matches)
 
+    async def _process_matches(
+        self, event: FeedEvent, matches: list[MatchResult],
+    ) -> None:
+        """Prioritize one event's matches and run each through the pipeline."""
         if not matches:
             logger.debug("no_matches", indicator=event.indicator)
             return
@@ -210,55 +306,64 @@ class ArbEngine:
             return
 
         for pm in ranked:
-            result = await self._process_match(pm.match)
+            result = await self._process_match(pm.match, time.time())
             if result is not None and result.success:
                 self._prioritizer.record_trade(
                     pm.match.opportunity.condition_id,
                 )
 
-    async def _process_match(self, match: MatchResult) -> ExecutionResult | None:
-        """Quality filter → signal → size → execute pipeline for a single match."""
+    async def _process_match(
+        self, match: MatchResult, now: float,
+    ) -> ExecutionResult | None:
+        """Quality filter → signal → size → execute pipeline for a single match.
+
+        ``now`` stamps every event emitted for the match.
+        """
         # Pre-screen market quality (Phase 4.3)
         if self._quality_filter is not None:
             verdict = self._quality_filter.check(match.opportunity)
             if not verdict.approved:
                 self._trades_skipped += 1
-                await self._emit(ArbEvent(
-                    event_type=ArbEventType.RISK_REJECTED,
-                    reason=f"Market quality: {verdict.detail}",
-                    timestamp=time.time(),
-                ))
+                if ArbEventType.RISK_REJECTED in self._subscribed:
+                    await self._emit(ArbEvent(
+                        event_type=ArbEventType.RISK_REJECTED,
+                        reason=f"Market quality: {verdict.detail}",
+                        timestamp=now,
+                    ))
                 return None
 
         # Generate signal
         signal = self._signal_gen.evaluate(match)
         if signal is None:
             self._trades_skipped += 1
-            await self._emit(ArbEvent(
-                event_type=ArbEventType.TRADE_SKIPPED,
-                reason="No actionable signal",
-                timestamp=time.time(),
-            ))
+            if ArbEventType.TRADE_SKIPPED in self._subscribed:
+                await self._emit(ArbEvent(
+                    event_type=ArbEventType.TRADE_SKIPPED,
+                    reason="No actionable signal",
+                    timestamp=now,
+                ))
             return None
 
         self._signals_generated += 1
-        await self._emit(ArbEvent(
-            event_type=ArbEventType.SIGNAL_GENERATED,
-            signal=signal,
-            reason=match.match_reason,
-            timestamp=time.time(),
-        ))
+        if ArbEventType.SIGNAL_GENERATED in self._subscribed:
+            await self._emit(ArbEvent(
+                event_type=ArbEventType.SIGNAL_GENERATED,
+                signal=signal,
+                reason=match.match_reason,
+                timestamp=now,
+            ))
 
         # Size position
         action = self._sizer.size(signal)
         if action is None:
             self._trades_skipped += 1
-            await self._emit(ArbEvent(
-                event_type=ArbEventType.TRADE_SKIPPED,
-                signal=signal,
-                reason="Position sizing returned None",
-                timestamp=time.time(),
-            ))
+            if ArbEventType.TRADE_SKIPPED in self._subscribed:
+                await self._emit(ArbEvent(
+                    event_type=ArbEventType.TRADE_SKIPPED,
+                    signal=signal,
+                    reason="Position sizing returned None",
+                    timestamp=now,
+                ))
             return None
 
         # Risk check
@@ -266,22 +371,27 @@ class ArbEngine:
             verdict = self._risk_monitor.check_trade(action)
             if not verdict.approved:
                 self._trades_skipped += 1
-                await self._emit(ArbEvent(
-                    event_type=ArbEventType.RISK_REJECTED,
-                    signal=signal,
-                    action=action,
-                    reason=verdict.detail,
-                    timestamp=time.time(),
-                ))
+                if ArbEventType.RISK_REJECTED in self._subscribed:
+                    await self._emit(ArbEvent(
+                        event_type=ArbEventType.RISK_REJECTED,
+                        signal=signal,
+                        action=action,
+                        reason=verdict.detail,
+                        timestamp=now,
+                    ))
                 return None
 
         # Execute
-        result = await self._execute_action(action)
+        result = await self._execute_action(action, now)
         return result
 
-    async def _execute_action(self, action: TradeAction) -> ExecutionResult:
-        """Execute a trade action via the Polymarket client."""
-        now = time.time()
+    async def _execute_action(
+        self, action: TradeAction, now: float,
+    ) -> ExecutionResult:
+        """Execute a trade action via the Polymarket client.
+
+        ``now`` is the match timestamp from ``_process_match``.
+        """
 
         try:
             if action.order_type == OrderType.FOK:
@@ -330,14 +440,15 @@ class ArbEngine:
                     price=float(action.price),
                     edge=float(action.signal.edge),
                 )
-                await self._emit(ArbEvent(
-                    event_type=ArbEventType.TRADE_EXECUTED,
-                    signal=action.signal,
-                    action=action,
-                    result=result,
-                    reason=action.reason,
-                    timestamp=now,
-                ))
+                if ArbEventType.TRADE_EXECUTED in self._subscribed:
+                    await self._emit(ArbEvent(
+                        event_type=ArbEventType.TRADE_EXECUTED,
+                        signal=action.signal,
+                        action=action,
+                        result=result,
+                        reason=action.reason,
+                        timestamp=now,
+                    ))
             else:
                 self._trades_failed += 1
                 logger.warning(
@@ -345,14 +456,15 @@ class ArbEngine:
                     token_id=action.token_id,
                     response=response.raw,
                 )
-                await self._emit(ArbEvent(
-                    event_type=ArbEventType.TRADE_FAILED,
-                    signal=action.signal,
-                    action=action,
-                    result=result,
-                    reason="Order not successful",
-                    timestamp=now,
-                ))
+                if ArbEventType.TRADE_FAILED in self._subscribed:
+                    await self._emit(ArbEvent(
+                        event_type=ArbEventType.TRADE_FAILED,
+                        signal=action.signal,
+                        action=action,
+                        result=result,
+                        reason="Order not successful",
+                        timestamp=now,
+                    ))
 
             return result
 
@@ -367,12 +479,13 @@ class ArbEngine:
                 executed_at=now,
                 error=error_msg,
             )
-            await self._emit(ArbEvent(
-                event_type=ArbEventType.TRADE_FAILED,
-                signal=action.signal,
-                action=action,
-                result=result,
-                reason=error_msg,
-                timestamp=now,
-            ))
+            if ArbEventType.TRADE_FAILED in self._subscribed:
+                await self._emit(ArbEvent(
+                    event_type=ArbEventType.TRADE_FAILED,
+                    signal=action.signal,
+                    action=action,
+                    result=result,
+                    reason=error_msg,
+                    timestamp=now,
+                ))
             return result
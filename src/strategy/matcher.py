@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -19,9 +22,14 @@ from src.core.types import (
 logger = structlog.stdlib.get_logger()
 
 # Regex for threshold extraction: "CPI above 3.0%", "BTC over $50,000", etc.
+# The word boundary keeps "moreover 5" from reading as "over 5", and the
+# bounded, possessive number groups keep run time linear in the question.
+# The trailing lookahead rejects numbers the groups would otherwise cut
+# short ("3.1234567", "50,00") instead of matching a truncated prefix,
+# while still allowing punctuation after the number ("$100,000, per").
 _THRESHOLD_PATTERN = re.compile(
-    r"(above|below|over|under|exceed|exceeds?)\s+"
-    r"\$?([\d,]+(?:\.\d+)?)\s*%?",
+    r"\b(above|below|over|under|exceeds?)\s+"
+    r"\$?(\d{1,15}(?:,\d{3})*+(?:\.\d{1,6})?+)(?!\d|[,.]\d)\s*%?",
     re.IGNORECASE,
 )
 
@@ -36,9 +44,19 @@ _DIRECTION_MAP: dict[str, str] = {
 }
 
 # Articles to strip for team name normalization
-_ARTICLES = {"the", "a", "an"}
+_ARTICLES: frozenset[str] = frozenset({"the", "a", "an"})
 
+# Confidence attached to each category's matches; a category whose
+# confidence is below the matcher's threshold is skipped outright
+_ECONOMIC_CONFIDENCE = 0.95
+_SPORTS_CONFIDENCE = 0.95
+_CRYPTO_CONFIDENCE = 0.90
 
+# Bound on remembered (category, needle) candidate lists per index
+_MAX_HIT_KEYS = 256
+
+
+@lru_cache(maxsize=4096)
 def _extract_threshold_from_question(
     question: str,
 ) -> tuple[Decimal, str] | None:
@@ -49,7 +67,8 @@ def _extract_threshold_from_question(
         "Will BTC exceed $50,000?" → (Decimal("50000"), "above")
         "Will unemployment fall below 4.5%?" → (Decimal("4.5"), "below")
 
-    Returns None if no threshold pattern is found.
+    Returns None if no threshold pattern is found. Cached by question
+    text, so a condition re-listed after eviction skips the regex.
     """
     match = _THRESHOLD_PATTERN.search(question)
     if match is None:
@@ -67,14 +86,14 @@ def _extract_threshold_from_question(
     return threshold, direction
 
 
+@lru_cache(maxsize=1024)
 def _normalize_team_name(name: str) -> str:
     """Normalize a team name for fuzzy matching.
 
     Lowercases, strips leading articles, and collapses whitespace.
+    Cached, since the same few team names recur across events.
     """
-    words = name.lower().split()
-    words = [w for w in words if w not in _ARTICLES]
-    return " ".join(words).strip()
+    return " ".join(w for w in name.lower().split() if w not in _ARTICLES)
 
 
 def _team_in_question(team_name: str, question: str) -> bool:
@@ -84,8 +103,11 @@ def _team_in_question(team_name: str, question: str) -> bool:
     short names (e.g. "Nuggets vs Clippers") by also checking individual
     words of the team name (length > 3 to avoid "LA", "FC", "NY").
     """
-    normalized = _normalize_team_name(team_name)
-    question_lower = question.lower()
+    return _team_in_lowered(_normalize_team_name(team_name), question.lower())
+
+
+def _team_in_lowered(normalized: str, question_lower: str) -> bool:
+    """``_team_in_question`` on an already normalized name and question."""
     if not normalized:
         return False
     # Full name match
@@ -127,11 +149,143 @@ def _find_token_for_outcome(
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class _QuestionInfo:
+    """Derived forms of a market question, computed once per opportunity."""
+
+    question: str
+    lower: str
+    upper: str
+    threshold: tuple[Decimal, str] | None
+
+
 class MarketMatcher:
     """Matches feed events to tracked market opportunities."""
 
     def __init__(self, match_confidence_threshold: float = 0.8) -> None:
         self._threshold = match_confidence_threshold
+        # condition_id → derived question forms, so the lower/upper copies
+        # and the threshold regex run once per opportunity, not per event
+        self._questions: dict[str, _QuestionInfo] = {}
+        # MarketCategory → condition_ids, rebuilt only when the set of
+        # condition_ids passed in changes
+        self._by_category: dict[MarketCategory, list[str]] = {}
+        self._indexed: dict[str, MarketOpportunity] | None = None
+        self._indexed_ids: frozenset[str] = frozenset()
+        # (category, needle) → condition_ids whose question the needle hit,
+        # valid until the index is rebuilt
+        self._hits: dict[tuple[MarketCategory, str], list[str]] = {}
+        # condition_id → (tokens list, lowercased outcome → token_id), so
+        # exact outcome lookups skip the per-token lower() scan
+        self._outcomes: dict[str, tuple[list[dict[str, Any]], dict[str, str]]] = {}
+
+    def _question_info(self, opp: MarketOpportunity) -> _QuestionInfo:
+        """Cached derived forms of ``opp.question``, refreshed if it changed."""
+        info = self._questions.get(opp.condition_id)
+        if info is None or info.question != opp.question:
+            question = opp.question
+            info = _QuestionInfo(
+                question=question,
+                lower=question.lower(),
+                upper=question.upper(),
+                threshold=_extract_threshold_from_question(question),
+            )
+            self._questions[opp.condition_id] = info
+        return info
+
+    def _token_for_outcome(
+        self, opp: MarketOpportunity, outcome: str, outcome_lower: str,
+    ) -> str | None:
+        """``_find_token_for_outcome`` with a cached exact-match table.
+
+        Only a miss on the exact table falls back to the partial scan.
+        """
+        entry = self._outcomes.get(opp.condition_id)
+        if entry is None or entry[0] is not opp.tokens:
+            table: dict[str, str] = {}
+            for token in opp.tokens:
+                table.setdefault(
+                    str(token.get("outcome", "")).lower(),
+                    str(token.get("token_id", "")),
+                )
+            entry = (opp.tokens, table)
+            self._outcomes[opp.condition_id] = entry
+        token_id = entry[1].get(outcome_lower)
+        if token_id is not None:
+            return token_id
+        return _find_token_for_outcome(opp.tokens, outcome)
+
+    def _evict_questions(
+        self, opportunities: dict[str, MarketOpportunity],
+    ) -> None:
+        """Drop cached questions once the cache outgrows the live set."""
+        if len(self._questions) > 2 * len(opportunities) + 16:
+            self._questions = {
+                cid: info
+                for cid, info in self._questions.items()
+                if cid in opportunities
+            }
+        if len(self._outcomes) > 2 * len(opportunities) + 16:
+            self._outcomes = {
+                cid: entry
+                for cid, entry in self._outcomes.items()
+                if cid in opportunities
+            }
+
+    def update_index(self, opportunities: dict[str, MarketOpportunity]) -> None:
+        """Bucket ``opportunities`` by category for the ``_match_*`` walks.
+
+        ``match`` calls this itself whenever the set of condition_ids it
+        is given changes. Call it directly after swapping members of a
+        mapping in place, or after a condition's question or category
+        changes.
+        """
+        buckets: dict[MarketCategory, list[str]] = {}
+        for cid, opp in opportunities.items():
+            buckets.setdefault(opp.category, []).append(cid)
+        self._by_category = buckets
+        self._indexed = opportunities
+        self._indexed_ids = frozenset(opportunities)
+        self._hits.clear()
+        self._evict_questions(opportunities)
+
+    def _ensure_index(self, opportunities: dict[str, MarketOpportunity]) -> None:
+        """Rebuild the category index if the condition_ids have changed."""
+        if opportunities is self._indexed and len(opportunities) == len(self._indexed_ids):
+            return
+        if opportunities.keys() == self._indexed_ids:
+            # A fresh snapshot of the same markets keeps the index
+            self._indexed = opportunities
+            return
+        self.update_index(opportunities)
+
+    def _candidates(
+        self,
+        opportunities: dict[str, MarketOpportunity],
+        category: MarketCategory,
+        needle: str,
+        hit: Callable[[MarketOpportunity], bool],
+    ) -> list[MarketOpportunity]:
+        """Opportunities of ``category`` whose question ``hit`` accepts.
+
+        The condition_ids that ``needle`` hit are remembered until the
+        index is rebuilt, so repeat events for the same indicator, pair
+        or teams skip the walk over the category. Values are read from
+        the live mapping so updated quotes are seen.
+        """
+        self._ensure_index(opportunities)
+        key = (category, needle)
+        cids = self._hits.get(key)
+        if cids is None:
+            if len(self._hits) >= _MAX_HIT_KEYS:
+                self._hits.clear()
+            cids = [
+                cid
+                for cid in self._by_category.get(category, ())
+                if (opp := opportunities.get(cid)) is not None and hit(opp)
+            ]
+            self._hits[key] = cids
+        return [opportunities[cid] for cid in cids if cid in opportunities]
 
     def match(
         self,
@@ -157,46 +311,52 @@ class MarketMatcher:
     ) -> list[MatchResult]:
         """Match economic data releases to ECONOMIC-category markets."""
         results: list[MatchResult] = []
-        indicator_lower = event.indicator.lower()
-
-        for opp in opportunities.values():
-            if opp.category != MarketCategory.ECONOMIC:
-                continue
-
-            question_lower = opp.question.lower()
-            if indicator_lower not in question_lower:
-                continue
-
-            # Parse threshold from question
-            threshold_info = _extract_threshold_from_question(opp.question)
-            if threshold_info is None or event.numeric_value is None:
+        if _ECONOMIC_CONFIDENCE < self._threshold:
+            return results
+        # Event fields read once, outside the per-opportunity loop
+        numeric_value = event.numeric_value
+        if numeric_value is None:
+            return results
+        indicator = event.indicator
+        indicator_lower = indicator.lower()
+        question_info = self._question_info
+        candidates = self._candidates(
+            opportunities,
+            MarketCategory.ECONOMIC,
+            indicator_lower,
+            lambda opp: indicator_lower in question_info(opp).lower,
+        )
+
+        for opp in candidates:
+            # Threshold parsed from the question
+            threshold_info = question_info(opp).threshold
+            if threshold_info is None:
                 continue
 
             threshold, direction = threshold_info
 
             # Determine which outcome is correct
             if direction == "above":
-                outcome = "Yes" if event.numeric_value > threshold else "No"
+                resolved_yes = numeric_value > threshold
             else:
-                outcome = "Yes" if event.numeric_value < threshold else "No"
+                resolved_yes = numeric_value < threshold
+            outcome, outcome_lower = ("Yes", "yes") if resolved_yes else ("No", "no")
 
-            token_id = _find_token_for_outcome(opp.tokens, outcome)
+            token_id = self._token_for_outcome(opp, outcome, outcome_lower)
             if token_id is None:
                 continue
 
-            match_result = MatchResult(
+            results.append(MatchResult(
                 feed_event=event,
                 opportunity=opp,
                 target_token_id=token_id,
                 target_outcome=outcome,
-                match_confidence=0.95,
+                match_confidence=_ECONOMIC_CONFIDENCE,
                 match_reason=(
-                    f"{event.indicator}={event.numeric_value} "
+                    f"{indicator}={numeric_value} "
                     f"vs threshold {threshold} ({direction}) → {outcome}"
                 ),
-            )
-            if match_result.match_confidence >= self._threshold:
-                results.append(match_result)
+            ))
 
         return results
 
@@ -207,34 +367,48 @@ class MarketMatcher:
     ) -> list[MatchResult]:
         """Match sports results to SPORTS-category markets."""
         results: list[MatchResult] = []
+        if _SPORTS_CONFIDENCE < self._threshold:
+            return results
         winner = event.metadata.get("winner", "")
         home_team = event.metadata.get("home_team", "")
         away_team = event.metadata.get("away_team", "")
 
-        if not winner:
+        # No winner, or no teams to find in a question: nothing can match
+        if not winner or not (home_team or away_team):
             return results
 
-        for opp in opportunities.values():
-            if opp.category != MarketCategory.SPORTS:
-                continue
-
-            # Check if either team appears in the question
-            home_in = _team_in_question(home_team, opp.question) if home_team else False
-            away_in = _team_in_question(away_team, opp.question) if away_team else False
+        # Normalize the event's team names once, not per opportunity
+        home_norm = _normalize_team_name(home_team) if home_team else ""
+        away_norm = _normalize_team_name(away_team) if away_team else ""
+        winner_norm = _normalize_team_name(winner)
+        winner_lower = winner.lower()
+        question_info = self._question_info
+
+        def either_team_in(opp: MarketOpportunity) -> bool:
+            """Whether either team appears in the question."""
+            question_lower = question_info(opp).lower
+            return _team_in_lowered(home_norm, question_lower) or _team_in_lowered(
+                away_norm, question_lower,
+            )
 
-            if not home_in and not away_in:
-                continue
+        candidates = self._candidates(
+            opportunities,
+            MarketCategory.SPORTS,
+            f"{home_team}\x00{away_team}",
+            either_team_in,
+        )
 
+        for opp in candidates:
             # Try to find a token matching the winner's name
-            token_id = _find_token_for_outcome(opp.tokens, winner)
+            token_id = self._token_for_outcome(opp, winner, winner_lower)
 
             # Fallback: if winner matches one team, try "Yes" outcome
             if token_id is None:
-                if _team_in_question(winner, opp.question):
-                    token_id = _find_token_for_outcome(opp.tokens, "Yes")
+                if _team_in_lowered(winner_norm, question_info(opp).lower):
+                    token_id = self._token_for_outcome(opp, "Yes", "yes")
                     outcome = "Yes"
                 else:
-                    token_id = _find_token_for_outcome(opp.tokens, "No")
+                    token_id = self._token_for_outcome(opp, "No", "no")
                     outcome = "No"
             else:
                 outcome = winner
@@ -242,16 +416,14 @@ class MarketMatcher:
             if token_id is None:
                 continue
 
-            match_result = MatchResult(
+            results.append(MatchResult(
                 feed_event=event,
                 opportunity=opp,
                 target_token_id=token_id,
                 target_outcome=outcome,
-                match_confidence=0.95,
+                match_confidence=_SPORTS_CONFIDENCE,
                 match_reason=f"Winner={winner}, outcome={outcome}",
-            )
-            if match_result.match_confidence >= self._threshold:
-                results.append(match_result)
+            ))
 
         return results
 
@@ -262,49 +434,55 @@ class MarketMatcher:
     ) -> list[MatchResult]:
         """Match crypto price moves to CRYPTO-category markets."""
         results: list[MatchResult] = []
+        if _CRYPTO_CONFIDENCE < self._threshold:
+            return results
         pair = event.indicator.upper()
+        # Match common representations: BTC, BITCOIN, BTC_USDT, etc.
+        pair_parts = pair.replace("_", " ").split()
+        base_symbol = pair_parts[0] if pair_parts else pair
 
-        for opp in opportunities.values():
-            if opp.category != MarketCategory.CRYPTO:
-                continue
-
-            # Check if the crypto pair is referenced in the question
-            question_upper = opp.question.upper()
-            # Match common representations: BTC, BITCOIN, BTC_USDT, etc.
-            pair_parts = pair.replace("_", " ").split()
-            base_symbol = pair_parts[0] if pair_parts else pair
-
-            if base_symbol not in question_upper:
-                continue
-
-            # Parse threshold from question
-            threshold_info = _extract_threshold_from_question(opp.question)
-            if threshold_info is None or event.numeric_value is None:
+        # Event fields read once, outside the per-opportunity loop
+        numeric_value = event.numeric_value
+        if numeric_value is None:
+            return results
+        question_info = self._question_info
+
+        # Markets whose question references the crypto pair
+        candidates = self._candidates(
+            opportunities,
+            MarketCategory.CRYPTO,
+            base_symbol,
+            lambda opp: base_symbol in question_info(opp).upper,
+        )
+
+        for opp in candidates:
+            # Threshold parsed from the question
+            threshold_info = question_info(opp).threshold
+            if threshold_info is None:
                 continue
 
             threshold, direction = threshold_info
 
             if direction == "above":
-                outcome = "Yes" if event.numeric_value > threshold else "No"
+                resolved_yes = numeric_value > threshold
             else:
-                outcome = "Yes" if event.numeric_value < threshold else "No"
+                resolved_yes = numeric_value < threshold
+            outcome, outcome_lower = ("Yes", "yes") if resolved_yes else ("No", "no")
 
-            token_id = _find_token_for_outcome(opp.tokens, outcome)
+            token_id = self._token_for_outcome(opp, outcome, outcome_lower)
             if token_id is None:
                 continue
 
-            match_result = MatchResult(
+            results.append(MatchResult(
                 feed_event=event,
                 opportunity=opp,
                 target_token_id=token_id,
                 target_outcome=outcome,
-                match_confidence=0.90,
+                match_confidence=_CRYPTO_CONFIDENCE,
                 match_reason=(
-                    f"{pair}={event.numeric_value} "
+                    f"{pair}={numeric_value} "
                     f"vs threshold {threshold} ({direction}) → {outcome}"
                 ),
-            )
-            if match_result.match_confidence >= self._threshold:
-                results.append(match_result)
+            ))
 
         return results
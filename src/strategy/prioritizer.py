@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import heapq
 import time
 from decimal import Decimal
+from operator import itemgetter
 
 import structlog
 
 from src.core.config import PrioritizerConfig
-from src.core.types import MatchResult, PrioritizedMatch
+from src.core.types import MarketCategory, MatchResult, PrioritizedMatch
 
 logger = structlog.stdlib.get_logger()
 
+# Assumed fair value of a resolved outcome token, for edge estimates
+_FAIR_VALUE = Decimal("0.99")
+
 
 def _estimate_edge(match: MatchResult) -> float:
     """Estimate edge from market price vs assumed fair value (~0.99).
@@ -22,10 +27,9 @@ def _estimate_edge(match: MatchResult) -> float:
     ask = match.opportunity.best_ask
     if ask is None:
         return 0.0
-    fair = Decimal("0.99")
-    if ask >= fair:
+    if ask >= _FAIR_VALUE:
         return 0.0
-    raw = float((fair - ask) / fair)
+    raw = float((_FAIR_VALUE - ask) / _FAIR_VALUE)
     return min(max(raw, 0.0), 1.0)
 
 
@@ -41,27 +45,55 @@ def compute_priority_score(
     - edge: estimated edge from market price
     - category: lookup from category_weights config
     """
-    opp_score = match.opportunity.score
-    confidence = match.match_confidence
-    edge = _estimate_edge(match)
-    cat_key = match.opportunity.category.value
-    cat_weight = config.category_weights.get(cat_key, 0.3)
-
-    components = {
-        "opportunity": opp_score,
-        "confidence": confidence,
-        "edge": edge,
-        "category": cat_weight,
+    total, components, _ = _score_matches(
+        [match], config, _category_weight_table(config),
+    )[0]
+    return total, components
+
+
+def _category_weight_table(config: PrioritizerConfig) -> dict[MarketCategory, float]:
+    """Resolve ``category_weights`` (keyed by name) for every MarketCategory."""
+    return {
+        category: config.category_weights.get(category.value, 0.3)
+        for category in MarketCategory
     }
 
-    total = (
-        config.score_weight_opportunity * opp_score
-        + config.score_weight_confidence * confidence
-        + config.score_weight_edge * edge
-        + config.score_weight_category * cat_weight
-    )
 
-    return total, components
+def _score_matches(
+    matches: list[MatchResult],
+    config: PrioritizerConfig,
+    category_weights: dict[MarketCategory, float],
+) -> list[tuple[float, dict[str, float], MatchResult]]:
+    """``compute_priority_score`` over a batch, reading config weights once."""
+    w_opp = config.score_weight_opportunity
+    w_conf = config.score_weight_confidence
+    w_edge = config.score_weight_edge
+    w_cat = config.score_weight_category
+
+    scored: list[tuple[float, dict[str, float], MatchResult]] = []
+    for match in matches:
+        opp = match.opportunity
+        opp_score = opp.score
+        confidence = match.match_confidence
+        edge = _estimate_edge(match)
+        cat_weight = category_weights[opp.category]
+
+        components = {
+            "opportunity": opp_score,
+            "confidence": confidence,
+            "edge": edge,
+            "category": cat_weight,
+        }
+
+        total = (
+            w_opp * opp_score
+            + w_conf * confidence
+            + w_edge * edge
+            + w_cat * cat_weight
+        )
+        scored.append((total, components, match))
+
+    return scored
 
 
 class OpportunityPrioritizer:
@@ -69,7 +101,12 @@ class OpportunityPrioritizer:
 
     def __init__(self, config: PrioritizerConfig | None = None) -> None:
         self._config = config or PrioritizerConfig()
+        # MarketCategory → weight, so scoring skips the enum .value lookup
+        self._category_weights = _category_weight_table(self._config)
         self._cooldowns: dict[str, float] = {}
+        # (expiry_ts, condition_id) min-heap for expiry cleanup; entries
+        # whose expiry no longer matches _cooldowns are stale and skipped
+        self._cooldown_heap: list[tuple[float, str]] = []
 
     @property
     def cooldowns(self) -> dict[str, float]:
@@ -90,15 +127,12 @@ class OpportunityPrioritizer:
         if not filtered:
             return []
 
-        scored: list[tuple[float, dict[str, float], MatchResult]] = []
-        for m in filtered:
-            total, components = compute_priority_score(m, self._config)
-            scored.append((total, components, m))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
+        scored = _score_matches(filtered, self._config, self._category_weights)
 
+        # Only the top ``cap`` are kept, so select rather than sort them
+        # all; ties keep input order, as with a stable descending sort.
         cap = self._config.max_trades_per_event
-        capped = scored[:cap]
+        capped = heapq.nlargest(cap, scored, key=itemgetter(0))
 
         result: list[PrioritizedMatch] = []
         for rank_idx, (total, components, m) in enumerate(capped, start=1):
@@ -120,7 +154,9 @@ class OpportunityPrioritizer:
 
     def record_trade(self, condition_id: str) -> None:
         """Start a cooldown timer for the given condition_id."""
-        self._cooldowns[condition_id] = time.time() + self._config.cooldown_secs
+        expiry = time.time() + self._config.cooldown_secs
+        self._cooldowns[condition_id] = expiry
+        heapq.heappush(self._cooldown_heap, (expiry, condition_id))
         logger.debug(
             "cooldown_started",
             condition_id=condition_id,
@@ -134,6 +170,7 @@ class OpportunityPrioritizer:
     def clear_all_cooldowns(self) -> None:
         """Clear all active cooldowns."""
         self._cooldowns.clear()
+        self._cooldown_heap.clear()
 
     def _filter_cooldowns(
         self,
@@ -141,12 +178,16 @@ class OpportunityPrioritizer:
         now: float,
     ) -> list[MatchResult]:
         """Remove matches on cooldown and clean up expired entries."""
-        # Clean expired cooldowns
-        expired = [
-            cid for cid, expiry in self._cooldowns.items() if expiry <= now
-        ]
-        for cid in expired:
-            del self._cooldowns[cid]
+        # Clean expired cooldowns, earliest first, off the heap
+        heap = self._cooldown_heap
+        cooldowns = self._cooldowns
+        while heap and heap[0][0] <= now:
+            expiry, cid = heapq.heappop(heap)
+            if cooldowns.get(cid) == expiry:
+                del cooldowns[cid]
+
+        if not cooldowns:
+            return matches
 
         # Filter out matches still on cooldown
         result: list[MatchResult] = []
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from decimal import Decimal
 
 import structlog
 
 from src.core.config import StrategyConfig
 from src.core.types import (
+    FeedEvent,
     FeedType,
     MatchResult,
     OutcomeType,
@@ -18,6 +20,9 @@ from src.core.types import (
 
 logger = structlog.stdlib.get_logger()
 
+# Fair value of the token a released outcome resolves to (~1.00)
+_FAIR_VALUE = Decimal("0.99")
+
 
 def _determine_direction_and_price(
     fair_value: Decimal,
@@ -47,6 +52,29 @@ class SignalGenerator:
 
         self._config = config or get_settings().strategy
 
+        # Minimum edge per feed type, resolved once from the config
+        self._default_min_edge = Decimal(str(self._config.min_edge))
+        overrides = {
+            FeedType.ECONOMIC: self._config.economic_min_edge,
+            FeedType.SPORTS: self._config.sports_min_edge,
+            FeedType.CRYPTO: self._config.crypto_min_edge,
+        }
+        self._min_edges: dict[FeedType, Decimal] = {
+            feed_type: (
+                self._default_min_edge if override is None else Decimal(str(override))
+            )
+            for feed_type, override in overrides.items()
+        }
+
+        # OutcomeType → confidence rule, looked up once per match
+        self._confidence_rules: dict[
+            OutcomeType, Callable[[FeedEvent], float | None]
+        ] = {
+            OutcomeType.CATEGORICAL: self._categorical_confidence,
+            OutcomeType.NUMERIC: self._threshold_confidence,
+            OutcomeType.BOOLEAN: self._threshold_confidence,
+        }
+
     def evaluate(self, match: MatchResult) -> Signal | None:
         """Evaluate a match result and produce a signal if actionable.
 
@@ -56,10 +84,13 @@ class SignalGenerator:
         - Event is too stale
         - Confidence is below threshold
         """
-        now = time.time()
-
-        # Check staleness
         event = match.feed_event
+        confidence_rule = self._confidence_rules.get(event.outcome_type)
+        if confidence_rule is None:
+            return None
+
+        # Check staleness (wall clock, to compare with received_at)
+        now = time.time()
         event_age = now - event.received_at if event.received_at > 0 else 0.0
         if event_age > self._config.max_staleness_secs:
             logger.debug(
@@ -69,47 +100,34 @@ class SignalGenerator:
             )
             return None
 
-        # Route by outcome type
-        if event.outcome_type == OutcomeType.CATEGORICAL:
-            return self._evaluate_categorical(match, now)
-        if event.outcome_type in (OutcomeType.NUMERIC, OutcomeType.BOOLEAN):
-            return self._evaluate_numeric_threshold(match, now)
-
-        return None
-
-    def _evaluate_categorical(
-        self, match: MatchResult, now: float,
-    ) -> Signal | None:
-        """Evaluate categorical outcomes (e.g. sports: winner = TeamA).
-
-        For deterministic game results, the winning token's fair value is ~1.00.
-        """
-        # For completed games, the winner's token is worth ~1.00
-        fair_value = Decimal("0.99")
-        confidence = 0.99
+        confidence = confidence_rule(event)
+        if confidence is None:
+            return None
 
         opp = match.opportunity
         direction_result = _determine_direction_and_price(
-            fair_value, opp.best_bid, opp.best_ask,
+            _FAIR_VALUE, opp.best_bid, opp.best_ask,
         )
         if direction_result is None:
             return None
 
         direction, current_price = direction_result
-        edge = abs(fair_value - current_price)
+        edge = abs(_FAIR_VALUE - current_price)
 
-        min_edge = self._get_min_edge(match.feed_event.feed_type)
+        # Minimum edge, with per-category overrides
+        min_edge = self._min_edges.get(event.feed_type, self._default_min_edge)
         if edge < min_edge:
             logger.debug(
                 "signal_rejected_low_edge",
                 edge=float(edge),
                 min_edge=float(min_edge),
+                feed_type=event.feed_type,
             )
             return None
 
         return Signal(
             match=match,
-            fair_value=fair_value,
+            fair_value=_FAIR_VALUE,
             confidence=confidence,
             direction=direction,
             edge=edge,
@@ -117,16 +135,21 @@ class SignalGenerator:
             created_at=now,
         )
 
-    def _evaluate_numeric_threshold(
-        self, match: MatchResult, now: float,
-    ) -> Signal | None:
-        """Evaluate numeric threshold outcomes (economic/crypto).
+    def _categorical_confidence(self, event: FeedEvent) -> float | None:
+        """Confidence for categorical outcomes (e.g. sports: winner = TeamA).
 
-        When the actual value clearly exceeds the threshold, the correct
-        outcome token has fair_value ≈ 1.00 (deterministic).
+        Completed game results are deterministic, so the winner's token is
+        worth ~1.00.
         """
-        event = match.feed_event
+        return 0.99
+
+    def _threshold_confidence(self, event: FeedEvent) -> float | None:
+        """Confidence for numeric threshold outcomes (economic/crypto).
 
+        When the actual value clearly exceeds the threshold, the correct
+        outcome token has fair_value ≈ 1.00 (deterministic). Returns None
+        if the confidence is below ``min_confidence``.
+        """
         # For deterministic data releases (CPI published, etc.), high confidence
         if event.feed_type == FeedType.CRYPTO:
             # Crypto prices can revert — lower confidence
@@ -147,47 +170,4 @@ class SignalGenerator:
                 feed_type=event.feed_type,
             )
             return None
-
-        fair_value = Decimal("0.99")
-
-        opp = match.opportunity
-        direction_result = _determine_direction_and_price(
-            fair_value, opp.best_bid, opp.best_ask,
-        )
-        if direction_result is None:
-            return None
-
-        direction, current_price = direction_result
-        edge = abs(fair_value - current_price)
-
-        min_edge = self._get_min_edge(event.feed_type)
-        if edge < min_edge:
-            logger.debug(
-                "signal_rejected_low_edge",
-                edge=float(edge),
-                min_edge=float(min_edge),
-                feed_type=event.feed_type,
-            )
-            return None
-
-        return Signal(
-            match=match,
-            fair_value=fair_value,
-            confidence=confidence,
-            direction=direction,
-            edge=edge,
-            current_price=current_price,
-            created_at=now,
-        )
-
-    def _get_min_edge(self, feed_type: FeedType) -> Decimal:
-        """Get minimum edge threshold, with per-category overrides."""
-        override_map = {
-            FeedType.ECONOMIC: self._config.economic_min_edge,
-            FeedType.SPORTS: self._config.sports_min_edge,
-            FeedType.CRYPTO: self._config.crypto_min_edge,
-        }
-        override = override_map.get(feed_type)
-        if override is not None:
-            return Decimal(str(override))
-        return Decimal(str(self._config.min_edge))
+        return confidence
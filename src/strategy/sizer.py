@@ -17,6 +17,13 @@ from src.core.types import (
 
 logger = structlog.stdlib.get_logger()
 
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+# Basis points per unit, for fee_rate_bps → fee rate
+_BPS = Decimal(10000)
+# Largest fraction of visible orderbook depth a single order may take
+_DEPTH_FRACTION = Decimal("0.20")
+
 
 class PositionSizer:
     """Sizes positions based on signal edge, confidence, and risk limits."""
@@ -32,6 +39,18 @@ class PositionSizer:
         self._config = config or settings.strategy
         self._risk = risk_config or settings.risk
 
+        # Config floats converted to Decimal once rather than per signal
+        self._base_size_usd = Decimal(str(self._config.base_size_usd))
+        self._max_size_usd = Decimal(str(self._config.max_size_usd))
+        self._kelly_fraction = Decimal(str(self._config.kelly_fraction))
+        self._max_slippage = Decimal(str(self._config.max_slippage))
+        self._min_profit_usd = Decimal(str(self._risk.min_profit_usd))
+        self._order_type = (
+            OrderType.FOK
+            if self._config.default_order_type.upper() == "FOK"
+            else OrderType.GTC
+        )
+
     def size(self, signal: Signal) -> TradeAction | None:
         """Size a trade from a signal.
 
@@ -45,41 +64,40 @@ class PositionSizer:
         3. Cap at max_size_usd and orderbook depth fraction
         """
         # Start with base size
-        size_usd = Decimal(str(self._config.base_size_usd))
+        size_usd = self._base_size_usd
 
         # Optionally apply Kelly sizing
         if self._config.use_kelly_sizing:
             kelly = self._kelly_size(signal)
-            if kelly > Decimal("0"):
+            if kelly > _ZERO:
                 size_usd = kelly
 
         # Cap at max_size_usd
-        max_size = Decimal(str(self._config.max_size_usd))
-        size_usd = min(size_usd, max_size)
+        size_usd = min(size_usd, self._max_size_usd)
 
         # Cap to orderbook depth
         size_usd = self._cap_to_depth(size_usd, signal)
 
-        if size_usd <= Decimal("0"):
+        if size_usd <= _ZERO:
             logger.debug("sizing_zero_after_caps", signal_edge=float(signal.edge))
             return None
 
         # Convert USD size to token quantity
         # For binary markets: size_tokens = size_usd / price
         price = signal.current_price
-        if price <= Decimal("0"):
+        if price <= _ZERO:
             return None
 
         size_tokens = size_usd / price
 
         # Estimated profit (with fee deduction)
-        fee_bps = Decimal(str(signal.match.opportunity.fee_rate_bps))
-        fee_rate = fee_bps / Decimal("10000")
-        fee_cost = price * size_tokens * fee_rate
-        estimated_profit = size_tokens * signal.edge - fee_cost
+        estimated_profit = size_tokens * signal.edge
+        fee_bps = signal.match.opportunity.fee_rate_bps
+        if fee_bps:
+            estimated_profit -= price * size_tokens * (Decimal(fee_bps) / _BPS)
 
         # Check minimum profit
-        min_profit = Decimal(str(self._risk.min_profit_usd))
+        min_profit = self._min_profit_usd
         if estimated_profit < min_profit:
             logger.debug(
                 "sizing_below_min_profit",
@@ -91,18 +109,14 @@ class PositionSizer:
         # Determine side
         side = Side.BUY if signal.direction == SignalDirection.BUY else Side.SELL
 
-        # Order type
-        order_type_str = self._config.default_order_type.upper()
-        order_type = OrderType.FOK if order_type_str == "FOK" else OrderType.GTC
-
         return TradeAction(
             signal=signal,
             token_id=signal.match.target_token_id,
             side=side,
             price=price,
             size=size_tokens,
-            order_type=order_type,
-            max_slippage=Decimal(str(self._config.max_slippage)),
+            order_type=self._order_type,
+            max_slippage=self._max_slippage,
             estimated_profit_usd=estimated_profit,
             reason=(
                 f"edge={signal.edge:.4f} conf={signal.confidence:.2f} "
@@ -119,40 +133,37 @@ class PositionSizer:
         We apply a fractional Kelly (kelly_fraction) for safety.
         """
         p = Decimal(str(signal.confidence))
-        q = Decimal("1") - p
+        q = _ONE - p
 
         # Edge-implied odds: if we buy at current_price, payout is 1.00
         # So b = (1 - price) / price for a buy
         price = signal.current_price
-        if price <= Decimal("0") or price >= Decimal("1"):
-            return Decimal("0")
+        if price <= _ZERO or price >= _ONE:
+            return _ZERO
 
         if signal.direction == SignalDirection.BUY:
-            b = (Decimal("1") - price) / price
+            b = (_ONE - price) / price
         else:
             # For sell: profit is price, loss is 1 - price
-            b = price / (Decimal("1") - price)
+            b = price / (_ONE - price)
 
-        if b <= Decimal("0"):
-            return Decimal("0")
+        if b <= _ZERO:
+            return _ZERO
 
         kelly_f = (p * b - q) / b
-        if kelly_f <= Decimal("0"):
-            return Decimal("0")
+        if kelly_f <= _ZERO:
+            return _ZERO
 
         # Apply fractional Kelly
-        fraction = Decimal(str(self._config.kelly_fraction))
-        bankroll = Decimal(str(self._config.max_size_usd))
-
-        return kelly_f * fraction * bankroll
+        return kelly_f * self._kelly_fraction * self._max_size_usd
 
     def _cap_to_depth(self, size_usd: Decimal, signal: Signal) -> Decimal:
         """Cap size to a fraction of available orderbook depth."""
         opp = signal.match.opportunity
         depth = opp.depth_usd
-        if depth <= Decimal("0"):
-            return Decimal("0")
+        if depth <= _ZERO:
+            return _ZERO
 
         # Don't take more than 20% of visible depth
-        max_from_depth = depth * Decimal("0.20")
+        max_from_depth = depth * _DEPTH_FRACTION
         return min(size_usd, max_from_depth)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Iterator
 from decimal import Decimal
 
 from src.backtest.replay import BacktestEngine
@@ -21,6 +23,36 @@ from src.core.types import (
 
 # ── Helpers ─────────────────────────────────────────────────────
 
+_RESULT_FIELDS = frozenset({
+    "total_events",
+    "total_trades",
+    "successful_trades",
+    "failed_trades",
+    "signals_generated",
+    "trades_skipped",
+    "risk_rejected",
+    "cumulative_pnl",
+    "win_rate",
+    "execution_results",
+})
+
+# Permissive configs shared by the replay tests (read-only, never mutated)
+_STRATEGY = StrategyConfig(
+    match_confidence_threshold=0.5,
+    min_edge=0.01,
+    min_confidence=0.90,
+    max_staleness_secs=99999,
+    base_size_usd=100.0,
+    max_size_usd=1000.0,
+)
+_RISK = RiskConfig(
+    min_profit_usd=0.01,
+    min_confidence=0.80,
+    bankroll_usd=10000.0,
+    min_orderbook_depth_usd=100.0,
+    max_spread=0.50,
+)
+
 
 def _opp(
     condition_id: str = "cond_1",
@@ -91,24 +123,9 @@ def _cpi_event(
 
 
 def _config(**kw: object) -> BacktestConfig:
-    strategy = StrategyConfig(
-        match_confidence_threshold=0.5,
-        min_edge=0.01,
-        min_confidence=0.90,
-        max_staleness_secs=99999,
-        base_size_usd=100.0,
-        max_size_usd=1000.0,
-    )
-    risk = RiskConfig(
-        min_profit_usd=0.01,
-        min_confidence=0.80,
-        bankroll_usd=10000.0,
-        min_orderbook_depth_usd=100.0,
-        max_spread=0.50,
-    )
     defaults: dict[str, object] = {
-        "strategy": strategy,
-        "risk": risk,
+        "strategy": _STRATEGY,
+        "risk": _RISK,
     }
     defaults.update(kw)
     return BacktestConfig(**defaults)  # type: ignore[arg-type]
@@ -183,9 +200,7 @@ class TestSingleEvent:
         s = _scenario()
         engine = BacktestEngine(s, _config())
         await engine.run()
-        snap = engine.risk_snapshot
-        assert "killed" in snap
-        assert "realized_today" in snap
+        assert {"killed", "realized_today"} <= engine.risk_snapshot.keys()
 
 
 # ── Multiple Events ─────────────────────────────────────────────
@@ -224,6 +239,17 @@ class TestMultipleEvents:
         result = await engine.run()
         assert result.total_events == 2
 
+    async def test_streamed_events_override_scenario(self) -> None:
+        def stream() -> Iterator[HistoricalEvent]:
+            for i in range(3):
+                ts = 1000.0 * (i + 1)
+                yield _cpi_event(released_at=ts, received_at=ts + 0.5)
+
+        s = _scenario()
+        engine = BacktestEngine(s, _config())
+        result = await engine.run(stream())
+        assert result.total_events == 3
+
 
 # ── Config Overrides ────────────────────────────────────────────
 
@@ -262,16 +288,7 @@ class TestResultStructure:
         s = _scenario()
         engine = BacktestEngine(s, _config())
         result = await engine.run()
-        assert hasattr(result, "total_events")
-        assert hasattr(result, "total_trades")
-        assert hasattr(result, "successful_trades")
-        assert hasattr(result, "failed_trades")
-        assert hasattr(result, "signals_generated")
-        assert hasattr(result, "trades_skipped")
-        assert hasattr(result, "risk_rejected")
-        assert hasattr(result, "cumulative_pnl")
-        assert hasattr(result, "win_rate")
-        assert hasattr(result, "execution_results")
+        assert _RESULT_FIELDS <= {f.name for f in dataclasses.fields(result)}
 
     async def test_execution_results_list(self) -> None:
         s = _scenario()
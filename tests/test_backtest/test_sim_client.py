@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
 from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
 
 from src.backtest.sim_client import SimulatedClient
 from src.core.types import (
@@ -316,6 +320,36 @@ class TestFillProbability:
         resp = await client.place_order(req)
         assert resp.success is True
 
+    async def test_deterministic_probabilities_skip_draw(self) -> None:
+        req = OrderRequest(
+            token_id="tok_1",
+            side=Side.BUY,
+            price=Decimal("0.90"),
+            size=Decimal("100"),
+            order_type=OrderType.FOK,
+        )
+        with patch("src.backtest.sim_client.hashlib.md5") as md5:
+            for probability in (0.0, 1.0):
+                client = SimulatedClient(fill_probability=probability)
+                client.set_orderbooks({"tok_1": _book()})
+                await client.place_order(req)
+        md5.assert_not_called()
+
+    async def test_zero_probability_records_failed_fill(self) -> None:
+        client = SimulatedClient(fill_probability=0.0)
+        client.set_orderbooks({"tok_1": _book()})
+        req = OrderRequest(
+            token_id="tok_1",
+            side=Side.SELL,
+            price=Decimal("0.80"),
+            size=Decimal("10"),
+        )
+        await client.place_order(req)
+        (fill,) = client.fills
+        assert fill.success is False
+        assert fill.side == "SELL"
+        assert fill.fill_size == Decimal(0)
+
 
 # ── No Orderbook ────────────────────────────────────────────────
 
@@ -340,6 +374,21 @@ class TestNoOrderbook:
 
 
 class TestFillRecords:
+    async def test_fill_records_are_immutable(self) -> None:
+        client = SimulatedClient()
+        client.set_orderbooks({"tok_1": _book()})
+        req = OrderRequest(
+            token_id="tok_1",
+            side=Side.BUY,
+            price=Decimal("0.90"),
+            size=Decimal("100"),
+        )
+        await client.place_order(req)
+        fill = client.fills[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            fill.fill_size = Decimal(0)  # type: ignore[misc]
+        assert not hasattr(fill, "__dict__")
+
     async def test_fills_accumulate(self) -> None:
         client = SimulatedClient()
         client.set_orderbooks({"tok_1": _book()})
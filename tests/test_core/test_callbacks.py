@@ -0,0 +1,24 @@
+"""Tests for maybe_await — sync/async callback results."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.core._callbacks import maybe_await
+
+
+class TestMaybeAwait:
+    @pytest.mark.asyncio
+    async def test_awaits_coroutine(self) -> None:
+        calls: list[int] = []
+
+        async def cb() -> None:
+            calls.append(1)
+
+        await maybe_await(cb())
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_ignores_plain_values(self) -> None:
+        await maybe_await(None)
+        await maybe_await(42)
@@ -48,6 +48,7 @@ class TestDefaults:
         cfg = LoggingConfig()
         assert cfg.level == "INFO"
         assert cfg.format == "json"
+        assert cfg.queued is False
 
     def test_default_settings(self) -> None:
         s = Settings()
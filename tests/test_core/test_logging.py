@@ -0,0 +1,89 @@
+"""Tests for setup_logging — queued and direct handlers."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from src.core import logging as core_logging
+from src.core.logging import setup_logging
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging() -> Iterator[None]:
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    core_logging._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    structlog.reset_defaults()
+
+
+def _capture(queued: bool) -> io.StringIO:
+    stream = io.StringIO()
+    with patch("src.core.logging.sys.stderr", stream):
+        setup_logging(level="INFO", fmt="json", queued=queued)
+    return stream
+
+
+class TestSetupLogging:
+    def test_queued_renders_on_listener(self) -> None:
+        stream = _capture(queued=True)
+        root = logging.getLogger()
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+
+        structlog.stdlib.get_logger().info("queued_event", answer=42)
+        core_logging._stop_listener()  # flushes the queue
+        record = json.loads(stream.getvalue().strip())
+        assert record["event"] == "queued_event"
+        assert record["answer"] == 42
+
+    def test_direct_handler_when_not_queued(self) -> None:
+        stream = _capture(queued=False)
+        root = logging.getLogger()
+        assert isinstance(root.handlers[0], logging.StreamHandler)
+        assert core_logging._listener is None
+
+        structlog.stdlib.get_logger().info("direct_event")
+        assert json.loads(stream.getvalue().strip())["event"] == "direct_event"
+
+    def test_reconfigure_replaces_listener(self) -> None:
+        _capture(queued=True)
+        first = core_logging._listener
+        _capture(queued=True)
+        assert core_logging._listener is not first
+        assert len(logging.getLogger().handlers) == 1
+
+    def test_direct_handler_by_default(self) -> None:
+        stream = io.StringIO()
+        with patch("src.core.logging.sys.stderr", stream):
+            setup_logging(level="INFO", fmt="json")
+        assert not isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+        assert core_logging._listener is None
+
+
+class TestPassthroughQueueHandler:
+    def test_prepare_snapshots_event_dict(self) -> None:
+        handler = core_logging._PassthroughQueueHandler(queue.SimpleQueue())
+        event = {"event": "snap", "answer": 42}
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, event, None, None)
+        prepared = handler.prepare(record)
+        event["answer"] = 0
+        assert prepared.msg == {"event": "snap", "answer": 42}
+
+    def test_prepare_snapshots_args(self) -> None:
+        handler = core_logging._PassthroughQueueHandler(queue.SimpleQueue())
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "%s %s", ("a", "b"), None)
+        record.args = ["a", "b"]  # type: ignore[assignment]
+        prepared = handler.prepare(record)
+        assert prepared.args == ("a", "b")
+        assert prepared.getMessage() == "a b"
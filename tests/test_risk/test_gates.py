@@ -5,6 +5,9 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Any
 
+import pytest
+from pydantic import ValidationError
+
 from src.core.config import KillSwitchConfig, OracleConfig, RiskConfig
 from src.core.types import (
     FeedEvent,
@@ -25,6 +28,7 @@ from src.core.types import (
     TradeAction,
 )
 from src.risk.gates import (
+    APPROVED,
     check_daily_loss,
     check_fee_rate,
     check_kill_switch,
@@ -120,6 +124,12 @@ class TestKillSwitch:
         v = check_kill_switch(True)
         assert v.reason == RiskRejectionReason.KILL_SWITCH_ACTIVE
 
+    def test_approved_verdict_is_shared_and_frozen(self) -> None:
+        v = check_kill_switch(False)
+        assert v is APPROVED
+        with pytest.raises(ValidationError):
+            v.approved = False  # type: ignore[misc]
+
 
 # ── Daily Loss ─────────────────────────────────────────────────
 
@@ -240,6 +240,32 @@ class TestRecordTradeResult:
         assert result is None
 
 
+# ── apply_fill ────────────────────────────────────────────────
+
+
+class TestApplyFill:
+    def test_daily_loss_reason_triggers(self) -> None:
+        mgr = KillSwitchManager(_ks())
+        result = mgr.apply_fill(False, "Daily loss breached")
+        assert result == KillSwitchTrigger.DAILY_LOSS
+        assert mgr.state.reason == "Daily loss breached"
+        assert mgr.consecutive_losses == 0
+
+    def test_without_reason_updates_counters(self) -> None:
+        mgr = KillSwitchManager(
+            _ks(max_consecutive_losses=2, max_error_rate_pct=101.0),
+        )
+        assert mgr.apply_fill(False) is None
+        assert mgr.consecutive_losses == 1
+        assert mgr.apply_fill(False) == KillSwitchTrigger.CONSECUTIVE_LOSSES
+
+    def test_returns_none_when_already_active(self) -> None:
+        mgr = KillSwitchManager(_ks())
+        mgr.trigger("already active", KillSwitchTrigger.MANUAL)
+        assert mgr.apply_fill(False, "Daily loss breached") is None
+        assert mgr.state.trigger == KillSwitchTrigger.MANUAL
+
+
 # ── record_api_error ──────────────────────────────────────────
 
 
@@ -19,6 +19,8 @@ from src.core.types import (
     MarketInfo,
     MarketOpportunity,
     MatchResult,
+    OracleProposal,
+    OracleProposalState,
     OutcomeType,
     Position,
     RiskEvent,
@@ -148,10 +150,10 @@ class TestCheckTrade:
     def test_concentration_rejects(self) -> None:
         monitor = RiskMonitor(config=_cfg(bankroll_usd=1000.0, max_bankroll_pct_per_event=0.10))
         # limit = 100, action = 0.50*100 = 50; now add existing
-        monitor._positions._positions["0xa"] = Position(
+        monitor.positions.add(Position(
             token_id="0xa", condition_id="cond1", side=Side.BUY,
             entry_price=Decimal("0.50"), size=Decimal("200"),  # exposure = 100
-        )
+        ))
         v = monitor.check_trade(_action())
         assert v.approved is False
         assert v.reason == RiskRejectionReason.POSITION_CONCENTRATION
@@ -159,9 +161,9 @@ class TestCheckTrade:
     def test_max_positions_rejects(self) -> None:
         monitor = RiskMonitor(config=_cfg(max_concurrent_positions=2))
         for i in range(2):
-            monitor._positions._positions[f"tok{i}"] = Position(
+            monitor.positions.add(Position(
                 token_id=f"tok{i}", side=Side.BUY,
-            )
+            ))
         v = monitor.check_trade(_action())
         assert v.approved is False
         assert v.reason == RiskRejectionReason.MAX_CONCURRENT_POSITIONS
@@ -234,10 +236,10 @@ class TestRecordFill:
     async def test_auto_triggers_kill_switch(self) -> None:
         monitor = RiskMonitor(config=_cfg(max_daily_loss_usd=10.0))
         # Open buy position first
-        monitor._positions._positions["0xyes"] = Position(
+        monitor.positions.add(Position(
             token_id="0xyes", condition_id="cond1", side=Side.BUY,
             entry_price=Decimal("0.50"), size=Decimal("100"),
-        )
+        ))
         # Close at a loss: sell at 0.30, entry was 0.50 → loss = (0.30-0.50)*100 = -20
         events: list[RiskEvent] = []
         monitor.on_event(lambda e: events.append(e))
@@ -257,20 +259,20 @@ class TestKillSwitch:
     @pytest.mark.asyncio
     async def test_triggered_by_loss(self) -> None:
         monitor = RiskMonitor(config=_cfg(max_daily_loss_usd=10.0))
-        monitor._positions._positions["0xyes"] = Position(
+        monitor.positions.add(Position(
             token_id="0xyes", condition_id="cond1", side=Side.BUY,
             entry_price=Decimal("0.50"), size=Decimal("100"),
-        )
+        ))
         await monitor.record_fill(_result(side=Side.SELL, price=Decimal("0.30")))
         assert monitor.killed is True
 
     @pytest.mark.asyncio
     async def test_triggered_emits_event(self) -> None:
         monitor = RiskMonitor(config=_cfg(max_daily_loss_usd=10.0))
-        monitor._positions._positions["0xyes"] = Position(
+        monitor.positions.add(Position(
             token_id="0xyes", condition_id="cond1", side=Side.BUY,
             entry_price=Decimal("0.50"), size=Decimal("100"),
-        )
+        ))
         events: list[RiskEvent] = []
         monitor.on_event(lambda e: events.append(e))
         await monitor.record_fill(_result(side=Side.SELL, price=Decimal("0.30")))
@@ -352,6 +354,15 @@ class TestSnapshot:
         assert snap["open_positions"] == 1
         assert snap["trade_count_today"] == 1
 
+    @pytest.mark.asyncio
+    async def test_exposure_tracks_fills(self) -> None:
+        monitor = RiskMonitor(config=_cfg())
+        assert monitor.snapshot()["total_exposure_usd"] == 0.0
+        await monitor.record_fill(_result())
+        assert monitor.snapshot()["total_exposure_usd"] == 50.0
+        await monitor.record_fill(_result(side=Side.SELL))
+        assert monitor.snapshot()["total_exposure_usd"] == 0.0
+
 
 # ── Config ─────────────────────────────────────────────────────
 
@@ -377,10 +388,10 @@ class TestEnhancedKillSwitch:
         # Open positions so sells produce losses
         for i in range(2):
             token = f"0xtok{i}"
-            monitor._positions._positions[token] = Position(
+            monitor.positions.add(Position(
                 token_id=token, condition_id=f"cond{i}", side=Side.BUY,
                 entry_price=Decimal("0.50"), size=Decimal("100"),
-            )
+            ))
             r = ExecutionResult(
                 action=TradeAction(
                     signal=_signal(condition_id=f"cond{i}"),
@@ -412,10 +423,10 @@ class TestEnhancedKillSwitch:
         # Produce 3 losses out of 4 trades (75% > 50%)
         for i in range(3):
             token = f"0xtok{i}"
-            monitor._positions._positions[token] = Position(
+            monitor.positions.add(Position(
                 token_id=token, condition_id=f"cond{i}", side=Side.BUY,
                 entry_price=Decimal("0.50"), size=Decimal("100"),
-            )
+            ))
             r = ExecutionResult(
                 action=TradeAction(
                     signal=_signal(condition_id=f"cond{i}"),
@@ -501,14 +512,41 @@ class TestEnhancedKillSwitch:
     @pytest.mark.asyncio
     async def test_daily_loss_trigger_with_manager(self) -> None:
         monitor = RiskMonitor(config=_cfg(max_daily_loss_usd=10.0))
-        monitor._positions._positions["0xyes"] = Position(
+        monitor.positions.add(Position(
             token_id="0xyes", condition_id="cond1", side=Side.BUY,
             entry_price=Decimal("0.50"), size=Decimal("100"),
-        )
+        ))
         await monitor.record_fill(_result(side=Side.SELL, price=Decimal("0.30")))
         assert monitor.killed is True
         assert monitor.kill_switch_state.trigger == KillSwitchTrigger.DAILY_LOSS
 
+    @pytest.mark.asyncio
+    async def test_daily_loss_boundary(self) -> None:
+        """Loss exactly at the limit does not trigger; a cent past it does."""
+        cfg = _cfg(max_daily_loss_usd=10.0)
+        cfg.kill_switch = KillSwitchConfig(max_error_rate_pct=101.0)
+        monitor = RiskMonitor(config=cfg)
+        monitor._pnl.realized_today = Decimal("-9.99")
+        monitor.positions.add(Position(
+            token_id="0xyes", condition_id="cond1", side=Side.BUY,
+            entry_price=Decimal("0.50"), size=Decimal("1"),
+        ))
+        await monitor.record_fill(_result(
+            side=Side.SELL, price=Decimal("0.49"), size=Decimal("1"),
+        ))
+        assert monitor.pnl.realized_today == Decimal("-10.00")
+        assert monitor.killed is False
+
+        monitor.positions.add(Position(
+            token_id="0xyes", condition_id="cond1", side=Side.BUY,
+            entry_price=Decimal("0.50"), size=Decimal("1"),
+        ))
+        await monitor.record_fill(_result(
+            side=Side.SELL, price=Decimal("0.49"), size=Decimal("1"),
+        ))
+        assert monitor.killed is True
+        assert monitor.kill_switch_state.trigger == KillSwitchTrigger.DAILY_LOSS
+
 
 # ── Oracle Integration ────────────────────────────────────────
 
@@ -548,6 +586,59 @@ class TestOracleIntegration:
         assert "disputed_markets" in snap
         assert "exposure_at_risk_usd" in snap
 
+    @pytest.mark.asyncio
+    async def test_snapshot_exposure_at_risk_updates_on_dispute(self) -> None:
+        oracle = OracleMonitor(config=OracleConfig(enabled=True))
+        monitor = RiskMonitor(config=_cfg(), oracle_monitor=oracle)
+        oracle._positions = monitor.positions
+        await monitor.record_fill(_result(condition_id="cond1"))
+        assert monitor.snapshot()["exposure_at_risk_usd"] == 0.0
+        await oracle.ingest_dispute("cond1", "0xdisputer")
+        assert monitor.snapshot()["exposure_at_risk_usd"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_exposure_after_oracle_clear(self) -> None:
+        oracle = OracleMonitor(config=OracleConfig(enabled=True))
+        monitor = RiskMonitor(config=_cfg(), oracle_monitor=oracle)
+        oracle._positions = monitor.positions
+        await monitor.record_fill(_result(condition_id="cond1"))
+        await oracle.ingest_dispute("cond1", "0xdisputer")
+        assert monitor.snapshot()["exposure_at_risk_usd"] == 50.0
+        oracle.clear()
+        snap = monitor.snapshot()
+        assert snap["disputed_markets"] == 0
+        assert snap["exposure_at_risk_usd"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_exposure_after_positions_clear(self) -> None:
+        oracle = OracleMonitor(config=OracleConfig(enabled=True))
+        monitor = RiskMonitor(config=_cfg(), oracle_monitor=oracle)
+        oracle._positions = monitor.positions
+        await monitor.record_fill(_result(condition_id="cond1"))
+        await oracle.ingest_dispute("cond1", "0xdisputer")
+        assert monitor.snapshot()["exposure_at_risk_usd"] == 50.0
+        monitor.positions.clear()
+        snap = monitor.snapshot()
+        assert snap["total_exposure_usd"] == 0.0
+        assert snap["exposure_at_risk_usd"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_exposure_after_proposal_leaves_disputed(self) -> None:
+        """A state change that raises no alert still refreshes the snapshot."""
+        oracle = OracleMonitor(config=OracleConfig(enabled=True))
+        monitor = RiskMonitor(config=_cfg(), oracle_monitor=oracle)
+        oracle._positions = monitor.positions
+        await monitor.record_fill(_result(condition_id="cond1"))
+        await oracle.ingest_dispute("cond1", "0xdisputer")
+        assert monitor.snapshot()["exposure_at_risk_usd"] == 50.0
+        await oracle.ingest_proposal(OracleProposal(
+            condition_id="cond1",
+            state=OracleProposalState.PROPOSED,
+        ))
+        snap = monitor.snapshot()
+        assert snap["disputed_markets"] == 0
+        assert snap["exposure_at_risk_usd"] == 0.0
+
     def test_snapshot_without_oracle_omits_fields(self) -> None:
         monitor = RiskMonitor(config=_cfg())
         snap = monitor.snapshot()
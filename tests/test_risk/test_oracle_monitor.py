@@ -4,13 +4,23 @@ active polling, condition tracking, and oracle risk assessment."""
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import logging
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from src.core.config import OracleConfig
 from src.core.types import (
+    ExecutionResult,
+    FeedEvent,
+    FeedEventType,
+    FeedType,
+    MarketOpportunity,
+    MatchResult,
     OracleAlert,
     OracleEventType,
     OracleProposal,
@@ -18,6 +28,8 @@ from src.core.types import (
     OracleRiskAssessment,
     Position,
     Side,
+    Signal,
+    TradeAction,
     WhaleActivity,
 )
 from src.risk.oracle_monitor import OracleMonitor
@@ -47,16 +59,35 @@ def _tracker_with_position(
     size: Decimal = Decimal("200"),
 ) -> PositionTracker:
     tracker = PositionTracker()
-    tracker._positions[token_id] = Position(
-        token_id=token_id,
-        condition_id=condition_id,
-        side=Side.BUY,
-        entry_price=price,
-        size=size,
-    )
+    tracker.record_fill(_fill(condition_id, token_id, price, size))
     return tracker
 
 
+def _fill(
+    condition_id: str = "cond1",
+    token_id: str = "0xyes",
+    price: Decimal = Decimal("0.50"),
+    size: Decimal = Decimal("200"),
+) -> ExecutionResult:
+    signal = Signal(
+        match=MatchResult(
+            feed_event=FeedEvent(
+                feed_type=FeedType.ECONOMIC,
+                event_type=FeedEventType.DATA_RELEASED,
+            ),
+            opportunity=MarketOpportunity(condition_id=condition_id),
+        ),
+    )
+    return ExecutionResult(
+        action=TradeAction(
+            signal=signal, token_id=token_id, price=price, size=size,
+        ),
+        success=True,
+        fill_price=price,
+        fill_size=size,
+    )
+
+
 def _proposal(
     condition_id: str = "cond1",
     state: OracleProposalState = OracleProposalState.PROPOSED,
@@ -71,6 +102,24 @@ def _proposal(
     )
 
 
+def _json_response(body: dict[str, object]) -> AsyncMock:
+    response = AsyncMock()
+    response.status = 200
+    response.read = AsyncMock(return_value=json.dumps(body).encode())
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+def _error_response(status: int) -> AsyncMock:
+    response = _json_response({"errors": [{"message": "Bad Request"}]})
+    response.status = status
+    return response
+
+
+_OK = {"data": {"optimisticPriceRequests": [{"id": "req_1"}]}}
+
+
 # ── Init ──────────────────────────────────────────────────────
 
 
@@ -91,6 +140,65 @@ class TestOracleMonitorInit:
         assert mon.poll_count == 0
         assert mon.tracked_conditions == set()
 
+    @pytest.mark.asyncio
+    async def test_proposals_view_is_read_only_and_live(self) -> None:
+        mon = _monitor()
+        view = mon.proposals
+        with pytest.raises(TypeError):
+            view["cond1"] = _proposal("cond1")  # type: ignore[index]
+        await mon.ingest_proposal(_proposal("cond1"))
+        assert "cond1" in view
+
+    @pytest.mark.asyncio
+    async def test_snapshot_proposals_is_a_copy(self) -> None:
+        mon = _monitor()
+        await mon.ingest_proposal(_proposal("cond1"))
+        snap = mon.snapshot_proposals()
+        snap.clear()
+        assert "cond1" in mon.proposals
+
+    def test_tracked_conditions_view_refreshed_on_change(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        first = mon.tracked_conditions
+        assert mon.tracked_conditions is first
+        mon.track_condition("cond2")
+        assert mon.tracked_conditions == {"cond1", "cond2"}
+        mon.untrack_condition("cond1")
+        assert mon.tracked_conditions == {"cond2"}
+
+    @pytest.mark.asyncio
+    async def test_disputed_count_follows_transitions(self) -> None:
+        mon = _monitor()
+        await mon.ingest_proposal(_proposal("cond1"))
+        await mon.ingest_dispute("cond1", "0xdisputer")
+        await mon.ingest_dispute("cond2", "0xdisputer")
+        await mon.ingest_dispute("cond2", "0xdisputer")  # repeat
+        assert mon.disputed_count == 2
+        assert mon.disputed_conditions == {"cond1", "cond2"}
+        await mon.ingest_settlement("cond1", "YES")
+        assert mon.disputed_count == 1
+        assert mon.disputed_conditions == {"cond2"}
+        await mon.ingest_proposal(_proposal("cond2"))  # replaced
+        assert mon.disputed_count == 0
+        assert mon.disputed_conditions == set()
+        await mon.ingest_proposal(
+            _proposal("cond3", state=OracleProposalState.DISPUTED),
+        )
+        assert mon.snapshot()["disputed_markets"] == 1
+        mon.clear()
+        assert mon.disputed_count == 0
+
+    @pytest.mark.asyncio
+    async def test_settlement_of_untracked_condition(self) -> None:
+        mon = _monitor()
+        await mon.ingest_settlement("cond9", "NO")
+        assert mon.disputed_count == 0
+        await mon.ingest_dispute("cond9", "0xdisputer")
+        assert mon.disputed_conditions == {"cond9"}
+        await mon.ingest_settlement("cond9", "NO")
+        assert mon.disputed_count == 0
+
 
 # ── Ingest Proposal ──────────────────────────────────────────
 
@@ -244,6 +352,17 @@ class TestIngestWhaleActivity:
         ))
         assert len(alerts) == 1
 
+    @pytest.mark.asyncio
+    async def test_checksummed_address_matches_lowercase_config(self) -> None:
+        mon = _monitor(whale_addresses=["0xabcdef"])
+        alerts: list[OracleAlert] = []
+        mon.on_alert(lambda a: alerts.append(a))
+        await mon.ingest_whale_activity(WhaleActivity(
+            address="0xAbCdEf",
+            action="BOND",
+        ))
+        assert len(alerts) == 1
+
 
 # ── Query Methods ─────────────────────────────────────────────
 
@@ -275,11 +394,47 @@ class TestQueryMethods:
         assert pos.token_id == "0xyes"
         assert proposal.state == OracleProposalState.DISPUTED
 
+    @pytest.mark.asyncio
+    async def test_disputed_positions_only_disputed_conditions(self) -> None:
+        tracker = _tracker_with_position("cond1", token_id="0xa")
+        tracker.record_fill(_fill("cond2", token_id="0xb"))
+        tracker.record_fill(_fill("cond3", token_id="0xc"))
+        mon = _monitor(positions=tracker)
+        await mon.ingest_dispute("cond1", "0xdisputer")
+        await mon.ingest_dispute("cond3", "0xdisputer")
+        results = mon.disputed_positions()
+        assert sorted((cid, pos.token_id) for cid, pos, _ in results) == [
+            ("cond1", "0xa"), ("cond3", "0xc"),
+        ]
+        assert mon.exposure_at_risk() == Decimal("200")
+
 
 # ── Callbacks and State ───────────────────────────────────────
 
 
 class TestCallbacksAndState:
+    @pytest.mark.asyncio
+    async def test_callback_filtered_by_event_type(self) -> None:
+        mon = _monitor()
+        alerts: list[OracleAlert] = []
+        mon.on_alert(
+            lambda a: alerts.append(a),
+            event_types={OracleEventType.DISPUTE_DETECTED},
+        )
+        await mon.ingest_settlement("cond1", "YES")
+        await mon.ingest_dispute("cond2", "0xdisputer")
+        assert [a.event_type for a in alerts] == [OracleEventType.DISPUTE_DETECTED]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_alert_not_built(self) -> None:
+        mon = _monitor()
+        with patch("src.risk.oracle_monitor.OracleAlert") as alert_cls:
+            await mon.ingest_dispute("cond1", "0xdisputer")
+            await mon.ingest_settlement("cond1", "YES")
+        alert_cls.assert_not_called()
+        # State still tracked without subscribers
+        assert mon.get_proposal("cond1") is not None
+
     @pytest.mark.asyncio
     async def test_async_callback_support(self) -> None:
         mon = _monitor()
@@ -292,6 +447,69 @@ class TestCallbacksAndState:
         await mon.ingest_settlement("cond1", "YES")
         assert len(alerts) == 1
 
+    @pytest.mark.asyncio
+    async def test_async_callbacks_run_concurrently(self) -> None:
+        mon = _monitor()
+        released = asyncio.Event()
+        seen: list[str] = []
+
+        async def waiter(a: OracleAlert) -> None:
+            # Would deadlock if callbacks were awaited one after another
+            await asyncio.wait_for(released.wait(), timeout=1.0)
+            seen.append("waiter")
+
+        async def failing(a: OracleAlert) -> None:
+            raise RuntimeError("boom")
+
+        async def releaser(a: OracleAlert) -> None:
+            released.set()
+            seen.append("releaser")
+
+        mon.on_alert(waiter)
+        mon.on_alert(failing)
+        mon.on_alert(releaser)
+        await mon.ingest_settlement("cond1", "YES")
+        assert seen == ["releaser", "waiter"]
+
+    @pytest.mark.asyncio
+    async def test_proposal_log_skipped_below_level(self) -> None:
+        mon = _monitor()
+        std_logger = logging.getLogger("src.risk.oracle_monitor")
+        old_level = std_logger.level
+        try:
+            with patch("src.risk.oracle_monitor.logger") as mock_logger:
+                std_logger.setLevel(logging.WARNING)
+                await mon.ingest_proposal(_proposal("cond1"))
+                mock_logger.info.assert_not_called()
+
+                std_logger.setLevel(logging.INFO)
+                await mon.ingest_proposal(_proposal("cond2"))
+                mock_logger.info.assert_called_once()
+        finally:
+            std_logger.setLevel(old_level)
+
+    @pytest.mark.asyncio
+    async def test_mixed_callbacks_all_invoked(self) -> None:
+        mon = _monitor()
+        seen: list[str] = []
+
+        async def async_cb(a: OracleAlert) -> None:
+            seen.append("async")
+
+        async def wrapped(a: OracleAlert) -> None:
+            seen.append("wrapped")
+
+        def failing_cb(a: OracleAlert) -> None:
+            raise RuntimeError("boom")
+
+        mon.on_alert(async_cb)
+        mon.on_alert(failing_cb)
+        mon.on_alert(lambda a: seen.append("sync"))
+        # Sync callable returning a coroutine is still awaited
+        mon.on_alert(lambda a: wrapped(a))
+        await mon.ingest_settlement("cond1", "YES")
+        assert sorted(seen) == ["async", "sync", "wrapped"]
+
     @pytest.mark.asyncio
     async def test_clear_resets_state(self) -> None:
         mon = _monitor()
@@ -353,22 +571,34 @@ class TestConditionTracking:
 
     def test_sync_tracked_from_positions(self) -> None:
         tracker = PositionTracker()
-        tracker._positions["0xyes"] = Position(
+        tracker.add(Position(
             token_id="0xyes",
             condition_id="cond1",
             side=Side.BUY,
             entry_price=Decimal("0.50"),
             size=Decimal("100"),
-        )
-        tracker._positions["0xno"] = Position(
+        ))
+        tracker.add(Position(
             token_id="0xno",
             condition_id="cond2",
             side=Side.BUY,
             entry_price=Decimal("0.40"),
             size=Decimal("50"),
-        )
+        ))
+        mon = _monitor(positions=tracker)
+        mon.sync_tracked_from_positions()
+        assert mon.tracked_conditions == {"cond1", "cond2"}
+
+    def test_sync_picks_up_new_positions_only_after_change(self) -> None:
+        tracker = _tracker_with_position(condition_id="cond1")
         mon = _monitor(positions=tracker)
         mon.sync_tracked_from_positions()
+        mon.untrack_condition("cond1")
+        # Tracker unchanged — the scan is skipped
+        mon.sync_tracked_from_positions()
+        assert mon.tracked_conditions == set()
+        tracker.record_fill(_fill(condition_id="cond2", token_id="0xother"))
+        mon.sync_tracked_from_positions()
         assert mon.tracked_conditions == {"cond1", "cond2"}
 
     def test_sync_tracked_without_positions_safe(self) -> None:
@@ -378,13 +608,13 @@ class TestConditionTracking:
 
     def test_sync_skips_empty_condition_id(self) -> None:
         tracker = PositionTracker()
-        tracker._positions["0xyes"] = Position(
+        tracker.add(Position(
             token_id="0xyes",
             condition_id="",
             side=Side.BUY,
             entry_price=Decimal("0.50"),
             size=Decimal("100"),
-        )
+        ))
         mon = _monitor(positions=tracker)
         mon.sync_tracked_from_positions()
         assert mon.tracked_conditions == set()
@@ -416,6 +646,26 @@ class TestPollingLifecycle:
         assert mon.running is True
         await mon.stop()
 
+    @pytest.mark.asyncio
+    async def test_start_creates_owned_session_closed_on_stop(self) -> None:
+        mon = _monitor()
+        await mon.start()
+        session = mon._http_session
+        assert session is not None
+        await mon.stop()
+        assert session.closed  # type: ignore[attr-defined]
+        assert mon._http_session is None
+
+    @pytest.mark.asyncio
+    async def test_injected_session_not_closed_on_stop(self) -> None:
+        session = MagicMock()
+        session.close = AsyncMock()
+        mon = _monitor(http_session=session)
+        await mon.start()
+        await mon.stop()
+        session.close.assert_not_called()
+        assert mon._http_session is session
+
     @pytest.mark.asyncio
     async def test_stop_without_start_safe(self) -> None:
         mon = _monitor()
@@ -477,6 +727,23 @@ class TestSubgraphProcessing:
         assert "cond1" in mon.proposals
         assert mon.proposals["cond1"].proposer == "0xproposer"
         assert mon.proposals["cond1"].state == OracleProposalState.PROPOSED
+        assert mon.proposals["cond1"].bond_amount == Decimal("1000000")
+        assert mon.proposals["cond1"].proposed_at == 1000.0
+        # Raw subgraph row is not retained on the proposal
+        assert mon.proposals["cond1"].metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_process_unmatched_row_ignored(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        # Unparseable fields are never touched when ancillary does not match
+        await mon._process_subgraph_proposal({
+            "id": "proposal_1",
+            "ancillaryData": "unrelated market",
+            "requestTimestamp": "not-a-number",
+        })
+        assert mon.proposals == {}
+        assert mon._open_request_ids == set()
 
     @pytest.mark.asyncio
     async def test_process_dispute(self) -> None:
@@ -605,6 +872,160 @@ class TestSubgraphProcessing:
         result = mon._match_condition("unrelated data")
         assert result == ""
 
+    def test_match_condition_many_tracked(self) -> None:
+        mon = _monitor()
+        for i in range(50):
+            mon.track_condition(f"0xCond{i:03d}")
+        assert mon._match_condition("q: ... 0xcond042 ...") == "0xCond042"
+
+    def test_match_condition_after_untrack(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        assert mon._match_condition("has cond1") == "cond1"
+        mon.untrack_condition("cond1")
+        assert mon._match_condition("has cond1") == ""
+
+
+# ── Incremental Polling ─────────────────────────────────────
+
+
+def _raw(
+    request_id: str = "req_1",
+    ancillary: str = "cond1",
+    request_ts: int = 1000,
+    disputer: str = "",
+    dispute_ts: int = 0,
+) -> dict[str, object]:
+    return {
+        "id": request_id,
+        "ancillaryData": ancillary,
+        "proposer": "0xproposer",
+        "proposedPrice": "1",
+        "requestTimestamp": request_ts,
+        "disputeTimestamp": dispute_ts,
+        "settleTimestamp": 0,
+        "disputer": disputer,
+        "settled": False,
+        "bond": "1000000",
+    }
+
+
+class TestIncrementalPolling:
+    @pytest.mark.asyncio
+    async def test_watermark_advances_after_poll(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        mon._fetch_subgraph_proposals = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_raw(request_ts=1000), _raw("req_2", request_ts=1500)],
+        )
+        await mon.poll_once()
+        assert mon._high_water_ts == 1500
+        await mon.poll_once()
+        assert mon._fetch_subgraph_proposals.call_args.kwargs["since"] == 1500
+
+    @pytest.mark.asyncio
+    async def test_large_tracked_set_split_into_batches(self) -> None:
+        mon = _monitor()
+        for i in range(60):
+            mon.track_condition(f"cond{i:02d}")
+        mon._fetch_subgraph_proposals = AsyncMock(  # type: ignore[method-assign]
+            return_value=[],
+        )
+        await mon.poll_once()
+        batches = [c.args[0] for c in mon._fetch_subgraph_proposals.call_args_list]
+        assert [len(b) for b in batches] == [25, 25, 10]
+        assert sorted(cid for b in batches for cid in b) == sorted(
+            mon.tracked_conditions,
+        )
+
+    @pytest.mark.asyncio
+    async def test_truncated_batch_holds_watermark(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        mon._fetch_subgraph_proposals = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_raw(f"req_{i}", request_ts=1000 + i) for i in range(100)],
+        )
+        await mon.poll_once()
+        assert mon._high_water_ts == 0
+
+    @pytest.mark.asyncio
+    async def test_tracking_new_condition_resets_watermark(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        mon._high_water_ts = 1500
+        mon.track_condition("cond1")
+        assert mon._high_water_ts == 1500
+        mon.track_condition("cond2")
+        assert mon._high_water_ts == 0
+
+    @pytest.mark.asyncio
+    async def test_open_requests_rechecked_for_disputes(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        mon._fetch_subgraph_proposals = AsyncMock(  # type: ignore[method-assign]
+            return_value=[_raw()],
+        )
+        mon._fetch_subgraph_updates = AsyncMock(  # type: ignore[method-assign]
+            return_value=[],
+        )
+        await mon.poll_once()
+        mon._fetch_subgraph_updates.assert_not_called()
+
+        # Next poll: nothing new, but the open request is re-checked
+        mon._fetch_subgraph_proposals.return_value = []
+        mon._fetch_subgraph_updates.return_value = [
+            _raw(disputer="0xdisputer", dispute_ts=2000),
+        ]
+        await mon.poll_once()
+        mon._fetch_subgraph_updates.assert_called_once_with(["req_1"])
+        assert mon.is_disputed("cond1")
+
+
+class TestAlertBatching:
+    @pytest.mark.asyncio
+    async def test_poll_cycle_alerts_delivered_as_one_batch(self) -> None:
+        mon = _monitor()
+        mon.track_condition("cond1")
+        mon.track_condition("cond2")
+        mon._fetch_subgraph_proposals = AsyncMock(  # type: ignore[method-assign]
+            return_value=[
+                _raw("req_1", "cond1", disputer="0xd", dispute_ts=1100),
+                _raw("req_2", "cond2", disputer="0xd", dispute_ts=1200),
+            ],
+        )
+        batches: list[list[OracleAlert]] = []
+        singles: list[OracleAlert] = []
+        mon.on_alert_batch(lambda alerts: batches.append(list(alerts)))
+        mon.on_alert(lambda a: singles.append(a))
+
+        await mon.poll_once()
+
+        assert len(batches) == 1
+        assert [a.condition_id for a in batches[0]] == ["cond1", "cond2"]
+        assert len(singles) == 2
+        assert mon._outbox is None
+
+    @pytest.mark.asyncio
+    async def test_direct_ingest_delivered_immediately(self) -> None:
+        mon = _monitor()
+        batches: list[list[OracleAlert]] = []
+
+        async def on_batch(alerts: list[OracleAlert]) -> None:
+            batches.append(list(alerts))
+
+        mon.on_alert_batch(on_batch)
+        await mon.ingest_dispute("cond1", "0xd")
+        assert len(batches) == 1
+        assert batches[0][0].event_type == OracleEventType.DISPUTE_DETECTED
+
+    @pytest.mark.asyncio
+    async def test_quiet_poll_sends_no_batch(self) -> None:
+        mon = _monitor()
+        batches: list[object] = []
+        mon.on_alert_batch(lambda alerts: batches.append(alerts))
+        await mon.poll_once()
+        assert batches == []
+
 
 # ── Subgraph HTTP Fetch ──────────────────────────────────────
 
@@ -620,7 +1041,7 @@ class TestSubgraphFetch:
     async def test_fetch_with_mock_session(self) -> None:
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
+        mock_response.read = AsyncMock(return_value=json.dumps({
             "data": {
                 "optimisticPriceRequests": [
                     {
@@ -637,7 +1058,7 @@ class TestSubgraphFetch:
                     },
                 ],
             },
-        })
+        }).encode())
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -673,6 +1094,108 @@ class TestSubgraphFetch:
         assert result == []
 
 
+
+class TestPersistedQueries:
+    @pytest.mark.asyncio
+    async def test_hash_only_after_first_success(self) -> None:
+        session = MagicMock()
+        session.post = MagicMock(side_effect=lambda *a, **kw: _json_response(_OK))
+        mon = _monitor(http_session=session, subgraph_persisted_queries=True)
+
+        await mon._fetch_subgraph_proposals(["cond1"])
+        result = await mon._fetch_subgraph_proposals(["cond1"])
+
+        assert result == [{"id": "req_1"}]
+        first, second = (c.kwargs["json"] for c in session.post.call_args_list)
+        assert "query" in first
+        assert "query" not in second
+        sent_hash = second["extensions"]["persistedQuery"]["sha256Hash"]
+        assert sent_hash == hashlib.sha256(first["query"].encode()).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_hash_miss_resends_full_query(self) -> None:
+        miss = {"errors": [{"message": "PersistedQueryNotFound"}]}
+        session = MagicMock()
+        session.post = MagicMock(side_effect=[
+            _json_response(_OK), _json_response(miss), _json_response(_OK),
+        ])
+        mon = _monitor(http_session=session, subgraph_persisted_queries=True)
+
+        await mon._fetch_subgraph_proposals(["cond1"])
+        result = await mon._fetch_subgraph_proposals(["cond1"])
+
+        assert result == [{"id": "req_1"}]
+        assert "query" in session.post.call_args_list[2].kwargs["json"]
+        assert mon._persisted_queries is True
+
+    @pytest.mark.asyncio
+    async def test_unsupported_server_disables_persisted_queries(self) -> None:
+        unsupported = {"errors": [{"message": "query is required"}]}
+        session = MagicMock()
+        session.post = MagicMock(side_effect=[
+            _json_response(_OK), _json_response(unsupported),
+            _json_response(_OK), _json_response(_OK),
+        ])
+        mon = _monitor(http_session=session, subgraph_persisted_queries=True)
+
+        await mon._fetch_subgraph_proposals(["cond1"])
+        assert await mon._fetch_subgraph_proposals(["cond1"]) == [{"id": "req_1"}]
+        await mon._fetch_subgraph_proposals(["cond1"])
+
+        last = session.post.call_args_list[-1].kwargs["json"]
+        assert mon._persisted_queries is False
+        assert "query" in last
+        assert "extensions" not in last
+
+    @pytest.mark.asyncio
+    async def test_http_error_on_hash_only_resends_full_query(self) -> None:
+        session = MagicMock()
+        session.post = MagicMock(side_effect=[
+            _json_response(_OK), _error_response(400), _json_response(_OK),
+        ])
+        mon = _monitor(http_session=session, subgraph_persisted_queries=True)
+
+        await mon._fetch_subgraph_proposals(["cond1"])
+        result = await mon._fetch_subgraph_proposals(["cond1"])
+
+        assert result == [{"id": "req_1"}]
+        assert "query" not in session.post.call_args_list[1].kwargs["json"]
+        assert "query" in session.post.call_args_list[2].kwargs["json"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_http_errors_disable_persisted_queries(self) -> None:
+        def reply(*args: object, **kwargs: object) -> AsyncMock:
+            if "query" in kwargs["json"]:  # type: ignore[operator]
+                return _json_response(_OK)
+            return _error_response(400)
+
+        session = MagicMock()
+        session.post = MagicMock(side_effect=reply)
+        mon = _monitor(http_session=session, subgraph_persisted_queries=True)
+
+        for _ in range(5):
+            assert await mon._fetch_subgraph_proposals(["cond1"]) == [{"id": "req_1"}]
+
+        assert mon._persisted_queries is False
+        last = session.post.call_args_list[-1].kwargs["json"]
+        assert "extensions" not in last
+
+    def test_disabled_by_default(self) -> None:
+        assert _monitor()._persisted_queries is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self) -> None:
+        session = MagicMock()
+        session.post = MagicMock(side_effect=lambda *a, **kw: _json_response(_OK))
+        mon = _monitor(http_session=session, subgraph_persisted_queries=False)
+
+        await mon._fetch_subgraph_proposals(["cond1"])
+        await mon._fetch_subgraph_proposals(["cond1"])
+
+        for call in session.post.call_args_list:
+            assert "extensions" not in call.kwargs["json"]
+
+
 # ── Oracle Risk Assessment ───────────────────────────────────
 
 
@@ -681,6 +1204,16 @@ class TestOracleRiskAssessment:
         mon = _monitor()
         assert mon.assess_oracle_risk() == []
 
+    def test_assessment_is_frozen_and_hashable(self) -> None:
+        tracker = _tracker_with_position(
+            price=Decimal("0.98"), size=Decimal("100"),
+        )
+        mon = _monitor(positions=tracker, oracle_risk_price_threshold=0.95)
+        assessment = mon.assess_oracle_risk()[0]
+        with pytest.raises(ValidationError):
+            assessment.size = Decimal("1")  # type: ignore[misc]
+        assert assessment in {assessment}
+
     def test_low_price_position_skipped(self) -> None:
         """Positions below oracle_risk_price_threshold are not assessed."""
         tracker = _tracker_with_position(
@@ -794,27 +1327,27 @@ class TestOracleRiskAssessment:
 
     def test_multiple_positions_assessed(self) -> None:
         tracker = PositionTracker()
-        tracker._positions["0xyes1"] = Position(
+        tracker.add(Position(
             token_id="0xyes1",
             condition_id="cond1",
             side=Side.BUY,
             entry_price=Decimal("0.98"),
             size=Decimal("100"),
-        )
-        tracker._positions["0xyes2"] = Position(
+        ))
+        tracker.add(Position(
             token_id="0xyes2",
             condition_id="cond2",
             side=Side.BUY,
             entry_price=Decimal("0.50"),  # below threshold
             size=Decimal("200"),
-        )
-        tracker._positions["0xyes3"] = Position(
+        ))
+        tracker.add(Position(
             token_id="0xyes3",
             condition_id="cond3",
             side=Side.BUY,
             entry_price=Decimal("0.97"),
             size=Decimal("300"),
-        )
+        ))
         mon = _monitor(
             positions=tracker,
             oracle_risk_price_threshold=0.95,
@@ -877,6 +1410,91 @@ class TestPollOnceRiskAlerts:
         ]
         assert len(risk_alerts) == 0
 
+    @pytest.mark.asyncio
+    async def test_poll_skips_assessment_when_unchanged(self) -> None:
+        tracker = _tracker_with_position(
+            condition_id="cond1",
+            price=Decimal("0.99"),
+            size=Decimal("100"),
+        )
+        mon = _monitor(
+            positions=tracker,
+            oracle_risk_price_threshold=0.95,
+            hedge_risk_threshold=0.02,
+            alert_cooldown_secs=0,
+        )
+        alerts: list[OracleAlert] = []
+        mon.on_alert(lambda a: alerts.append(a))
+
+        await mon.poll_once()
+        await mon.poll_once()
+        assert len(alerts) == 1
+
+        # A fill bumps the tracker version → re-assessed
+        tracker.record_fill(_fill("cond9", token_id="0xother"))
+        await mon.poll_once()
+        assert len(alerts) == 2
+
+        # Proposal state change → re-assessed
+        await mon.ingest_dispute("cond1", "0xdisputer")
+        alerts.clear()
+        await mon.poll_once()
+        risk_alerts = [
+            a for a in alerts if a.event_type == OracleEventType.HIGH_ORACLE_RISK
+        ]
+        assert len(risk_alerts) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeat_high_risk_alert_suppressed(self) -> None:
+        tracker = _tracker_with_position(
+            condition_id="cond1",
+            price=Decimal("0.99"),
+            size=Decimal("100"),
+        )
+        mon = _monitor(
+            positions=tracker,
+            oracle_risk_price_threshold=0.95,
+            hedge_risk_threshold=0.02,
+        )
+        alerts: list[OracleAlert] = []
+        mon.on_alert(lambda a: alerts.append(a))
+
+        await mon.poll_once()
+        # Unrelated fill forces a re-assessment; same (cid, price) is muted
+        tracker.record_fill(_fill("cond9", token_id="0xother"))
+        await mon.poll_once()
+        assert len(alerts) == 1
+
+        # Price moved into a new cent bucket → alerts again
+        tracker.add(tracker.positions["0xyes"].model_copy(
+            update={"entry_price": Decimal("0.985")},
+        ))
+        await mon.poll_once()
+        assert len(alerts) == 2
+
+    @pytest.mark.asyncio
+    async def test_high_risk_alert_repeats_after_cooldown(self) -> None:
+        tracker = _tracker_with_position(
+            condition_id="cond1",
+            price=Decimal("0.99"),
+            size=Decimal("100"),
+        )
+        mon = _monitor(
+            positions=tracker,
+            oracle_risk_price_threshold=0.95,
+            hedge_risk_threshold=0.02,
+        )
+        alerts: list[OracleAlert] = []
+        mon.on_alert(lambda a: alerts.append(a))
+
+        await mon.poll_once()
+        for key in mon._risk_alert_expiry:
+            mon._risk_alert_expiry[key] = 0.0  # expire
+        tracker.record_fill(_fill("cond9", token_id="0xother"))
+        await mon.poll_once()
+        assert len(alerts) == 2
+        assert all(exp > 0 for exp in mon._risk_alert_expiry.values())
+
     @pytest.mark.asyncio
     async def test_poll_syncs_conditions_from_positions(self) -> None:
         """poll_once auto-syncs tracked conditions from positions."""
@@ -180,7 +180,7 @@ class TestDailyReset:
         assert pnl.realized_today == Decimal("20")
 
         # Simulate next day
-        pnl._day_start -= 86400
+        pnl._next_rollover -= 86400
         pnl.record_fill(_result(), None)
         assert pnl.realized_today == Decimal(0)
 
@@ -189,7 +189,7 @@ class TestDailyReset:
         pnl.record_fill(_result(), None)
         assert pnl.trade_count_today == 1
 
-        pnl._day_start -= 86400
+        pnl._next_rollover -= 86400
         pnl.record_fill(_result(), None)
         assert pnl.trade_count_today == 1  # reset then incremented
 
@@ -200,7 +200,7 @@ class TestDailyReset:
             _result(side=Side.SELL, price=Decimal("0.60"), size=Decimal("100")),
             pos,
         )
-        pnl._day_start -= 86400
+        pnl._next_rollover -= 86400
         pnl.record_fill(_result(), None)
         assert pnl.realized_total == Decimal("20")
 
@@ -209,6 +209,14 @@ class TestDailyReset:
         now = time.time()
         expected = now - (now % 86400)
         assert abs(pnl._day_start - expected) < 2
+        assert pnl._next_rollover == pnl._day_start + 86400
+
+    def test_no_reset_before_rollover(self) -> None:
+        pnl = PnLTracker()
+        pnl.record_fill(_result(), None)
+        pnl._next_rollover = time.time() + 60
+        pnl.record_fill(_result(), None)
+        assert pnl.trade_count_today == 2
 
 
 # ── Unrealized P&L ────────────────────────────────────────────
@@ -251,6 +259,20 @@ class TestUnrealizedPnL:
         pnl = PnLTracker()
         assert pnl.unrealized_pnl({}, {}) == Decimal(0)
 
+    def test_mixed_book_sparse_and_extra_prices(self) -> None:
+        pnl = PnLTracker()
+        positions = {
+            "0xa": _position(side=Side.BUY, entry_price=Decimal("0.40")),
+            "0xb": _position(side=Side.SELL, entry_price=Decimal("0.70")),
+            "0xc": _position(side=Side.BUY, entry_price=Decimal("0.50")),
+        }
+        # Fewer prices than positions: 0xc unpriced
+        prices = {"0xa": Decimal("0.60"), "0xb": Decimal("0.50")}
+        assert pnl.unrealized_pnl(positions, prices) == Decimal("40")
+        # More prices than positions: unheld tokens ignored
+        prices.update({"0xc": Decimal("0.45"), "0xd": Decimal("0.99")})
+        assert pnl.unrealized_pnl(positions, prices) == Decimal("35")
+
 
 # ── Reset ──────────────────────────────────────────────────────
 
@@ -6,6 +6,8 @@ import time
 from decimal import Decimal
 from typing import Any
 
+import pytest
+
 from src.core.types import (
     ExecutionResult,
     FeedEvent,
@@ -15,6 +17,7 @@ from src.core.types import (
     MarketOpportunity,
     MatchResult,
     OutcomeType,
+    Position,
     Side,
     Signal,
     SignalDirection,
@@ -119,6 +122,14 @@ class TestOpenPosition:
         tracker = PositionTracker()
         assert tracker.count == 0
 
+    def test_is_empty(self) -> None:
+        tracker = PositionTracker()
+        assert tracker.is_empty is True
+        tracker.record_fill(_result())
+        assert tracker.is_empty is False
+        tracker.record_fill(_result(side=Side.SELL))
+        assert tracker.is_empty is True
+
 
 # ── Average In ─────────────────────────────────────────────────
 
@@ -208,11 +219,85 @@ class TestExposure:
         tracker = PositionTracker()
         assert tracker.total_exposure_usd() == Decimal(0)
 
+    def test_total_exposure_tracks_every_fill_kind(self) -> None:
+        tracker = PositionTracker()
+
+        def recomputed() -> Decimal:
+            return sum(
+                (p.entry_price * p.size for p in tracker.positions.values()),
+                Decimal(0),
+            )
+
+        tracker.record_fill(_result(token_id="0xa", price=Decimal("0.40")))
+        tracker.record_fill(_result(token_id="0xb", price=Decimal("0.30")))
+        tracker.record_fill(
+            _result(token_id="0xa", price=Decimal("0.70"), size=Decimal("50")),
+        )
+        assert tracker.total_exposure_usd() == recomputed()
+        tracker.record_fill(
+            _result(token_id="0xa", side=Side.SELL, size=Decimal("30")),
+        )
+        assert tracker.total_exposure_usd() == recomputed()
+        tracker.record_fill(
+            _result(token_id="0xb", side=Side.SELL, size=Decimal("100")),
+        )
+        assert tracker.total_exposure_usd() == recomputed()
+        tracker.record_fill(
+            _result(token_id="0xa", side=Side.SELL, size=Decimal("500")),
+        )
+        assert tracker.total_exposure_usd() == Decimal(0)
+        tracker.record_fill(_result())
+        tracker.clear()
+        assert tracker.total_exposure_usd() == Decimal(0)
+
+    def test_condition_exposure_after_reduce_and_close(self) -> None:
+        tracker = PositionTracker()
+        tracker.record_fill(_result(token_id="0xa", condition_id="c1"))
+        tracker.record_fill(_result(token_id="0xb", condition_id="c1"))
+        tracker.record_fill(
+            _result(token_id="0xa", side=Side.SELL, size=Decimal("60"), condition_id="c1"),
+        )
+        # 0.50 * 40 + 0.50 * 100
+        assert tracker.exposure_for_condition("c1") == Decimal("70")
+        tracker.record_fill(
+            _result(token_id="0xb", side=Side.SELL, size=Decimal("100"), condition_id="c1"),
+        )
+        assert tracker.exposure_for_condition("c1") == Decimal("20")
+
     def test_ignores_other_conditions(self) -> None:
         tracker = PositionTracker()
         tracker.record_fill(_result(condition_id="c2"))
         assert tracker.exposure_for_condition("c1") == Decimal(0)
 
+    def test_positions_for_conditions(self) -> None:
+        tracker = PositionTracker()
+        tracker.record_fill(_result(token_id="0xa", condition_id="c1"))
+        tracker.record_fill(_result(token_id="0xb", condition_id="c2"))
+        tracker.record_fill(_result(token_id="0xc", condition_id="c3"))
+        found = tracker.positions_for_conditions({"c1", "c3"})
+        assert sorted(p.token_id for p in found) == ["0xa", "0xc"]
+        assert tracker.positions_for_conditions(set()) == []
+
+    def test_condition_index_follows_open_and_close(self) -> None:
+        tracker = PositionTracker()
+        tracker.record_fill(_result(token_id="0xa", condition_id="c1"))
+        tracker.record_fill(_result(token_id="0xb", condition_id="c1"))
+        # Partial reduce keeps the position indexed
+        tracker.record_fill(
+            _result(token_id="0xa", side=Side.SELL, size=Decimal("40"), condition_id="c1"),
+        )
+        assert {p.token_id for p in tracker.positions_for_condition("c1")} == {
+            "0xa", "0xb",
+        }
+        # Close drops it
+        tracker.record_fill(
+            _result(token_id="0xb", side=Side.SELL, size=Decimal("100"), condition_id="c1"),
+        )
+        assert [p.token_id for p in tracker.positions_for_condition("c1")] == ["0xa"]
+        tracker.clear()
+        assert tracker.positions_for_condition("c1") == []
+        assert tracker._by_condition == {}
+
 
 # ── Lookup / Clear ─────────────────────────────────────────────
 
@@ -233,9 +318,53 @@ class TestLookupClear:
         tracker.clear()
         assert tracker.count == 0
 
-    def test_positions_copy(self) -> None:
+    def test_snapshot_copy(self) -> None:
         tracker = PositionTracker()
         tracker.record_fill(_result())
-        copy = tracker.positions
+        copy = tracker.snapshot()
         copy.clear()
         assert tracker.count == 1  # original unaffected
+
+    def test_positions_view_is_read_only_and_live(self) -> None:
+        tracker = PositionTracker()
+        view = tracker.positions
+        with pytest.raises(TypeError):
+            view["0xyes"] = None  # type: ignore[index]
+        tracker.record_fill(_result())
+        assert "0xyes" in view
+        tracker.clear()
+        assert len(view) == 0
+
+    def test_version_bumps_on_mutation(self) -> None:
+        tracker = PositionTracker()
+        v0 = tracker.version
+        tracker.record_fill(_result())
+        assert tracker.version > v0
+        v1 = tracker.version
+        tracker.clear()
+        assert tracker.version > v1
+
+    def test_add_updates_index_and_total(self) -> None:
+        tracker = PositionTracker()
+        v0 = tracker.version
+        tracker.add(Position(
+            token_id="0xa", condition_id="c1", side=Side.BUY,
+            entry_price=Decimal("0.50"), size=Decimal("200"),
+        ))
+        assert tracker.version > v0
+        assert tracker.total_exposure_usd() == Decimal("100")
+        assert tracker.exposure_for_condition("c1") == Decimal("100")
+
+        # Replacing the token moves it to the new condition
+        tracker.add(Position(
+            token_id="0xa", condition_id="c2", side=Side.BUY,
+            entry_price=Decimal("0.40"), size=Decimal("100"),
+        ))
+        assert tracker.count == 1
+        assert tracker.total_exposure_usd() == Decimal("40")
+        assert tracker.positions_for_condition("c1") == []
+        assert tracker.exposure_for_condition("c2") == Decimal("40")
+
+        tracker.record_fill(_result(token_id="0xa", side=Side.SELL, condition_id="c2"))
+        assert tracker.is_empty
+        assert tracker.total_exposure_usd() == Decimal(0)
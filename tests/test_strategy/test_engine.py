@@ -5,7 +5,7 @@ from __future__ import annotations
 import time
 from decimal import Decimal
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -182,6 +182,7 @@ class TestOnFeedEvent:
 
         event = _event(event_type=FeedEventType.FEED_CONNECTED)
         await engine.on_feed_event(event)
+        await engine.join()
         assert engine.stats["signals_generated"] == 0
 
     @pytest.mark.asyncio
@@ -190,6 +191,7 @@ class TestOnFeedEvent:
         # Don't start
         event = _event()
         await engine.on_feed_event(event)
+        await engine.join()
         assert engine.stats["signals_generated"] == 0
 
     @pytest.mark.asyncio
@@ -201,6 +203,7 @@ class TestOnFeedEvent:
 
         event = _event()
         await engine.on_feed_event(event)
+        await engine.join()
         # Should have generated a signal and attempted execution
         stats = engine.stats
         assert stats["signals_generated"] >= 1
@@ -213,6 +216,7 @@ class TestOnFeedEvent:
 
         event = _event()
         await engine.on_feed_event(event)
+        await engine.join()
         assert engine.stats["signals_generated"] == 0
 
     @pytest.mark.asyncio
@@ -229,6 +233,7 @@ class TestOnFeedEvent:
 
         event = _event()
         await engine.on_feed_event(event)
+        await engine.join()
         assert engine.stats["trades_skipped"] >= 1
 
     @pytest.mark.asyncio
@@ -241,11 +246,70 @@ class TestOnFeedEvent:
         await engine.start()
 
         await engine.on_feed_event(_event())
+        await engine.join()
         await engine.on_feed_event(_event())
+        await engine.join()
         stats = engine.stats
         assert stats["signals_generated"] >= 2
 
 
+# ── Queue worker ───────────────────────────────────────────────
+
+
+class TestQueueWorker:
+    @pytest.mark.asyncio
+    async def test_on_feed_event_does_not_wait_for_processing(self) -> None:
+        opps = {"cond1": _opp()}
+        engine = _make_engine(opportunities=opps)
+        await engine.start()
+
+        await engine.on_feed_event(_event())
+        assert engine.stats["signals_generated"] == 0
+        await engine.join()
+        assert engine.stats["signals_generated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_processes_condition_once(self) -> None:
+        """Two queued events matching one condition → a single signal."""
+        opps = {"cond1": _opp()}
+        cfg = _cfg()
+        cfg.prioritizer = PrioritizerConfig(cooldown_secs=0.0)
+        engine = _make_engine(opportunities=opps, config=cfg)
+        await engine.start()
+
+        await engine.on_feed_event(_event(numeric_value=Decimal("3.4")))
+        await engine.on_feed_event(_event(numeric_value=Decimal("3.5")))
+        await engine.join()
+        assert engine.stats["signals_generated"] == 1
+        assert engine._client.place_market_order.await_count == 1  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queue(self) -> None:
+        opps = {"cond1": _opp()}
+        engine = _make_engine(opportunities=opps)
+        await engine.start()
+
+        await engine.on_feed_event(_event())
+        await engine.stop()
+        assert engine.stats["signals_generated"] == 1
+        assert engine._worker is None
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_batch_error(self) -> None:
+        opps = {"cond1": _opp()}
+        engine = _make_engine(opportunities=opps)
+        await engine.start()
+
+        with patch.object(
+            engine, "_process_batch", AsyncMock(side_effect=RuntimeError("boom")),
+        ):
+            await engine.on_feed_event(_event())
+            await engine.join()
+        await engine.on_feed_event(_event())
+        await engine.join()
+        assert engine.stats["signals_generated"] == 1
+
+
 # ── Execution ──────────────────────────────────────────────────
 
 
@@ -314,6 +378,24 @@ class TestExecution:
         await engine.process_event(_event())
         assert any(e.event_type == ArbEventType.TRADE_EXECUTED for e in events)
 
+    @pytest.mark.asyncio
+    async def test_match_events_share_one_timestamp(self) -> None:
+        opps = {"cond1": _opp()}
+        engine = _make_engine(opportunities=opps)
+        events: list[ArbEvent] = []
+        await engine.start()
+        engine.on_event(lambda e: events.append(e))
+
+        results = await engine.process_event(_event())
+        signal_ev = next(
+            e for e in events if e.event_type == ArbEventType.SIGNAL_GENERATED
+        )
+        trade_ev = next(
+            e for e in events if e.event_type == ArbEventType.TRADE_EXECUTED
+        )
+        assert signal_ev.timestamp == trade_ev.timestamp
+        assert results[0].executed_at == trade_ev.timestamp
+
 
 # ── process_event ──────────────────────────────────────────────
 
@@ -422,6 +504,30 @@ class TestProcessEvent:
 
 
 class TestCallbacks:
+    @pytest.mark.asyncio
+    async def test_callback_filtered_by_event_type(self) -> None:
+        opps = {"c1": _opp()}
+        engine = _make_engine(opportunities=opps)
+        events: list[ArbEvent] = []
+        engine.on_event(
+            lambda e: events.append(e),
+            event_types={ArbEventType.TRADE_EXECUTED},
+        )
+        await engine.start()
+        await engine.process_event(_event())
+        assert [e.event_type for e in events] == [ArbEventType.TRADE_EXECUTED]
+
+    @pytest.mark.asyncio
+    async def test_no_subscribers_skips_event_construction(self) -> None:
+        opps = {"c1": _opp()}
+        engine = _make_engine(opportunities=opps)
+        with patch("src.strategy.engine.ArbEvent") as event_cls:
+            await engine.start()
+            results = await engine.process_event(_event())
+        event_cls.assert_not_called()
+        assert results[0].success is True
+        assert engine.stats["trades_executed"] == 1
+
     @pytest.mark.asyncio
     async def test_receives_events(self) -> None:
         opps = {"c1": _opp()}
@@ -460,6 +566,25 @@ class TestCallbacks:
         results = await engine.process_event(_event())
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_mixed_callbacks_and_async_failure_isolated(self) -> None:
+        engine = _make_engine()
+        seen: list[str] = []
+
+        async def bad_async(e: ArbEvent) -> None:
+            raise RuntimeError("async boom")
+
+        async def good_async(e: ArbEvent) -> None:
+            seen.append("async")
+
+        engine.on_event(bad_async)
+        engine.on_event(good_async)
+        engine.on_event(lambda e: seen.append("sync"))
+
+        await engine.start()
+        # Sync callbacks run before async ones
+        assert seen == ["sync", "async"]
+
 
 # ── Risk Integration ──────────────────────────────────────────
 
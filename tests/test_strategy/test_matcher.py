@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 from typing import Any
+from unittest.mock import patch
 
 from src.core.types import (
     FeedEvent,
@@ -18,6 +19,7 @@ from src.strategy.matcher import (
     _extract_threshold_from_question,
     _find_token_for_outcome,
     _normalize_team_name,
+    _team_in_lowered,
     _team_in_question,
 )
 
@@ -163,6 +165,38 @@ class TestExtractThreshold:
         assert result is not None
         assert result[0] == Decimal("100000")
 
+    def test_too_many_decimals(self) -> None:
+        assert _extract_threshold_from_question("Will CPI exceed 3.1234567%?") is None
+
+    def test_too_many_digits(self) -> None:
+        assert _extract_threshold_from_question(
+            "Will BTC go above $1234567890123456?"
+        ) is None
+
+    def test_short_comma_group(self) -> None:
+        assert _extract_threshold_from_question("Will BTC go above 50,00?") is None
+
+    def test_long_comma_group(self) -> None:
+        assert _extract_threshold_from_question("Will BTC go above 1,2345?") is None
+
+    def test_trailing_comma(self) -> None:
+        result = _extract_threshold_from_question(
+            "Will BTC close above $100,000, per Binance?"
+        )
+        assert result is not None
+        assert result[0] == Decimal("100000")
+
+    def test_trailing_period(self) -> None:
+        result = _extract_threshold_from_question("Will ETH be over 4,000.")
+        assert result is not None
+        assert result[0] == Decimal("4000")
+
+    def test_decimal_then_trailing_comma(self) -> None:
+        result = _extract_threshold_from_question("Will CPI be below 4.5, or higher?")
+        assert result is not None
+        assert result[0] == Decimal("4.5")
+        assert result[1] == "below"
+
     def test_no_threshold(self) -> None:
         result = _extract_threshold_from_question("Who will win the election?")
         assert result is None
@@ -174,6 +208,26 @@ class TestExtractThreshold:
         assert result is not None
         assert result[0] == Decimal("3.25")
 
+    def test_direction_word_must_stand_alone(self) -> None:
+        result = _extract_threshold_from_question(
+            "Moreover 5 analysts: will CPI be above 3.1%?"
+        )
+        assert result == (Decimal("3.1"), "above")
+
+    def test_exceeds(self) -> None:
+        result = _extract_threshold_from_question("Will BTC exceeds $1,250,000.50?")
+        assert result == (Decimal("1250000.50"), "above")
+
+    def test_long_question_without_number(self) -> None:
+        assert _extract_threshold_from_question("over " * 5000) is None
+
+    def test_repeated_question_is_memoized(self) -> None:
+        question = "Will the 10y yield be above 4.75%?"
+        first = _extract_threshold_from_question(question)
+        hits = _extract_threshold_from_question.cache_info().hits
+        assert _extract_threshold_from_question(question) is first
+        assert _extract_threshold_from_question.cache_info().hits == hits + 1
+
 
 # ── _normalize_team_name ────────────────────────────────────────
 
@@ -205,6 +259,12 @@ class TestTeamInQuestion:
     def test_no_match(self) -> None:
         assert not _team_in_question("Warriors", "Will the Lakers win?")
 
+    def test_nickname_from_full_name(self) -> None:
+        assert _team_in_lowered("denver nuggets", "nuggets vs clippers?")
+
+    def test_empty_name_never_matches(self) -> None:
+        assert not _team_in_lowered("", "will the lakers win?")
+
 
 # ── _find_token_for_outcome ────────────────────────────────────
 
@@ -361,7 +421,36 @@ class TestMatcherSports:
 # ── MarketMatcher: Crypto ──────────────────────────────────────
 
 
+    def test_no_teams_returns_before_scan(self) -> None:
+        """Without home/away teams no candidate markets are examined."""
+        matcher = MarketMatcher()
+        opps = {
+            "s1": _opp(
+                condition_id="s1",
+                question="Will the Lakers win?",
+                category=MarketCategory.SPORTS,
+                tokens=_team_tokens(),
+            ),
+        }
+        event = _sports_event(home_team="", away_team="")
+        with patch.object(matcher, "_candidates") as candidates:
+            assert matcher.match(event, opps) == []
+        candidates.assert_not_called()
+
+
 class TestMatcherCrypto:
+    def test_no_numeric_value_skipped(self) -> None:
+        """Crypto events without numeric_value match nothing."""
+        matcher = MarketMatcher()
+        event = _crypto_event().model_copy(update={"numeric_value": None})
+        opps = {
+            "c1": _opp(
+                question="Will BTC go above $50,000?",
+                category=MarketCategory.CRYPTO,
+            ),
+        }
+        assert matcher.match(event, opps) == []
+
     def test_btc_above_threshold(self) -> None:
         """BTC at 55000 vs 'above $50,000' → Yes."""
         matcher = MarketMatcher()
@@ -408,3 +497,172 @@ class TestMatcherCrypto:
         results = matcher.match(event, opps)
         assert len(results) == 1
         assert results[0].target_outcome == "No"
+
+
+# ── Confidence threshold ───────────────────────────────────────
+
+
+class TestConfidenceThreshold:
+    def test_category_below_threshold_skipped(self) -> None:
+        """Crypto matches (0.90) are dropped by a 0.92 threshold."""
+        matcher = MarketMatcher(match_confidence_threshold=0.92)
+        opps = {
+            "c1": _opp(
+                question="Will BTC go above $50,000?",
+                category=MarketCategory.CRYPTO,
+            ),
+        }
+        with patch.object(matcher, "_candidates") as candidates:
+            assert matcher.match(_crypto_event(), opps) == []
+        candidates.assert_not_called()
+
+    def test_category_at_threshold_kept(self) -> None:
+        """Economic matches (0.95) pass a 0.92 threshold."""
+        matcher = MarketMatcher(match_confidence_threshold=0.92)
+        results = matcher.match(_economic_event(), {"c1": _opp()})
+        assert [r.match_confidence for r in results] == [0.95]
+
+
+# ── Question cache ─────────────────────────────────────────────
+
+
+class TestQuestionCache:
+    def test_threshold_parsed_once_per_opportunity(self) -> None:
+        matcher = MarketMatcher()
+        opps = {"c1": _opp()}
+        with patch(
+            "src.strategy.matcher._extract_threshold_from_question",
+            wraps=_extract_threshold_from_question,
+        ) as extract:
+            matcher.match(_economic_event(), opps)
+            matcher.match(_economic_event(numeric_value=Decimal("2.0")), opps)
+        assert extract.call_count == 1
+
+    def test_changed_question_is_reparsed(self) -> None:
+        matcher = MarketMatcher()
+        event = _economic_event(numeric_value=Decimal("3.5"))
+        assert matcher.match(event, {"c1": _opp()})[0].target_outcome == "Yes"
+        opps = {"c1": _opp(question="Will CPI be above 4.0%?")}
+        assert matcher.match(event, opps)[0].target_outcome == "No"
+
+    def test_evicts_departed_opportunities(self) -> None:
+        matcher = MarketMatcher()
+        many = {f"c{i}": _opp(condition_id=f"c{i}") for i in range(40)}
+        matcher.match(_economic_event(), many)
+        assert len(matcher._questions) == 40
+        matcher.match(_economic_event(), {"c1": many["c1"]})
+        assert set(matcher._questions) == {"c1"}
+
+
+# ── Outcome table ──────────────────────────────────────────────
+
+
+class TestOutcomeTable:
+    def test_exact_outcome_skips_scan(self) -> None:
+        matcher = MarketMatcher()
+        opps = {"c1": _opp()}
+        with patch(
+            "src.strategy.matcher._find_token_for_outcome",
+            wraps=_find_token_for_outcome,
+        ) as scan:
+            results = matcher.match(_economic_event(), opps)
+            matcher.match(_economic_event(numeric_value=Decimal("2.0")), opps)
+        assert results[0].target_token_id == "0xyes"
+        assert scan.call_count == 0
+
+    def test_partial_outcome_falls_back_to_scan(self) -> None:
+        matcher = MarketMatcher()
+        opp = _opp(
+            condition_id="s1",
+            question="Will the Lakers beat the Celtics?",
+            category=MarketCategory.SPORTS,
+            tokens=_team_tokens(),
+        )
+        results = matcher.match(
+            _sports_event(winner="Los Angeles Lakers"), {"s1": opp},
+        )
+        assert results[0].target_token_id == "0xlakers"
+
+    def test_replaced_tokens_rebuild_table(self) -> None:
+        matcher = MarketMatcher()
+        matcher.match(_economic_event(), {"c1": _opp()})
+        opps = {"c1": _opp(tokens=_tokens(yes_id="0xnew"))}
+        assert matcher.match(_economic_event(), opps)[0].target_token_id == "0xnew"
+
+
+# ── Category index ─────────────────────────────────────────────
+
+
+class TestCategoryIndex:
+    def test_only_walks_matching_category(self) -> None:
+        matcher = MarketMatcher()
+        opps = {
+            "e1": _opp(condition_id="e1"),
+            "s1": _opp(
+                condition_id="s1",
+                question="Will the Lakers beat the Celtics?",
+                category=MarketCategory.SPORTS,
+                tokens=_team_tokens(),
+            ),
+        }
+        matcher.match(_economic_event(), opps)
+        assert matcher._by_category[MarketCategory.ECONOMIC] == ["e1"]
+        assert matcher._by_category[MarketCategory.SPORTS] == ["s1"]
+        results = matcher.match(_sports_event(), opps)
+        assert [r.opportunity.condition_id for r in results] == ["s1"]
+
+    def test_rebuilt_for_new_mapping(self) -> None:
+        matcher = MarketMatcher()
+        matcher.match(_economic_event(), {"c1": _opp()})
+        results = matcher.match(
+            _economic_event(), {"c2": _opp(condition_id="c2")},
+        )
+        assert [r.opportunity.condition_id for r in results] == ["c2"]
+
+    def test_reads_live_values_from_same_mapping(self) -> None:
+        matcher = MarketMatcher()
+        opps = {"c1": _opp()}
+        matcher.match(_economic_event(), opps)
+        replacement = _opp(best_ask=Decimal("0.10"))
+        opps["c1"] = replacement
+        assert matcher.match(_economic_event(), opps)[0].opportunity is replacement
+
+    def test_update_index_after_in_place_change(self) -> None:
+        matcher = MarketMatcher()
+        opps = {"c1": _opp()}
+        matcher.match(_economic_event(), opps)
+        del opps["c1"]
+        opps["c2"] = _opp(condition_id="c2")
+        matcher.update_index(opps)
+        results = matcher.match(_economic_event(), opps)
+        assert [r.opportunity.condition_id for r in results] == ["c2"]
+
+    def test_same_markets_in_fresh_snapshot_keep_index(self) -> None:
+        matcher = MarketMatcher()
+        opps = {"c1": _opp()}
+        matcher.match(_economic_event(), opps)
+        by_category = matcher._by_category
+        matcher.match(_economic_event(), dict(opps))
+        assert matcher._by_category is by_category
+
+    def test_repeat_indicator_skips_category_walk(self) -> None:
+        matcher = MarketMatcher()
+        opps = {
+            "c1": _opp(condition_id="c1"),
+            "c2": _opp(condition_id="c2", question="Will GDP grow above 2%?"),
+        }
+        matcher.match(_economic_event(), opps)
+        assert matcher._hits[(MarketCategory.ECONOMIC, "cpi")] == ["c1"]
+        with patch.object(matcher, "_question_info", wraps=matcher._question_info) as qi:
+            results = matcher.match(_economic_event(), dict(opps))
+        # Only the remembered hit is looked at, for its threshold
+        assert qi.call_count == 1
+        assert [r.opportunity.condition_id for r in results] == ["c1"]
+
+    def test_new_market_invalidates_hits(self) -> None:
+        matcher = MarketMatcher()
+        opps = {"c1": _opp(condition_id="c1")}
+        matcher.match(_economic_event(), opps)
+        grown = {**opps, "c2": _opp(condition_id="c2", question="Will CPI be above 2%?")}
+        results = matcher.match(_economic_event(), grown)
+        assert sorted(r.opportunity.condition_id for r in results) == ["c1", "c2"]
@@ -304,6 +304,37 @@ class TestPrioritize:
         ids_2 = [pm.match.opportunity.condition_id for pm in r2]
         assert ids_1 == ids_2
 
+    def test_cap_keeps_top_scores_in_order(self) -> None:
+        """Capping picks the highest scores, best first."""
+        p = OpportunityPrioritizer(_cfg(max_trades_per_event=2))
+        matches = [
+            _match(condition_id=f"c{i}", score=score)
+            for i, score in enumerate([0.2, 0.9, 0.5, 0.7, 0.1])
+        ]
+        result = p.prioritize(matches)
+        assert [pm.match.opportunity.condition_id for pm in result] == ["c1", "c3"]
+
+    def test_category_weight_from_config(self) -> None:
+        """Each match is scored with its category's configured weight."""
+        config = _cfg(category_weights={"CRYPTO": 0.6})
+        p = OpportunityPrioritizer(config)
+        result = p.prioritize([
+            _match(condition_id="c", category=MarketCategory.CRYPTO),
+            _match(condition_id="s", category=MarketCategory.SPORTS),
+        ])
+        weights = {
+            pm.match.opportunity.condition_id: pm.score_components["category"]
+            for pm in result
+        }
+        assert weights == {"c": 0.6, "s": 0.3}
+
+    def test_ties_keep_input_order(self) -> None:
+        """Equal scores are ranked in the order they arrived."""
+        p = OpportunityPrioritizer(_cfg(max_trades_per_event=3))
+        matches = [_match(condition_id=f"c{i}") for i in range(5)]
+        result = p.prioritize(matches)
+        assert [pm.match.opportunity.condition_id for pm in result] == ["c0", "c1", "c2"]
+
 
 # ── TestCooldown ────────────────────────────────────────────────
 
@@ -365,3 +396,31 @@ class TestCooldown:
         p.prioritize([_match(condition_id="cond3")])
         assert "cond1" not in p.cooldowns
         assert "cond2" not in p.cooldowns
+
+    def test_rerecord_extends_cooldown(self) -> None:
+        """A stale heap entry from an earlier record does not expire a renewal."""
+        p = OpportunityPrioritizer(_cfg(cooldown_secs=300.0))
+        p._cooldowns["cond1"] = 0.0
+        p._cooldown_heap.append((0.0, "cond1"))
+        p.record_trade("cond1")
+        assert p.prioritize([_match(condition_id="cond1")]) == []
+        assert "cond1" in p.cooldowns
+
+    def test_unexpired_entries_untouched(self) -> None:
+        """Cleanup stops at the first unexpired cooldown."""
+        p = OpportunityPrioritizer(_cfg(cooldown_secs=300.0))
+        p.record_trade("cond1")
+        p.prioritize([_match(condition_id="cond2")])
+        assert list(p.cooldowns) == ["cond1"]
+        assert len(p._cooldown_heap) == 1
+
+    def test_cleared_then_rerecorded(self) -> None:
+        """clear_cooldown followed by record_trade leaves one live cooldown."""
+        p = OpportunityPrioritizer(_cfg(cooldown_secs=0.0))
+        p.record_trade("cond1")
+        p.clear_cooldown("cond1")
+        p.record_trade("cond1")
+        result = p.prioritize([_match(condition_id="cond1")])
+        assert len(result) == 1
+        assert p.cooldowns == {}
+        assert p._cooldown_heap == []